@@ -1,10 +1,14 @@
+from .executor import ToolExecutor
 from .function_calling import FunctionCalling
 from .tool import Tool
+from .scheduler import ActionScheduler
 from .tool_manager import ToolManager, func_to_tool
 from .node import ActionNode, DirectiveSelection
 
 
 __all__ = [
+    "ToolExecutor",
+    "ActionScheduler",
     "FunctionCalling",
     "Tool",
     "ToolManager",
@@ -0,0 +1,171 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+This module contains the ToolExecutor class, which runs tool functions
+according to their execution policy: inline on the event loop, in a thread
+pool, or in a process pool, with optional timeouts and concurrency caps.
+"""
+
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from lionagi.libs.ln_func_call import is_coroutine_func
+
+
+EXECUTION_MODES = ("inline", "thread", "process")
+
+
+class ToolExecutor:
+    """
+    Runs functions inline, in a thread pool or in a process pool.
+
+    The pools are created on first use and shared by every tool run through
+    the executor, so a session holds one thread pool and one process pool
+    however many branches and tools it has.
+
+    Coroutine functions always run on the event loop; the execution mode
+    only applies to synchronous functions. A synchronous function run inline
+    blocks the loop, so one given a timeout runs in the thread pool instead.
+    Functions run in the process pool, and their arguments and results, must
+    be picklable.
+
+    Attributes:
+        max_threads (int | None): Size of the thread pool.
+        max_processes (int | None): Size of the process pool.
+    """
+
+    def __init__(self, max_threads: int = None, max_processes: int = None):
+        """
+        Initializes a new instance of ToolExecutor.
+
+        Args:
+            max_threads (int, optional): Size of the thread pool. Defaults to
+                the `ThreadPoolExecutor` default.
+            max_processes (int, optional): Size of the process pool. Defaults
+                to the number of CPUs.
+        """
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._semaphores = WeakKeyDictionary()
+
+    def _get_pool(self, mode: str) -> Executor:
+        with self._pool_lock:
+            if mode == "thread":
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        self.max_threads, thread_name_prefix="lionagi-tool"
+                    )
+                return self._thread_pool
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.max_processes)
+            return self._process_pool
+
+    def _get_semaphore(self, key: str, limit: int) -> asyncio.Semaphore:
+        # semaphores are bound to the loop they are used in
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        if key not in semaphores or semaphores[key][0] != limit:
+            semaphores[key] = (limit, asyncio.Semaphore(limit))
+        return semaphores[key][1]
+
+    async def run(
+        self,
+        func: Callable,
+        args: tuple = (),
+        kwargs: dict = None,
+        *,
+        mode: str = "inline",
+        timeout: float = None,
+        max_concurrency: int = None,
+        key: str = None,
+    ) -> Any:
+        """
+        Runs a function according to an execution policy.
+
+        Args:
+            func (Callable): The function to run.
+            args (tuple): Positional arguments for the function.
+            kwargs (dict, optional): Keyword arguments for the function.
+            mode (str): "inline", "thread" or "process". Defaults to "inline".
+            timeout (float, optional): Seconds after which the call is
+                abandoned. A synchronous function in "inline" mode then runs
+                in the thread pool, since it would block the loop before the
+                timeout could fire. Threads and processes cannot be
+                interrupted, so a timed out call keeps its pool worker busy
+                until the function returns; call `shutdown(wait=False)` to
+                recycle the pools.
+            max_concurrency (int, optional): The maximum number of calls
+                sharing `key` that run at once.
+            key (str, optional): The key concurrency is capped by. Defaults
+                to the function name.
+
+        Returns:
+            Any: The result of the function.
+
+        Raises:
+            ValueError: If the mode is invalid.
+            asyncio.TimeoutError: If the call exceeds the timeout.
+        """
+        if mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution mode {mode}. Expected one of {EXECUTION_MODES}"
+            )
+
+        if mode == "inline" and timeout is not None and not is_coroutine_func(func):
+            mode = "thread"
+
+        limit = contextlib.nullcontext()
+        if max_concurrency:
+            key = key or getattr(func, "__name__", repr(func))
+            limit = self._get_semaphore(key, max_concurrency)
+
+        async with limit:
+            return await asyncio.wait_for(
+                self._call(func, mode, args, kwargs or {}), timeout
+            )
+
+    async def _call(self, func: Callable, mode: str, args, kwargs) -> Any:
+        if is_coroutine_func(func):
+            return await func(*args, **kwargs)
+        if mode == "inline":
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(mode), partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the pools. They are created again if the executor is used.
+
+        Args:
+            wait (bool): Whether to wait for running calls to finish.
+        """
+        with self._pool_lock:
+            pools = (self._thread_pool, self._process_pool)
+            self._thread_pool = self._process_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait)
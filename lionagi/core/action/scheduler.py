@@ -0,0 +1,222 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+This module contains the ActionScheduler class, which runs the action
+requests of a model response concurrently and hands back each result as
+soon as its call finishes.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator
+from weakref import WeakKeyDictionary
+
+from lionagi.core.collections.abc import ActionError
+
+from .executor import ToolExecutor
+from .tool import Tool
+
+
+class ActionScheduler:
+    """
+    Runs a batch of action requests with a concurrency cap, per-call timeouts
+    and retries.
+
+    Calls start in the order they were requested, at most `max_concurrency`
+    at a time across the batches run by the scheduler, and their results are
+    yielded in the order they finish. A request listing earlier requests of
+    the batch in `depends_on` starts once their calls have succeeded, and
+    fails with an `ActionError`, without being called, if one of them fails.
+
+    Attributes:
+        max_concurrency (int | None): The maximum number of calls running at
+            once, unbounded if None.
+        timeout (float | None): Seconds after which an attempt is abandoned,
+            on top of the tool's own timeout.
+        retries (int): The number of times a failed call is retried.
+        retry_delay (float): Seconds before the first retry, doubled at each
+            further retry.
+        cancel_on_failure (bool): Whether the calls still running are
+            cancelled once a call fails for good.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        timeout: float = None,
+        retries: int = 0,
+        retry_delay: float = 0,
+        cancel_on_failure: bool = False,
+    ):
+        """
+        Initializes a new instance of ActionScheduler.
+
+        Args:
+            max_concurrency (int, optional): The maximum number of calls
+                running at once. Defaults to no cap.
+            timeout (float, optional): Seconds after which an attempt is
+                abandoned. Defaults to no timeout.
+            retries (int): The number of times a failed call is retried.
+            retry_delay (float): Seconds before the first retry.
+            cancel_on_failure (bool): Whether to cancel the calls still
+                running once a call fails for good.
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.cancel_on_failure = cancel_on_failure
+        self._semaphores = WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        if not self.max_concurrency:
+            return None
+        # semaphores are bound to the loop they are used in
+        loop = asyncio.get_running_loop()
+        limit, semaphore = self._semaphores.get(loop, (None, None))
+        if limit != self.max_concurrency:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = (self.max_concurrency, semaphore)
+        return semaphore
+
+    async def _call(
+        self,
+        tool: Tool,
+        arguments: dict,
+        executor: ToolExecutor,
+        semaphore,
+        policy: dict,
+        after: list[asyncio.Task] = None,
+    ) -> tuple[Any, Exception | None]:
+        if after:
+            # waiting does not hold a slot, nor cancel the calls waited for
+            await asyncio.wait(after)
+            for dependency in after:
+                if dependency.cancelled() or dependency.result()[1] is not None:
+                    return None, ActionError(
+                        "A call the request depends on did not succeed."
+                    )
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                if semaphore is None:
+                    return await self._attempt(tool, arguments, executor, policy), None
+                async with semaphore:
+                    return await self._attempt(tool, arguments, executor, policy), None
+            except Exception as e:
+                error = e
+        return None, error
+
+    async def _attempt(
+        self, tool: Tool, arguments: dict, executor: ToolExecutor, policy: dict
+    ):
+        return await asyncio.wait_for(
+            tool.invoke(arguments, executor=executor, raise_error=True, **policy),
+            self.timeout,
+        )
+
+    async def run(
+        self,
+        requests: list,
+        registry: dict[str, Tool],
+        executor: ToolExecutor = None,
+        policies: dict[str, dict] = None,
+    ) -> AsyncIterator[tuple[Any, Any, BaseException | None]]:
+        """
+        Runs action requests and yields their results as they finish.
+
+        Args:
+            requests (list): The action requests, with `function` and
+                `arguments` attributes, and optionally `depends_on`, the
+                `ln_id` of the earlier requests whose calls must finish
+                first.
+            registry (dict[str, Tool]): The tools by name.
+            executor (ToolExecutor, optional): The executor the tools run in.
+            policies (dict[str, dict], optional): The execution policy of
+                each tool by name, passed to `Tool.invoke`.
+
+        Yields:
+            tuple: The request, the result of its call, and the exception
+                that made it fail, or None if it succeeded. Calls cancelled
+                because of another failure are yielded last, with an
+                `asyncio.CancelledError`, so that every request is answered.
+
+        Raises:
+            ValueError: If a request names a tool missing from the registry,
+                or depends on a request that is not earlier in the batch.
+        """
+        earlier = set()
+        for request in requests:
+            if request.function not in registry:
+                raise ValueError(f"Function {request.function} is not registered.")
+            for ln_id in getattr(request, "depends_on", None) or ():
+                if ln_id not in earlier:
+                    raise ValueError(
+                        f"Request {ln_id} is not an earlier request of the batch."
+                    )
+            earlier.add(getattr(request, "ln_id", None))
+
+        policies = policies or {}
+        semaphore = self._get_semaphore()
+        tasks, by_id = {}, {}
+        for request in requests:
+            task = asyncio.create_task(
+                self._call(
+                    registry[request.function],
+                    request.arguments,
+                    executor,
+                    semaphore,
+                    policies.get(request.function, {}),
+                    [by_id[i] for i in getattr(request, "depends_on", None) or ()],
+                )
+            )
+            tasks[task] = request
+            by_id[getattr(request, "ln_id", None)] = task
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                failed = False
+                # calls finishing together are reported in request order
+                for task in [t for t in tasks if t in done]:
+                    result, error = task.result()
+                    failed = failed or error is not None
+                    yield tasks[task], result, error
+                if failed and self.cancel_on_failure:
+                    break
+
+            cancelled, pending = pending, set()
+            for task in cancelled:
+                task.cancel()
+            await asyncio.gather(*cancelled, return_exceptions=True)
+            # calls that finished before being cancelled keep their result
+            for task in [t for t in tasks if t in cancelled]:
+                if task.cancelled():
+                    error = asyncio.CancelledError(
+                        "Cancelled after another call failed."
+                    )
+                    yield tasks[task], None, error
+                else:
+                    yield tasks[task], *task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
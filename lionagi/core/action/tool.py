@@ -14,14 +14,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Callable, Union, List, Dict, Any
+from typing import Callable, Union, List, Dict, Any, Literal
 from pydantic import Field, field_serializer
-from lionagi.libs.ln_func_call import call_handler
 from lionagi.core.collections.abc import Actionable
 from lionagi.core.generic.node import Node
+from .executor import ToolExecutor
 from .function_calling import FunctionCalling
 
 
+# used by tools invoked outside of a ToolManager
+_default_executor = ToolExecutor()
+
+
 class Tool(Node, Actionable):
     """
     Class representing a Tool with capabilities for pre-processing, post-processing,
@@ -35,6 +39,16 @@ class Tool(Node, Actionable):
         post_processor (Union[Callable, None]): Function to post-process the result.
         post_processor_kwargs (Union[Dict, None]): Keyword arguments for the post-processor.
         parser (Union[Callable, None]): Function to parse the result to a JSON serializable format.
+        execution (str): Where a synchronous function runs: "inline" on the event
+            loop, or in the "thread" or "process" pool of the executor.
+        timeout (Union[float, None]): Seconds after which a call is abandoned.
+            An inline synchronous function would block the event loop past
+            its timeout, so it runs in the thread pool when a timeout is set.
+        max_concurrency (Union[int, None]): Maximum number of concurrent calls.
+
+    The execution fields are the tool's defaults. A `ToolManager` keeps the
+    policy given at registration in its own registry and passes it to
+    `invoke`, so a tool shared between managers is never changed by them.
     """
 
     function: Callable = Field(
@@ -55,6 +69,14 @@ class Tool(Node, Actionable):
 
     parser: Union[Callable, None] = None  # Parse result to JSON serializable format
 
+    execution: Literal["inline", "thread", "process"] = "inline"
+    timeout: Union[float, None] = Field(
+        None,
+        description="Seconds after which a call is abandoned. Timed synchronous "
+        "functions run in the thread pool rather than inline.",
+    )
+    max_concurrency: Union[int, None] = None
+
     @field_serializer("function", check_fields=False)
     def serialize_func(self, func: Callable) -> str:
         """
@@ -78,34 +100,73 @@ class Tool(Node, Actionable):
         """
         return self.schema_["function"]["name"]
 
-    async def invoke(self, kwargs: Dict = {}) -> Any:
+    async def invoke(
+        self,
+        kwargs: Dict = {},
+        executor: ToolExecutor = None,
+        raise_error: bool = False,
+        *,
+        execution: str = None,
+        timeout: float = None,
+        max_concurrency: int = None,
+        key: str = None,
+    ) -> Any:
         """
         Invoke the tool's function with optional pre-processing and post-processing.
 
+        The function runs according to the tool's execution policy. The
+        pre-processor and post-processor run in the thread pool when the
+        tool is not inline, since they may not be picklable.
+
         Args:
             kwargs (Dict): The arguments to pass to the function.
+            executor (ToolExecutor, optional): The executor providing the
+                pools, usually the one of the ToolManager.
+            raise_error (bool): Whether a failed or timed out call raises
+                instead of returning None.
+            execution (str, optional): Overrides the tool's execution mode.
+            timeout (float, optional): Overrides the tool's timeout.
+            max_concurrency (int, optional): Overrides the tool's concurrency cap.
+            key (str, optional): The key the concurrency cap is counted by.
+                Defaults to the tool's id.
 
         Returns:
-            Any: The result of the function call.
+            Any: The result of the function call, None if it failed or
+                timed out.
         """
+        executor = executor or _default_executor
+        execution = execution or self.execution
+        timeout = timeout if timeout is not None else self.timeout
+        max_concurrency = max_concurrency or self.max_concurrency
+        callback_mode = "inline" if execution == "inline" else "thread"
+
         if self.pre_processor:
             pre_process_kwargs = self.pre_processor_kwargs or {}
-            kwargs = await call_handler(
-                self.pre_processor(kwargs, **pre_process_kwargs)
+            kwargs = await executor.run(
+                self.pre_processor, (kwargs,), pre_process_kwargs, mode=callback_mode
             )
             if not isinstance(kwargs, dict):
                 raise ValueError("Pre-processor must return a dictionary.")
 
         func_call_ = FunctionCalling(function=self.function, arguments=kwargs)
         try:
-            result = await func_call_.invoke()
+            result = await executor.run(
+                func_call_.function,
+                kwargs=func_call_.arguments,
+                mode=execution,
+                timeout=timeout,
+                max_concurrency=max_concurrency,
+                key=key or self.ln_id,
+            )
         except Exception:
+            if raise_error:
+                raise
             return None
 
         if self.post_processor:
             post_process_kwargs = self.post_processor_kwargs or {}
-            result = await call_handler(
-                self.post_processor(result, **post_process_kwargs)
+            result = await executor.run(
+                self.post_processor, (result,), post_process_kwargs, mode=callback_mode
             )
 
         return result if not self.parser else self.parser(result)
@@ -28,7 +28,9 @@ from lionagi.libs import ParseUtil
 from lionagi.libs.ln_convert import to_list, to_dict
 from lionagi.libs.ln_func_call import lcall
 from lionagi.core.collections.abc import Actionable
+from lionagi.core.action.executor import ToolExecutor, EXECUTION_MODES
 from lionagi.core.action.function_calling import FunctionCalling
+from lionagi.core.action.scheduler import ActionScheduler
 from lionagi.core.action.tool import Tool, TOOL_TYPE
 
 
@@ -36,17 +38,33 @@ class ToolManager(Actionable):
     """
     Manages tools in the system. Provides functionality to register tools,
     invoke them based on various input formats, and retrieve tool schemas.
+    Tools run through the manager's executor, according to their execution
+    policy. The policy given at registration is kept in `policies`, by tool
+    name, and overrides the tool's own defaults for this manager only.
     """
 
-    def __init__(self, registry: dict[str, Tool] = None) -> None:
+    def __init__(
+        self,
+        registry: dict[str, Tool] = None,
+        executor: ToolExecutor = None,
+        scheduler: ActionScheduler = None,
+    ) -> None:
         """
         Initializes a new instance of ToolManager.
 
         Args:
             registry (dict[str, Tool], optional): A dictionary to store registered tools.
                 Defaults to an empty dictionary.
+            executor (ToolExecutor, optional): The executor providing the thread
+                and process pools. Defaults to a new executor.
+            scheduler (ActionScheduler, optional): The scheduler running the
+                action requests of the branch. Defaults to a scheduler with no
+                concurrency cap, timeout or retries.
         """
         self.registry = registry or {}
+        self.policies: dict[str, dict] = {}
+        self.executor = executor or ToolExecutor()
+        self.scheduler = scheduler or ActionScheduler()
 
     def __contains__(self, tool) -> bool:
         if isinstance(tool, Tool):
@@ -60,12 +78,17 @@ class ToolManager(Actionable):
 
         return False
 
-    def _register_tool(self, tool: Tool | Callable, update: bool = False) -> bool:
+    def _register_tool(
+        self, tool: Tool | Callable, update: bool = False, **policy
+    ) -> bool:
         """
         Registers a single tool or multiple tools based on the input type.
 
         Args:
             tool (Any): Can be a single Tool, a list of Tools, a callable, or other forms.
+            update (bool): Whether to replace a tool registered under the same name.
+            **policy: Execution policy of the tool in this manager, see
+                `register_tools`.
 
         Raises:
             TypeError: If the tools argument type is unsupported.
@@ -77,29 +100,86 @@ class ToolManager(Actionable):
             tool = tool[0] if isinstance(tool, list) and len(tool) == 1 else tool
         if not isinstance(tool, Tool):
             raise TypeError("Please register a Tool object.")
+        if policy.get("execution") not in (None, *EXECUTION_MODES):
+            raise ValueError(
+                f"Invalid execution mode {policy['execution']}. "
+                f"Expected one of {EXECUTION_MODES}"
+            )
         self.registry[tool.name] = tool
+        self.policies[tool.name] = {k: v for k, v in policy.items() if v is not None}
         return True
 
-    def update_tools(self, tools: list | Tool | Callable):
+    def get_policy(self, name: str) -> dict:
+        """
+        Returns the execution policy a tool was registered with.
+
+        Args:
+            name (str): The name of the tool.
+
+        Returns:
+            dict: The policy arguments to pass to `Tool.invoke`, empty if the
+                tool runs with its own defaults.
+        """
+        policy = dict(self.policies.get(name, {}))
+        if policy.get("max_concurrency"):
+            # the cap is counted per manager, not across every manager of the tool
+            policy["key"] = f"{id(self)}:{name}"
+        return policy
+
+    def update_tools(
+        self,
+        tools: list | Tool | Callable,
+        *,
+        execution: str = None,
+        timeout: float = None,
+        max_concurrency: int = None,
+    ):
+        policy = {
+            "execution": execution,
+            "timeout": timeout,
+            "max_concurrency": max_concurrency,
+        }
         if isinstance(tools, Tool) or isinstance(tools, Callable):
-            return self._register_tool(tools, update=True)
+            return self._register_tool(tools, update=True, **policy)
         else:
-            return all(lcall(tools, self._register_tool, update=True))
-
-    def register_tools(self, tools: list | Tool | Callable):
+            return all(lcall(tools, self._register_tool, update=True, **policy))
+
+    def register_tools(
+        self,
+        tools: list | Tool | Callable,
+        *,
+        execution: str = None,
+        timeout: float = None,
+        max_concurrency: int = None,
+    ):
         """
         Registers multiple Tools.
 
+        The execution policy arguments override those of the tools in this
+        manager only; the tools themselves are not modified. When omitted,
+        each tool runs with its own (inline, no timeout, no cap by default).
+
         Args:
             tools (list): The list of Tools to register.
+            execution (str, optional): Where synchronous tools run: "inline" on
+                the event loop, "thread" or "process" pool of the executor.
+            timeout (float, optional): Seconds after which a call is abandoned.
+                A thread or process cannot be interrupted, so a timed out call
+                keeps its pool worker busy until the function returns.
+            max_concurrency (int, optional): Maximum concurrent calls per tool.
 
         Returns:
             bool: True if all tools are successfully registered.
         """
+        policy = {
+            "execution": execution,
+            "timeout": timeout,
+            "max_concurrency": max_concurrency,
+        }
         if isinstance(tools, Tool) or isinstance(tools, Callable):
-            return self._register_tool(tools)
+            return self._register_tool(tools, **policy)
         else:
-            return all(lcall(tools, self._register_tool))
+            return all(lcall(tools, self._register_tool, **policy))
 
     async def invoke(self, func_calling=None):
         """
@@ -127,11 +207,32 @@ class ToolManager(Actionable):
 
         if func_calling.func_name in self.registry:
             return await self.registry[func_calling.func_name].invoke(
-                func_calling=func_calling
+                func_calling.arguments,
+                executor=self.executor,
+                **self.get_policy(func_calling.func_name),
             )
 
         raise ValueError(f"Function {func_calling.func_name} is not registered.")
 
+    async def invoke_all(self, requests: list):
+        """
+        Invokes action requests concurrently through the scheduler.
+
+        Args:
+            requests (list): The ActionRequest objects to invoke.
+
+        Yields:
+            tuple: Each request with its result and the exception that made
+                it fail, or None, as soon as its call finishes.
+        """
+        async for item in self.scheduler.run(
+            requests,
+            self.registry,
+            self.executor,
+            {name: self.get_policy(name) for name in self.policies},
+        ):
+            yield item
+
     @property
     def _schema_list(self) -> list[dict[str, Any]]:
         """
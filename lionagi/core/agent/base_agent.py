@@ -18,11 +18,10 @@ limitations under the License.
 This module contains the BaseAgent class, which serves as a base class for agents.
 """
 
+import asyncio
 from pydantic import Field
 from typing import Any, Callable
 
-from lionagi.libs import func_call, AsyncUtil
-
 
 from lionagi.core.mail.start_mail import StartMail
 from lionagi.core.generic.node import Node
@@ -60,14 +59,19 @@ class BaseAgent(Node):
 
     async def mail_manager_control(self, refresh_time=1):
         """
-        Controls the mail manager execution based on the structure and executable states.
+        Runs the structure and the executable, then stops the mail manager once both have stopped.
 
         Args:
-            refresh_time: The time interval (in seconds) for checking the execution states (default: 1).
+            refresh_time: The maximum time (in seconds) the structure and the executable wait for incoming mail
+                between execution cycles (default: 1).
         """
-        while not self.structure.execute_stop or not self.executable.execute_stop:
-            await AsyncUtil.sleep(refresh_time)
-        self.mail_manager.execute_stop = True
+        try:
+            await asyncio.gather(
+                self.structure.execute(refresh_time),
+                self.executable.execute(refresh_time),
+            )
+        finally:
+            self.mail_manager.stop()
 
     async def execute(self, context=None):
         """
@@ -85,14 +89,9 @@ class BaseAgent(Node):
             structure_id=self.structure.ln_id,
             executable_id=self.executable.ln_id,
         )
-        await func_call.mcall(
-            [0.1, 0.1, 0.1, 0.1],
-            [
-                self.structure.execute,
-                self.executable.execute,
-                self.mail_manager.execute,
-                self.mail_manager_control,
-            ],
+        await asyncio.gather(
+            self.mail_manager.execute(),
+            self.mail_manager_control(),
         )
 
         self.structure.execute_stop = False
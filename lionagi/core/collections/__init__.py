@@ -1,5 +1,5 @@
 from .model import iModel
-from .pile import Pile, pile
+from .pile import Pile, PileView, pile
 from .progression import Progression, progression
 from .flow import Flow, flow
 from .exchange import Exchange
@@ -8,6 +8,7 @@ from .exchange import Exchange
 __all__ = [
     "iModel",
     "Pile",
+    "PileView",
     "pile",
     "Progression",
     "progression",
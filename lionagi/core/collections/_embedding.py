@@ -0,0 +1,228 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Contiguous float32 embedding matrix with top-k similarity search.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+class EmbeddingStore:
+    """
+    Embedding vectors of a pile's items, one row per item.
+
+    Rows live in a single preallocated float32 matrix that grows
+    geometrically. Removing an item moves the last row into its slot, so
+    both insertion and removal are O(1) amortized.
+
+    Attributes:
+        dim (int | None): Dimension of the vectors, set by the first one.
+        metrics (tuple[str]): The supported similarity metrics.
+    """
+
+    metrics = ("cosine", "dot")
+
+    def __init__(self, dim: int | None = None, capacity: int = 64):
+        self.dim = dim
+        self._capacity = capacity
+        self._matrix = None
+        self._norms = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, ln_id: str) -> bool:
+        return ln_id in self._rows
+
+    @property
+    def ids(self) -> list[str]:
+        """The item ids, in row order."""
+        return list(self._ids)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The used rows of the matrix, as a read-only view."""
+        if self._matrix is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        view = self._matrix[: len(self._ids)]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, n: int) -> None:
+        if self._matrix is None:
+            capacity = max(self._capacity, n)
+            self._matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+            self._norms = np.zeros(capacity, dtype=np.float32)
+            return
+        if n <= len(self._matrix):
+            return
+        capacity = max(n, 2 * len(self._matrix))
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[: len(self._ids)] = self._matrix[: len(self._ids)]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: len(self._ids)] = self._norms[: len(self._ids)]
+        self._matrix, self._norms = matrix, norms
+
+    def _as_matrix(self, vectors: Any) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors[None, :]
+        if vectors.ndim != 2:
+            raise ValueError("Embeddings must be vectors or a matrix of vectors.")
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Invalid embedding dimension {vectors.shape[1]}. "
+                f"Expected {self.dim}"
+            )
+        return vectors
+
+    def add(self, ln_id: str, vector: Any) -> None:
+        """Add or replace the embedding of an item."""
+        self.add_many([ln_id], [vector])
+
+    def add_many(self, ids: list[str], vectors: Any) -> None:
+        """
+        Add or replace the embeddings of several items at once.
+
+        Args:
+            ids: The ids of the items.
+            vectors: Their embeddings, one per id.
+
+        Raises:
+            ValueError: On a length or dimension mismatch.
+        """
+        if len(ids) == 0:
+            return
+        vectors = self._as_matrix(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError("The length of ids does not match the embeddings")
+
+        new = [i for i in dict.fromkeys(ids) if i not in self._rows]
+        self._reserve(len(self._ids) + len(new))
+        for i in new:
+            self._rows[i] = len(self._ids)
+            self._ids.append(i)
+
+        rows = [self._rows[i] for i in ids]
+        self._matrix[rows] = vectors
+        self._norms[rows] = np.linalg.norm(vectors, axis=1)
+
+    def remove(self, ln_id: str) -> None:
+        """Remove the embedding of an item, if present."""
+        row = self._rows.pop(ln_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._norms[row] = self._norms[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._rows.clear()
+
+    def get(self, ln_id: str) -> np.ndarray | None:
+        """Return a copy of the embedding of an item, or None."""
+        row = self._rows.get(ln_id)
+        return None if row is None else self._matrix[row].copy()
+
+    def search(
+        self, queries: Any, k: int = 5, metric: str = "cosine"
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Find the k most similar rows for each query.
+
+        Args:
+            queries: A query vector or a matrix of query vectors.
+            k: The number of results per query.
+            metric: "cosine" or "dot".
+
+        Returns:
+            For each query, (id, score) pairs by decreasing score.
+
+        Raises:
+            ValueError: If an invalid metric is provided.
+        """
+        if metric not in self.metrics:
+            raise ValueError(
+                f"Invalid metric {metric}. Expected one of {list(self.metrics)}"
+            )
+        queries = self._as_matrix(queries)
+        n = len(self._ids)
+        if n == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self._matrix[:n].T
+        if metric == "cosine":
+            q_norms = np.linalg.norm(queries, axis=1)[:, None]
+            denominator = q_norms * self._norms[:n][None, :]
+            np.divide(scores, denominator, out=scores, where=denominator > 0)
+
+        k = min(k, n)
+        if k < n:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(n), (len(queries), n))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        ranked = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, ranked, axis=1)
+        top_scores = np.take_along_axis(top_scores, ranked, axis=1)
+
+        return [
+            [(self._ids[r], float(s)) for r, s in zip(rows, row_scores)]
+            for rows, row_scores in zip(top, top_scores)
+        ]
+
+    @staticmethod
+    def _ids_path(path: Path) -> Path:
+        return path.with_name(f"{path.stem}.ids.npy")
+
+    def save(self, file_name: str | Path) -> Path:
+        """
+        Save the matrix as an .npy file, with the row ids alongside it.
+
+        Args:
+            file_name: The target path, its suffix is replaced by ".npy".
+
+        Returns:
+            The path of the matrix file.
+        """
+        path = Path(file_name).with_suffix(".npy")
+        np.save(path, self.matrix)
+        np.save(self._ids_path(path), np.asarray(self._ids, dtype=str))
+        return path
+
+    @classmethod
+    def load(cls, file_name: str | Path) -> "EmbeddingStore":
+        """Load a store saved with `save`."""
+        path = Path(file_name).with_suffix(".npy")
+        matrix = np.load(path, allow_pickle=False)
+        ids = np.load(cls._ids_path(path), allow_pickle=False).tolist()
+        store = cls(dim=matrix.shape[1] if matrix.ndim == 2 else None)
+        store.add_many(ids, matrix)
+        return store
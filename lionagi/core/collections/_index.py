@@ -0,0 +1,179 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Secondary field indexes maintained by a Pile.
+
+A field is addressed by a dotted path: the first segment is an attribute of
+the item, the following ones are keys (or attributes) of nested values, e.g.
+``"class_name"``, ``"timestamp"`` or ``"metadata.source"``.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+
+def resolve_field(item: Any, field: str) -> Any:
+    """
+    Resolve a dotted field path on an item.
+
+    Args:
+        item: The item to read from.
+        field: The dotted path of the field.
+
+    Returns:
+        The value of the field, or None if any segment is missing.
+    """
+    head, *rest = field.split(".")
+    value = getattr(item, head, None)
+    for key in rest:
+        if value is None:
+            return None
+        if isinstance(value, Mapping):
+            value = value.get(key)
+        else:
+            value = getattr(value, key, None)
+    return value
+
+
+class FieldIndex(ABC):
+    """
+    Base class for secondary indexes over a field of the items in a pile.
+
+    Attributes:
+        field (str): The dotted path of the indexed field.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self._values: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, ln_id: str) -> bool:
+        return ln_id in self._values
+
+    def add(self, ln_id: str, item: Any) -> None:
+        """Index an item, replacing its previous entry if any."""
+        if ln_id in self._values:
+            self.remove(ln_id)
+        value = resolve_field(item, self.field)
+        if self._accepts(value):
+            self._values[ln_id] = value
+            self._insert(ln_id, value)
+
+    def remove(self, ln_id: str) -> None:
+        """Remove an item from the index, if present."""
+        if ln_id in self._values:
+            self._delete(ln_id, self._values.pop(ln_id))
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._clear()
+
+    def _accepts(self, value: Any) -> bool:
+        return value is not None
+
+    @abstractmethod
+    def _insert(self, ln_id: str, value: Any) -> None: ...
+
+    @abstractmethod
+    def _delete(self, ln_id: str, value: Any) -> None: ...
+
+    @abstractmethod
+    def _clear(self) -> None: ...
+
+
+class HashIndex(FieldIndex):
+    """Index answering equality lookups in O(1)."""
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self._buckets: dict[Any, dict[str, None]] = {}
+
+    def _accepts(self, value: Any) -> bool:
+        return value is not None and isinstance(value, Hashable)
+
+    def _insert(self, ln_id: str, value: Any) -> None:
+        self._buckets.setdefault(value, {})[ln_id] = None
+
+    def _delete(self, ln_id: str, value: Any) -> None:
+        bucket = self._buckets[value]
+        del bucket[ln_id]
+        if not bucket:
+            del self._buckets[value]
+
+    def _clear(self) -> None:
+        self._buckets.clear()
+
+    def get(self, value: Any) -> list[str]:
+        """Return the ids of the items whose field equals the value."""
+        try:
+            return list(self._buckets.get(value, ()))
+        except TypeError:
+            return []
+
+
+class SortedIndex(FieldIndex):
+    """Index answering range lookups in O(log n)."""
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self._entries: list[tuple[Any, str]] = []
+
+    def _insert(self, ln_id: str, value: Any) -> None:
+        insort(self._entries, (value, ln_id))
+
+    def _delete(self, ln_id: str, value: Any) -> None:
+        idx = bisect_left(self._entries, (value, ln_id))
+        del self._entries[idx]
+
+    def _clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, value: Any) -> list[str]:
+        """Return the ids of the items whose field equals the value."""
+        return self.range(value, value)
+
+    def range(
+        self, lower: Any = None, upper: Any = None, inclusive: bool = True
+    ) -> list[str]:
+        """
+        Return the ids of the items whose field lies within a range.
+
+        Args:
+            lower: The lower bound, None for no lower bound.
+            upper: The upper bound, None for no upper bound.
+            inclusive: Whether the bounds themselves are included.
+
+        Returns:
+            The matching ids, sorted by the value of the field.
+        """
+        key = lambda entry: entry[0]
+        start, end = 0, len(self._entries)
+        if lower is not None:
+            bisect = bisect_left if inclusive else bisect_right
+            start = bisect(self._entries, lower, key=key)
+        if upper is not None:
+            bisect = bisect_right if inclusive else bisect_left
+            end = bisect(self._entries, upper, key=key)
+        return [ln_id for _, ln_id in self._entries[start:end]]
+
+
+INDEX_TYPES = {"hash": HashIndex, "sorted": SortedIndex}
@@ -16,11 +16,13 @@ limitations under the License.
 
 import atexit
 import contextlib
+import json
 import logging
+import threading
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from lionagi.libs import SysUtil, convert, nested
 
@@ -28,22 +30,25 @@ from lionagi.libs import SysUtil, convert, nested
 # TODO: there should be a global data logger, under setting
 
 
-@dataclass
+@dataclass(slots=True)
 class DLog:
     """Defines a log entry structure for data processing operations.
 
     This class encapsulates both the input to and output from a data processing
     operation, along with an automatically generated timestamp indicating when
     the log entry was created. It aims to standardize logging across applications
-    for easier analysis and debugging.
+    for easier analysis and debugging. Entries are slotted, so they carry no
+    per-instance ``__dict__``.
 
     Attributes:
         input_data: The data input to the operation. Can be of any type.
         output_data: The data output by the operation. Can be of any type.
+        timestamp: When the entry was created.
     """
 
     input_data: Any
     output_data: Any
+    timestamp: str = field(default_factory=SysUtil.get_timestamp)
 
     def serialize(self, *, flatten_: bool = True, sep: str = "[^_^]") -> dict[str, Any]:
         """Serialize the DLog instance into a dictionary with an added timestamp.
@@ -79,10 +84,29 @@ class DLog:
         _process_data(self.input_data, "input_data")
         _process_data(self.output_data, "output_data")
 
-        log_dict["timestamp"] = SysUtil.get_timestamp()
+        log_dict["timestamp"] = self.timestamp
 
         return log_dict
 
+    def to_json(self) -> str:
+        """Serialize the DLog instance into a single JSON line.
+
+        Unlike `serialize`, nested data is kept as is instead of being
+        flattened; values that are not JSON serializable are converted with
+        `str`.
+
+        Returns:
+            The JSON representation of the entry, without newlines.
+        """
+        return json.dumps(
+            {
+                "input_data": self.input_data,
+                "output_data": self.output_data,
+                "timestamp": self.timestamp,
+            },
+            default=str,
+        )
+
     @classmethod
     def deserialize(
         cls,
@@ -142,10 +166,19 @@ class DataLogger:
     It supports exporting logs to disk in both CSV and JSON formats, with features for
     automatic log saving at program exit and customizable file naming.
 
+    In spill mode the logger is append-only: entries are encoded as JSON lines
+    as they arrive and kept in a small buffer, which a background thread
+    appends to a newline-delimited JSON file whenever it exceeds the memory
+    cap or the flush interval elapses. Memory use stays bounded however long
+    the session runs.
+
     Attributes:
         persist_path: Path to the directory for saving log files.
         log: Container for log entries.
         filename: Base name for log files.
+        spill: Whether entries are spilled to disk instead of kept in `log`.
+        memory_cap: Size in bytes of buffered entries that triggers a spill.
+        flush_interval: Seconds after which buffered entries are spilled anyway.
     """
 
     def __init__(
@@ -153,6 +186,10 @@ class DataLogger:
         persist_path: str | Path | None = None,
         log: List[Dict] | None = None,
         filename: str | None = None,
+        *,
+        spill: bool = False,
+        memory_cap: int = 1_048_576,
+        flush_interval: float | None = 5.0,
     ) -> None:
         """Initialize the DataLogger with optional custom settings for log storage.
 
@@ -161,12 +198,33 @@ class DataLogger:
                           Defaults to 'data/logs/'.
             log: Initial log entries.
             filename: Base name for exported log files.
+            spill: If True, spill entries to '<filename>.ndjson' under
+                   `persist_path` instead of keeping them in memory.
+            memory_cap: Size in bytes of buffered entries that triggers a
+                        spill. Defaults to 1 MiB.
+            flush_interval: Seconds after which buffered entries are spilled
+                            even below the memory cap. None to disable.
         """
         self.persist_path = Path(persist_path) if persist_path else Path("data/logs/")
         self.log = deque(log) if log else deque()
         self.filename = filename or "log"
+        self.spill = spill
+        self.memory_cap = memory_cap
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._buffer_bytes = 0
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._writer: threading.Thread | None = None
         atexit.register(self.save_at_exit)
 
+    @property
+    def spill_file(self) -> Path:
+        """The newline-delimited JSON file entries are spilled to."""
+        return self.persist_path / f"{self.filename}.ndjson"
+
     def extend(self, logs) -> None:
         """Extend the log deque with multiple log entries.
 
@@ -179,9 +237,7 @@ class DataLogger:
                   structure (e.g., containing 'input_data', 'output_data', etc.).
         """
         if len(logs) > 0:
-            log1 = convert.to_list(self.log)
-            log1.extend(convert.to_list(logs))
-            self.log = deque(log1)
+            self.log.extend(convert.to_list(logs))
 
     def append(self, *, input_data: Any, output_data: Any) -> None:
         """Append a new log entry from provided input and output data.
@@ -191,7 +247,85 @@ class DataLogger:
             output_data: Output data from the operation.
         """
         log_entry = DLog(input_data=input_data, output_data=output_data)
-        self.log.append(log_entry)
+        if not self.spill:
+            self.log.append(log_entry)
+            return
+
+        line = log_entry.to_json() + "\n"
+        with self._buffer_lock:
+            self._buffer.append(line)
+            self._buffer_bytes += len(line)
+            full = self._buffer_bytes >= self.memory_cap
+            closed = self._closed.is_set()
+            if not closed:
+                self._ensure_writer()
+        if closed:
+            # no writer once closed, so entries are written straight through
+            self.flush()
+        elif full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Write the buffered entries to the spill file.
+
+        Returns:
+            The number of entries written.
+        """
+        with self._buffer_lock:
+            lines, self._buffer = self._buffer, []
+            self._buffer_bytes = 0
+        if not lines:
+            return 0
+        with self._write_lock:
+            self.persist_path.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_file, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        return len(lines)
+
+    def read_spilled(self) -> Iterator[DLog]:
+        """Iterate over the entries spilled to disk, flushing the buffer first.
+
+        Yields:
+            The spilled entries, oldest first.
+        """
+        self.flush()
+        if not self.spill_file.exists():
+            return
+        with open(self.spill_file, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield DLog(**json.loads(line))
+
+    def close(self) -> None:
+        """Stop the background writer and flush the remaining entries.
+
+        Entries appended after closing are written to the spill file
+        immediately.
+        """
+        with self._buffer_lock:
+            self._closed.set()
+            writer, self._writer = self._writer, None
+        self._wakeup.set()
+        if writer is not None:
+            writer.join()
+        self.flush()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer. Must be called holding `_buffer_lock`."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="DataLogger-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        while not self._closed.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Error in spilling logs to {self.spill_file}: {e}")
 
     def to_csv_file(
         self,
@@ -311,9 +445,13 @@ class DataLogger:
         This automatic save operation is triggered only if there are unsaved logs
         present at the time of program exit.
 
+        In spill mode, buffered entries are appended to the spill file.
+
         Note:
             This method does not clear the logs after saving, allowing for the
             possibility of manual review or recovery after the program has terminated.
         """
+        if self.spill:
+            self.close()
         if self.log:
             self.to_csv_file("unsaved_logs.csv", clear=False)
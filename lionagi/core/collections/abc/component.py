@@ -498,7 +498,8 @@ class Component(Element, ABC):
         if name == "metadata":
             raise AttributeError("Cannot directly assign to metadata.")
         super().__setattr__(name, value)
-        self._add_last_update(name)
+        if not name.startswith("_"):
+            self._add_last_update(name)
 
     def _add_field(
         self,
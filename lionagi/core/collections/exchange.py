@@ -14,7 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import TypeVar, Generic
+import asyncio
+from typing import Callable, TypeVar, Generic
+
+from pydantic import PrivateAttr
+
 from .abc import Element, Field, Sendable
 from .pile import Pile, pile
 from .progression import Progression, progression
@@ -22,6 +26,16 @@ from .progression import Progression, progression
 T = TypeVar("T")
 
 
+class _Listeners(list):
+    """Callbacks of an exchange, which copies of the exchange do not inherit."""
+
+    def __copy__(self):
+        return _Listeners()
+
+    def __deepcopy__(self, memo):
+        return _Listeners()
+
+
 class Exchange(Element, Generic[T]):
     """
     Item exchange system designed to handle incoming and outgoing flows of items.
@@ -30,6 +44,10 @@ class Exchange(Element, Generic[T]):
         pile (Pile[T]): The pile of items in the exchange.
         pending_ins (dict[str, Progression]): The pending incoming items to the exchange.
         pending_outs (Progression): The progression of pending outgoing items.
+
+    Listeners subscribed to the exchange are called as soon as an item is
+    included for sending or arrives, and `wait_for_incoming` lets a consumer
+    sleep until an item arrives instead of polling.
     """
 
     pile: Pile[T] = Field(
@@ -51,6 +69,9 @@ class Exchange(Element, Generic[T]):
         title="pending outgoing items",
     )
 
+    _listeners: _Listeners = PrivateAttr(default_factory=_Listeners)
+    _arrival: tuple | None = PrivateAttr(None)
+
     def __contains__(self, item):
         """
         Check if an item is in the pile.
@@ -138,13 +159,84 @@ class Exchange(Element, Generic[T]):
         if direction == "in":
             if item.sender not in self.pending_ins:
                 self.pending_ins[item.sender] = progression()
-            return self.pending_ins[item.sender].include(item)
+            if not self.pending_ins[item.sender].include(item):
+                return False
+            self._notify(item, direction)
+            # listeners may have consumed the item
+            if self._arrival is not None and item in self.pending_ins[item.sender]:
+                self._arrival[1].set()
+            return True
 
         if direction == "out":
-            return self.pending_outs.include(item)
+            if not self.pending_outs.include(item):
+                return False
+            self._notify(item, direction)
+            return True
 
         return True
 
+    def _notify(self, item, direction) -> None:
+        for listener, listener_direction in list(self._listeners):
+            if listener_direction == direction:
+                listener(self, item)
+
+    def subscribe(self, listener: Callable, direction: str = "out") -> None:
+        """
+        Registers a callback called with the exchange and the item whenever an
+        item is included in a direction.
+
+        Args:
+            listener (Callable): The callback, which may take the item out of
+                the exchange to deliver or consume it.
+            direction (str): "out" for items included for sending, "in" for
+                items arriving. Defaults to "out".
+        """
+        if (listener, direction) not in self._listeners:
+            self._listeners.append((listener, direction))
+
+    def unsubscribe(self, listener: Callable, direction: str = "out") -> None:
+        """
+        Removes a callback registered with `subscribe`.
+
+        Args:
+            listener (Callable): The callback to remove.
+            direction (str): The direction it was registered for.
+        """
+        if (listener, direction) in self._listeners:
+            self._listeners.remove((listener, direction))
+
+    @property
+    def has_incoming(self) -> bool:
+        """Whether any incoming item is pending."""
+        return any(len(v) > 0 for v in self.pending_ins.values())
+
+    def _arrival_event(self) -> asyncio.Event:
+        # events are bound to the loop they are used in
+        loop = asyncio.get_running_loop()
+        if self._arrival is None or self._arrival[0] is not loop:
+            self._arrival = (loop, asyncio.Event())
+        return self._arrival[1]
+
+    async def wait_for_incoming(self, timeout: float | None = None) -> bool:
+        """
+        Waits until an incoming item is pending.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if an incoming item is pending, False on timeout.
+        """
+        if self.has_incoming:
+            return True
+        event = self._arrival_event()
+        event.clear()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.has_incoming
+
     def to_dict(self) -> dict:
         """
         Convert the exchange to a dictionary.
@@ -19,6 +19,7 @@ import asyncio
 import numpy as np
 from dotenv import load_dotenv
 from lionagi.libs import SysUtil, BaseService, StatusTracker, APIUtil, to_list, ninsert
+from lionagi.libs.ln_cache import CompletionCache
 from .abc import Component, ModelLimitExceededError
 
 load_dotenv()
@@ -70,6 +71,7 @@ class iModel:
         allowed_parameters=[],
         device: str = None,
         costs=None,
+        cache: CompletionCache = None,
         **kwargs,  # additional parameters for the model
     ):
         """
@@ -93,6 +95,8 @@ class iModel:
                 is 1,000.
             interval (int, optional): Time interval in seconds, default is 60.
             service (BaseService, optional): An instance of BaseService.
+            cache (CompletionCache, optional): A cache the responses to
+                deterministic requests are served from.
             **kwargs: Additional parameters for the model.
         """
         self.ln_id: str = SysUtil.create_id()
@@ -129,6 +133,7 @@ class iModel:
                 )
 
         self.status_tracker = StatusTracker()
+        self.cache = cache
 
         set_up_kwargs = {
             "api_key": getattr(self, "api_key", None),
@@ -266,6 +271,64 @@ class iModel:
             dict: Response from the chat completion service.
         """
 
+        num_tokens = self._count_chat_tokens(messages)
+        key = self._cache_key("chat/completions", messages, kwargs)
+        if key and (cached := await self.cache.aget(key)) is not None:
+            return cached["payload"], cached["completion"]
+
+        with self.status_tracker.track(
+            "chat/completions", self._model_of(kwargs)
+        ) as record:
+            payload, completion = await self.service.serve_chat(
+                messages, required_tokens=num_tokens, **kwargs
+            )
+            record.add_usage(completion, self.costs)
+        await self._cache_set(key, payload, completion)
+        return payload, completion
+
+    async def stream_chat_completion(self, messages, **kwargs):
+        """
+        Asynchronous method to call the chat completion service with a
+        streamed response.
+
+        Services that cannot stream serve the whole completion as a single
+        chunk once it is complete.
+
+        Args:
+            messages (list): List of messages for the chat completion.
+            **kwargs: Additional parameters for the service call.
+
+        Returns:
+            tuple: The payload and an async iterator over the completion
+                chunks, which `APIUtil.merge_stream_chunks` assembles into a
+                completion.
+        """
+        num_tokens = self._count_chat_tokens(messages)
+        key = self._cache_key("chat/completions", messages, kwargs)
+        if key and (cached := await self.cache.aget(key)) is not None:
+            return cached["payload"], _completion_as_stream(cached["completion"])
+
+        model = self._model_of(kwargs)
+        if not hasattr(self.service, "serve_chat_stream"):
+            with self.status_tracker.track("chat/completions", model) as record:
+                payload, completion = await self.service.serve_chat(
+                    messages, required_tokens=num_tokens, **kwargs
+                )
+                record.add_usage(completion, self.costs)
+            await self._cache_set(key, payload, completion)
+            return payload, _completion_as_stream(completion)
+
+        payload, stream = await self.service.serve_chat_stream(
+            messages, required_tokens=num_tokens, **kwargs
+        )
+        stream = self.status_tracker.track_stream(
+            stream, "chat/completions", model, self.costs
+        )
+        if key:
+            stream = self._caching_stream(key, payload, stream)
+        return payload, stream
+
+    def _count_chat_tokens(self, messages) -> int:
         num_tokens = APIUtil.calculate_num_token(
             {"messages": messages},
             "chat/completions",
@@ -276,10 +339,7 @@ class iModel:
             raise ModelLimitExceededError(
                 f"Number of tokens {num_tokens} exceeds the limit {self.token_limit}"
             )
-
-        return await self.service.serve_chat(
-            messages, required_tokens=num_tokens, **kwargs
-        )
+        return num_tokens
 
     async def call_embedding(self, embed_str, **kwargs):
         """
@@ -292,22 +352,106 @@ class iModel:
         Returns:
             dict: Response from the embedding service.
         """
-        return await self.service.serve_embedding(embed_str, **kwargs)
+        key = self._cache_key("embeddings", embed_str, kwargs)
+        if key and (cached := await self.cache.aget(key)) is not None:
+            return cached["payload"], cached["completion"]
+
+        with self.status_tracker.track(
+            "embeddings", self._model_of(kwargs)
+        ) as record:
+            payload, embed = await self.service.serve_embedding(embed_str, **kwargs)
+            record.add_usage(embed, self.costs)
+        await self._cache_set(key, payload, embed)
+        return payload, embed
+
+    def _model_of(self, kwargs) -> str:
+        return kwargs.get("model") or self.config.get("model") or self.iModel_name
+
+    def metrics(self, endpoint: str = None) -> dict:
+        """
+        Returns the telemetry of the calls made through the model.
+
+        Args:
+            endpoint (str, optional): Only include calls to this endpoint.
+
+        Returns:
+            dict: The aggregated telemetry per endpoint and model, see
+                `StatusTracker.summary`.
+        """
+        return self.status_tracker.summary(endpoint=endpoint)
+
+    def _cache_key(self, endpoint, input_, kwargs) -> str | None:
+        """Returns the cache key of a request, or None if it is not cached."""
+        if self.cache is None:
+            return None
+        params = {**self.config, **kwargs}
+        if not CompletionCache.is_cacheable(endpoint, params):
+            return None
+        return CompletionCache.make_key(endpoint, input_, params)
+
+    async def _cache_set(self, key, payload, completion) -> None:
+        if key and completion and "error" not in completion:
+            await self.cache.aset(
+                key, {"payload": payload, "completion": completion}
+            )
+
+    async def _caching_stream(self, key, payload, stream):
+        """Passes a stream through, caching the completion once it ends."""
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            await self._cache_set(key, payload, APIUtil.merge_stream_chunks(chunks))
+
+    @staticmethod
+    def _embed_str(node, field="content") -> str:
+        """Returns the text of a node field that gets embedded."""
+        embed_str = getattr(node, field)
+
+        if isinstance(embed_str, dict) and "images" in embed_str:
+            embed_str = {
+                k: v
+                for k, v in embed_str.items()
+                if k not in ("images", "image_detail")
+            }
+        return str(embed_str) if isinstance(embed_str, dict) else embed_str
+
+    def embedding_hash(self, node, field="content") -> str:
+        """
+        Returns the hash identifying the embedding of a node field.
+
+        The hash covers both the embedded text and the model, so an item only
+        needs to be re-embedded when either of them changes.
+        """
+        embed_str = self._embed_str(node, field)
+        return SysUtil.content_hash(f"{self.iModel_name}\n{embed_str}")
 
     async def embed_node(self, node, field="content", **kwargs) -> bool:
         """
         if not specify field, we embed node.content
         """
-        if not isinstance(node, Component):
-            raise ValueError("Node must a lionagi item")
-        embed_str = getattr(node, field)
+        await self.embed_nodes([node], field=field, **kwargs)
 
-        if isinstance(embed_str, dict) and "images" in embed_str:
-            embed_str.pop("images", None)
-            embed_str.pop("image_detail", None)
+    async def embed_nodes(self, nodes, field="content", **kwargs):
+        """
+        Embeds several nodes with a single request.
+
+        Args:
+            nodes (list): The nodes to embed.
+            field (str): The field to embed. Default is "content".
+            **kwargs: Additional parameters for the service call.
+
+        Raises:
+            ModelLimitExceededError: If the request exceeds the token limit.
+        """
+        for node in nodes:
+            if not isinstance(node, Component):
+                raise ValueError("Node must a lionagi item")
+        embed_strs = [self._embed_str(node, field) for node in nodes]
 
         num_tokens = APIUtil.calculate_num_token(
-            {"input": str(embed_str) if isinstance(embed_str, dict) else embed_str},
+            {"input": embed_strs},
             "embeddings",
             self.endpoint_schema["token_encoding_name"],
         )
@@ -317,10 +461,24 @@ class iModel:
                 f"Number of tokens {num_tokens} exceeds the limit {self.token_limit}"
             )
 
-        payload, embed = await self.call_embedding(embed_str, **kwargs)
+        embed_input = embed_strs[0] if len(embed_strs) == 1 else embed_strs
+        payload, embed = await self.call_embedding(
+            embed_input, required_tokens=num_tokens, **kwargs
+        )
         payload.pop("input")
-        node.add_field("embedding", embed["data"][0]["embedding"])
-        node._meta_insert("embedding_meta", payload)
+
+        data = sorted(embed["data"], key=lambda x: x.get("index", 0))
+        for node, embed_str, item in zip(nodes, embed_strs, data):
+            node.add_field("embedding", item["embedding"])
+            node._meta_insert(
+                "embedding_meta",
+                {
+                    **payload,
+                    "content_hash": SysUtil.content_hash(
+                        f"{self.iModel_name}\n{embed_str}"
+                    ),
+                },
+            )
 
     def to_dict(self):
         """
@@ -417,3 +575,19 @@ class iModel:
             "logprobs": logprobs,
             "perplexity": np.exp(np.mean(logprobs)),
         }
+
+
+async def _completion_as_stream(completion):
+    """Yields a complete chat completion as a single streamed chunk."""
+    if not completion:
+        return
+    chunk = {k: v for k, v in completion.items() if k != "choices"}
+    chunk["choices"] = [
+        {
+            "index": choice.get("index", idx),
+            "delta": choice.get("message") or {},
+            "finish_reason": choice.get("finish_reason"),
+        }
+        for idx, choice in enumerate(completion.get("choices") or [])
+    ]
+    yield chunk
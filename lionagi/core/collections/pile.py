@@ -20,11 +20,15 @@ collections of Element objects. It supports structured access and
 manipulation, including retrieval, addition, and deletion of elements.
 """
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from pathlib import Path
 from typing import TypeVar, Type, Any, Generic
 
-from pydantic import Field, field_validator
+import numpy as np
+from pydantic import Field, PrivateAttr, field_serializer, field_validator
 
+from lionagi.libs.ln_api import APIUtil
 from lionagi.libs.ln_convert import is_same_dtype, to_df
 from lionagi.libs.ln_func_call import bcall, alcall, CallDecorator as cd
 from .abc import (
@@ -41,6 +45,8 @@ from .abc import (
 )
 from .model import iModel
 from .util import to_list_type, _validate_order
+from ._index import INDEX_TYPES, FieldIndex, SortedIndex, resolve_field
+from ._embedding import EmbeddingStore
 
 T = TypeVar("T")
 
@@ -58,6 +64,10 @@ class Pile(Element, Record, Generic[T]):
         name (str | None): Optional name for the pile.
         order (list[str]): Order of item identifiers.
         use_obj (bool): If True, treat Record and Ordering as objects.
+        field_indexes (dict[str, FieldIndex]): Secondary indexes by field,
+            kept in sync as items are added and removed.
+        embedding_store (EmbeddingStore | None): Matrix of the item
+            embeddings used by `similarity_search`, kept in sync likewise.
     """
 
     use_obj: bool = False
@@ -69,6 +79,11 @@ class Pile(Element, Record, Generic[T]):
     engines: dict[str, Any] = Field(default_factory=dict)
     query_response: list = []
     tools: dict = {}
+    field_indexes: dict[str, Any] = Field(default_factory=dict, exclude=True)
+    embedding_store: Any = Field(default=None, exclude=True)
+
+    # number of items replaced by another object under the same id
+    _replacements: int = PrivateAttr(0)
 
     def __init__(
         self,
@@ -104,7 +119,8 @@ class Pile(Element, Record, Generic[T]):
 
         Returns:
             The requested item(s). Single items returned directly,
-            multiple items returned in a new `Pile` instance.
+            multiple items returned in a read-only `PileView` that shares
+            this pile's items and is copied on write.
 
         Raises:
             ItemNotFoundError: If requested item(s) not found.
@@ -115,8 +131,9 @@ class Pile(Element, Record, Generic[T]):
                 # Handle list-like index or slice
                 _key = self.order[key]
                 _key = [_key] if isinstance(key, int) else _key
-                _out = [self.pile.get(i) for i in _key]
-                return _out[0] if len(_out) == 1 else pile(_out, self.item_type, _key)
+                if len(_key) == 1:
+                    return self.pile.get(_key[0])
+                return self._view(_key)
         except IndexError as e:
             raise ItemNotFoundError(key) from e
 
@@ -131,12 +148,24 @@ class Pile(Element, Record, Generic[T]):
         if not all(keys):
             raise LionTypeError("Invalid item type. Expected LionIDable object(s).")
 
-        try:
-            if len(keys) == 1:
-                return self.pile.get(keys[0])
-            return pile([self.pile.get(i) for i in keys], self.item_type, keys)
-        except KeyError as e:
-            raise ItemNotFoundError(key) from e
+        if len(keys) == 1:
+            return self.pile.get(keys[0])
+        for i in keys:
+            if i not in self.pile:
+                raise ItemNotFoundError(i)
+        return self._view(keys)
+
+    def _view(self, keys: list[str]) -> "PileView[T]":
+        """Create a read-only view over the given keys of this pile."""
+        source = self.pile
+        if isinstance(source, _PileWindow):
+            source = source.source
+        return PileView.model_construct(
+            use_obj=self.use_obj,
+            pile=_PileWindow(source, list(keys)),
+            item_type=self.item_type,
+            order=list(keys),
+        )
 
     def __setitem__(self, key, item) -> None:
         """
@@ -170,6 +199,7 @@ class Pile(Element, Record, Generic[T]):
                     "The length of values does not match the length of the slice"
                 )
 
+            self._count_replaced(item)
             for k, v in item.items():
                 if self.item_type and type(v) not in self.item_type:
                     raise LionTypeError(f"Invalid item type. Expected {self.item_type}")
@@ -177,13 +207,19 @@ class Pile(Element, Record, Generic[T]):
                 self.pile[k] = v
                 self.order[key] = k
                 self.pile.pop(_key)
+            self._index_remove(i for i in to_list_type(_key) if i not in self.pile)
+            self._index_add(item)
             return
 
         if len(to_list_type(key)) != len(item):
             raise ValueError("The length of keys does not match the length of values")
 
+        self._count_replaced(item)
+        replaced = [k for k in item if k in self.pile]
+        self._index_remove(replaced)
+        self.order.extend([k for k in item if k not in self.pile])
         self.pile.update(item)
-        self.order.extend(item.keys())
+        self._index_add(item)
 
     def __contains__(self, item: Any) -> bool:
         """
@@ -243,6 +279,7 @@ class Pile(Element, Record, Generic[T]):
             _id = get_lion_id(i)
             items.append(self.pile.pop(_id))
             self.order.remove(_id)
+            self._index_remove([_id])
 
         return pile(items) if len(items) > 1 else items[0]
 
@@ -290,6 +327,10 @@ class Pile(Element, Record, Generic[T]):
         """Clear all items, resetting pile to empty state."""
         self.pile.clear()
         self.order.clear()
+        for index in self.field_indexes.values():
+            index.clear()
+        if self.embedding_store is not None:
+            self.embedding_store.clear()
 
     def include(self, item: Any) -> bool:
         """
@@ -464,9 +505,11 @@ class Pile(Element, Record, Generic[T]):
         if not isinstance(index, int):
             raise ValueError("Index must be an integer for pile insertion.")
         item = self._validate_pile(item)
+        self._count_replaced(item)
         for k, v in item.items():
             self.order.insert(index, k)
             self.pile[k] = v
+        self._index_add(item)
 
     def append(self, item: T):
         """
@@ -479,8 +522,10 @@ class Pile(Element, Record, Generic[T]):
         Args:
             item: Item to append. Can be any object, including `Pile`.
         """
+        self._count_replaced({item.ln_id: item})
         self.pile[item.ln_id] = item
         self.order.append(item.ln_id)
+        self._index_add({item.ln_id: item})
 
     def keys(self):
         """Yield the keys of the items in the pile."""
@@ -499,6 +544,209 @@ class Pile(Element, Record, Generic[T]):
         """
         yield from ((i, self.pile.get(i)) for i in self.order)
 
+    def create_field_index(self, field: str, index_type: str = "hash") -> FieldIndex:
+        """
+        Create a secondary index over a field of the items.
+
+        The index is built from the current items and then maintained
+        incrementally as items are added or removed. Items mutated in place
+        must be re-indexed with `reindex`.
+
+        Args:
+            field: Dotted path of the field, e.g. "class_name", "timestamp"
+                or "metadata.source".
+            index_type: "hash" for equality lookups, "sorted" for range
+                lookups (and equality).
+
+        Returns:
+            The created index.
+
+        Raises:
+            ValueError: If an invalid index type is provided.
+        """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Invalid index type {index_type}. "
+                f"Expected one of {list(INDEX_TYPES)}"
+            )
+        index = INDEX_TYPES[index_type](field)
+        for k, v in self.pile.items():
+            index.add(k, v)
+        self.field_indexes[field] = index
+        return index
+
+    def drop_field_index(self, field: str) -> bool:
+        """Drop the secondary index over a field, return whether it existed."""
+        return self.field_indexes.pop(field, None) is not None
+
+    def reindex(self, item: Any = None) -> None:
+        """
+        Refresh the secondary indexes and the embedding store after items
+        were mutated in place.
+
+        Args:
+            item: Item(s) to refresh. If not provided, all indexes are rebuilt.
+        """
+        if item is None:
+            for index in self.field_indexes.values():
+                index.clear()
+            if self.embedding_store is not None:
+                self.embedding_store.clear()
+            self._index_add(self.pile)
+            return
+        ids = [get_lion_id(i) for i in to_list_type(item)]
+        self._index_add({i: self.pile[i] for i in ids if i in self.pile})
+
+    def find(self, field: str, value: Any) -> "PileView[T]":
+        """
+        Find the items whose field equals a value.
+
+        Uses the index over the field if there is one, else scans the pile.
+
+        Args:
+            field: Dotted path of the field.
+            value: The value to match.
+
+        Returns:
+            A view over the matching items.
+        """
+        if field in self.field_indexes:
+            return self._view(self.field_indexes[field].get(value))
+        return self._view(
+            [k for k, v in self.items() if resolve_field(v, field) == value]
+        )
+
+    def find_range(
+        self,
+        field: str,
+        lower: Any = None,
+        upper: Any = None,
+        inclusive: bool = True,
+    ) -> "PileView[T]":
+        """
+        Find the items whose field lies within a range.
+
+        Uses the sorted index over the field if there is one, else scans the
+        pile. Items whose field is missing never match.
+
+        Args:
+            field: Dotted path of the field.
+            lower: The lower bound, None for no lower bound.
+            upper: The upper bound, None for no upper bound.
+            inclusive: Whether the bounds themselves are included.
+
+        Returns:
+            A view over the matching items, sorted by the value of the field.
+        """
+        index = self.field_indexes.get(field)
+        if isinstance(index, SortedIndex):
+            return self._view(index.range(lower, upper, inclusive))
+
+        index = SortedIndex(field)
+        for k, v in self.items():
+            index.add(k, v)
+        return self._view(index.range(lower, upper, inclusive))
+
+    def create_embedding_store(self) -> EmbeddingStore:
+        """
+        Collect the item embeddings into a float32 matrix.
+
+        The store is then maintained incrementally as items are added or
+        removed, and used by `similarity_search`. Items without an embedding
+        are left out.
+
+        Returns:
+            The created store.
+        """
+        self.embedding_store = EmbeddingStore()
+        self._index_add(self.pile)
+        return self.embedding_store
+
+    def similarity_search(
+        self, query: Any, k: int = 5, metric: str = "cosine"
+    ) -> list[tuple[T, float]] | list[list[tuple[T, float]]]:
+        """
+        Find the items whose embeddings are most similar to the query.
+
+        Args:
+            query: A query embedding, or a list of query embeddings to search
+                in one batch.
+            k: The number of items to return per query.
+            metric: "cosine" or "dot".
+
+        Returns:
+            (item, score) pairs by decreasing score, one list per query when
+            several queries are given.
+        """
+        if self.embedding_store is None:
+            self.create_embedding_store()
+        results = self.embedding_store.search(query, k=k, metric=metric)
+        results = [[(self.pile[i], score) for i, score in r] for r in results]
+        return results[0] if np.ndim(query) == 1 else results
+
+    def save_embeddings(self, file_name) -> Path:
+        """
+        Save the embedding store as an .npy file.
+
+        Args:
+            file_name: The target path, e.g. the pile's csv file; its suffix
+                is replaced by ".npy".
+
+        Returns:
+            The path of the saved matrix.
+        """
+        if self.embedding_store is None:
+            self.create_embedding_store()
+        return self.embedding_store.save(file_name)
+
+    def load_embeddings(self, file_name) -> EmbeddingStore:
+        """
+        Load an embedding store saved with `save_embeddings`.
+
+        Rows of items that are not in the pile are dropped.
+
+        Args:
+            file_name: The path given to `save_embeddings`.
+
+        Returns:
+            The loaded store.
+        """
+        store = EmbeddingStore.load(file_name)
+        for i in store.ids:
+            if i not in self.pile:
+                store.remove(i)
+        self.embedding_store = store
+        return store
+
+    def _count_replaced(self, items: Mapping) -> None:
+        for k, v in items.items():
+            old = self.pile.get(k)
+            if old is not None and old is not v:
+                self._replacements += 1
+
+    def _index_add(self, items: Mapping) -> None:
+        for index in self.field_indexes.values():
+            for k, v in items.items():
+                index.add(k, v)
+        if self.embedding_store is not None:
+            embedded = {}
+            for k, v in items.items():
+                if getattr(v, "embedding", None):
+                    embedded[k] = v.embedding
+                else:
+                    self.embedding_store.remove(k)
+            self.embedding_store.add_many(list(embedded), list(embedded.values()))
+
+    def _index_remove(self, ids: Iterable[str]) -> None:
+        if self.field_indexes or self.embedding_store is not None:
+            ids = list(ids)
+            for index in self.field_indexes.values():
+                for i in ids:
+                    index.remove(i)
+            if self.embedding_store is not None:
+                for i in ids:
+                    self.embedding_store.remove(i)
+
     @field_validator("order", mode="before")
     def _validate_order(cls, value):
         return _validate_order(value)
@@ -703,16 +951,33 @@ class Pile(Element, Record, Generic[T]):
         return str(response)
 
     async def embed_pile(
-        self, imodel=None, field="content", embed_kwargs={}, verbose=True, **kwargs
+        self,
+        imodel=None,
+        field="content",
+        embed_kwargs={},
+        verbose=True,
+        batch_size=100,
+        batch_tokens=None,
+        **kwargs,
     ):
         """
         Embed the items in the pile.
 
+        Items are grouped into batches of at most `batch_size` inputs and
+        `batch_tokens` tokens, each embedded with a single request; the
+        batches run concurrently through the model's rate limiter. Items whose
+        text and model match an existing embedding (by content hash) are not
+        sent again, and identical texts are only embedded once.
+
         Args:
             imodel: The embedding model to use.
             field (str): The field to embed. Default is "content".
             embed_kwargs (dict): Additional keyword arguments for the embedding.
             verbose (bool): Whether to print verbose messages. Default is True.
+            batch_size (int): The maximum number of inputs per request.
+                Default is 100.
+            batch_tokens (int): The maximum number of tokens per request.
+                Defaults to the token limit of the model.
             **kwargs: Additional keyword arguments for the embedding.
 
         Raises:
@@ -723,18 +988,69 @@ class Pile(Element, Record, Generic[T]):
         imodel = imodel or iModel(endpoint="embeddings", **kwargs)
 
         max_concurrency = kwargs.get("max_concurrency", None) or 100
+        batch_tokens = batch_tokens or imodel.token_limit
+        encoding_name = imodel.endpoint_schema.get("token_encoding_name", None)
+
+        # group the items still to embed by content hash
+        embedded, pending = {}, {}
+        for item in self:
+            content_hash = imodel.embedding_hash(item, field)
+            if (
+                item.embedding
+                and item._meta_get(["embedding_meta", "content_hash"], None)
+                == content_hash
+            ):
+                embedded.setdefault(content_hash, item)
+            else:
+                pending.setdefault(content_hash, []).append(item)
+
+        def _share(source, items):
+            for i in items:
+                if i is not source:
+                    i.add_field("embedding", list(source.embedding))
+                    i._meta_insert(
+                        "embedding_meta", dict(source.metadata["embedding_meta"])
+                    )
 
-        @cd.max_concurrency(max_concurrency)
-        async def _embed_item(item):
+        batches, batch, tokens = [], [], 0
+        for content_hash, items in pending.items():
+            if content_hash in embedded:
+                _share(embedded[content_hash], items)
+                continue
+
+            text = imodel._embed_str(items[0], field)
+            num_tokens = APIUtil.count_tokens(text, encoding_name)
+            if batch and (
+                len(batch) >= batch_size or tokens + num_tokens > batch_tokens
+            ):
+                batches.append(tuple(batch))
+                batch, tokens = [], 0
+            batch.append(items)
+            tokens += num_tokens
+        if batch:
+            batches.append(tuple(batch))
+
+        async def _embed(batch):
             try:
-                return await imodel.embed_node(item, field=field, **embed_kwargs)
+                await imodel.embed_nodes([i[0] for i in batch], field, **embed_kwargs)
             except ModelLimitExceededError:
-                pass
-            return None
+                return False
+            for items in batch:
+                _share(items[0], items)
+            return True
 
-        await alcall(list(self), _embed_item)
+        @cd.max_concurrency(max_concurrency)
+        async def _embed_batch(batch):
+            if not await _embed(batch) and len(batch) > 1:
+                # an oversized input fails alone, not its whole batch
+                for items in batch:
+                    await _embed([items])
+
+        await alcall(batches, _embed_batch)
+        if self.embedding_store is not None:
+            self.reindex(list(self))
 
-        a = len([i for i in self if "embedding" in i._all_fields])
+        a = len([i for i in self if i.embedding])
         if len(self) > a and verbose:
             print(
                 f"Successfully embedded {a}/{len(self)} items, Failed to embed {len(self) - a}/{len(self)} items"
@@ -873,6 +1189,119 @@ class Pile(Element, Record, Generic[T]):
         return self.to_df().__repr__()
 
 
+class _PileWindow(Mapping):
+    """A read-only mapping exposing the given keys of a source dict."""
+
+    __slots__ = ("source", "_keys", "_key_set")
+
+    def __init__(self, source: dict, keys: list[str]):
+        self.source = source
+        self._keys = keys
+        self._key_set = None
+
+    def __contains__(self, key) -> bool:
+        if self._key_set is None:
+            self._key_set = set(self._keys)
+        return key in self._key_set and key in self.source
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.source[key]
+
+    def __iter__(self):
+        return (k for k in self._keys if k in self.source)
+
+    def __len__(self) -> int:
+        return sum(1 for k in self._keys if k in self.source)
+
+    def __copy__(self):
+        return _PileWindow(self.source, self._keys)
+
+    def __deepcopy__(self, memo):
+        # a deep copy only owns the items inside the window
+        return {k: deepcopy(v, memo) for k, v in self.items()}
+
+
+class PileView(Pile[T]):
+    """
+    Read-only window over the items of another pile.
+
+    Returned when slicing a pile or looking up several keys at once. The
+    view shares the parent's item dict and only stores the ids in its
+    window, so creating one does not re-validate or copy any item.
+
+    The first mutation of a view copies its window into a dict of its own
+    (copy on write); from then on it behaves as an independent `Pile`, and
+    the parent is never modified through it.
+    """
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the view owns its items after a copy on write."""
+        return not isinstance(self.pile, _PileWindow)
+
+    def _materialize(self) -> None:
+        if isinstance(self.pile, _PileWindow):
+            self.pile = dict(self.pile.items())
+            self.order = list(self.pile)
+
+    def _live_order(self) -> list[str]:
+        """Drop the ids of items removed from the parent since the view was made."""
+        if isinstance(self.pile, _PileWindow) and len(self.order) != len(self.pile):
+            self.order = list(self.pile)
+        return self.order
+
+    def __getitem__(self, key) -> T | Pile[T]:
+        self._live_order()
+        return super().__getitem__(key)
+
+    def keys(self):
+        return self._live_order()
+
+    def values(self):
+        self._live_order()
+        yield from super().values()
+
+    def items(self):
+        self._live_order()
+        yield from super().items()
+
+    def to_pile(self) -> Pile[T]:
+        """Return an independent `Pile` holding the items of the view."""
+        items = dict(self.pile.items())
+        return Pile.model_construct(
+            use_obj=self.use_obj,
+            pile=items,
+            item_type=self.item_type,
+            order=list(items),
+        )
+
+    def __setitem__(self, key, item) -> None:
+        self._materialize()
+        super().__setitem__(key, item)
+
+    def pop(self, key: Any, default=...) -> T | Pile[T] | None:
+        self._materialize()
+        return super().pop(key, default)
+
+    def clear(self):
+        self._materialize()
+        super().clear()
+
+    def insert(self, index, item):
+        self._materialize()
+        super().insert(index, item)
+
+    def append(self, item: T):
+        self._materialize()
+        super().append(item)
+
+    @field_serializer("pile")
+    def _serialize_pile(self, value) -> dict[str, Any]:
+        return dict(value.items())
+
+
 def pile(
     items: Iterable[T] | None = None,
     item_type: set[Type] | None = None,
@@ -15,12 +15,229 @@ limitations under the License.
 """
 
 import contextlib
-from lionagi.libs import SysUtil
-from pydantic import Field, field_validator
+import itertools
+from collections import Counter, OrderedDict, deque
+from collections.abc import MutableSequence
+
+from pydantic import ConfigDict, Field, field_serializer, field_validator
 from .abc import Ordering, get_lion_id, ItemNotFoundError, LionIDable, Element
 from .util import _validate_order
 
 
+class OrderIndex(MutableSequence):
+    """
+    A list-like sequence of lion ids backed by an ordered dict.
+
+    Every entry lives in a slot of an ``OrderedDict``, and each id keeps a
+    deque of its slots in positional order. Appending or popping at either
+    end, membership tests and removing the first occurrence of an id are
+    O(1); positional access away from the ends is O(n), as with a deque.
+    Compares equal to a list with the same items.
+
+    Copies are O(1): they share their storage with the original until
+    either of them is mutated, which then copies it (copy on write).
+
+    `edits` counts the mutations other than appends at the right end, so
+    a reader that saw a prefix of the sequence can tell whether it still
+    holds by comparing this count.
+    """
+
+    __slots__ = ("_slots", "_positions", "_counter", "_shared", "edits")
+
+    def __init__(self, items=()):
+        self._slots: OrderedDict = OrderedDict()
+        self._positions: dict[str, deque] = {}
+        self._counter = itertools.count()
+        self._shared = False
+        self.edits = 0
+        self.extend(items)
+
+    def _own(self) -> None:
+        """Copies storage shared with other copies before a mutation."""
+        if self._shared:
+            items = list(self._slots.values())
+            self._slots, self._positions = OrderedDict(), {}
+            self._counter = itertools.count()
+            self._shared = False
+            for item in items:
+                self._add(item)
+
+    def _add(self, item, left: bool = False) -> None:
+        self._own()
+        slot = next(self._counter)
+        self._slots[slot] = item
+        if left:
+            self.edits += 1
+            self._slots.move_to_end(slot, last=False)
+            self._positions.setdefault(item, deque()).appendleft(slot)
+        else:
+            self._positions.setdefault(item, deque()).append(slot)
+
+    def _forget(self, item, slot=None) -> None:
+        self.edits += 1
+        positions = self._positions[item]
+        if slot is None or positions[0] == slot:
+            positions.popleft()
+        elif positions[-1] == slot:
+            positions.pop()
+        else:
+            positions.remove(slot)
+        if not positions:
+            del self._positions[item]
+
+    def _slot_at(self, index: int):
+        size = len(self._slots)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("OrderIndex index out of range")
+        if index == 0:
+            return next(iter(self._slots))
+        if index == size - 1:
+            return next(reversed(self._slots))
+        if index < size // 2:
+            return next(itertools.islice(self._slots, index, None))
+        return next(itertools.islice(reversed(self._slots), size - 1 - index, None))
+
+    def _rebuild(self, items) -> None:
+        self.edits += 1
+        self._own()
+        self._slots.clear()
+        self._positions.clear()
+        self.extend(items)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __iter__(self):
+        return iter(self._slots.values())
+
+    def __reversed__(self):
+        return reversed(self._slots.values())
+
+    def __contains__(self, item):
+        try:
+            return item in self._positions
+        except TypeError:
+            return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._slots[self._slot_at(index)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = value
+            self._rebuild(items)
+            return
+        self._own()
+        self._slots[self._slot_at(index)] = value
+        self._rebuild(list(self))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._rebuild(items)
+            return
+        self._own()
+        slot = self._slot_at(index)
+        self._forget(self._slots.pop(slot), slot)
+
+    def __eq__(self, other):
+        if isinstance(other, (OrderIndex, list, tuple, deque)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return OrderIndex, (list(self),)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # ids are immutable strings, so sharing them is a deep copy
+        return self.copy()
+
+    def insert(self, index, value):
+        size = len(self)
+        if index < 0:
+            index = max(index + size, 0)
+        if index == 0:
+            self._add(value, left=True)
+        elif index >= size:
+            self._add(value)
+        else:
+            items = list(self)
+            items.insert(index, value)
+            self._rebuild(items)
+
+    def append(self, value):
+        self._add(value)
+
+    def appendleft(self, value):
+        self._add(value, left=True)
+
+    def extend(self, values):
+        if values is self:
+            values = list(values)
+        for value in values:
+            self._add(value)
+
+    def pop(self, index=-1):
+        if not self._slots:
+            raise IndexError("pop from empty OrderIndex")
+        self._own()
+        if index == -1:
+            slot, item = self._slots.popitem(last=True)
+        elif index == 0:
+            slot, item = self._slots.popitem(last=False)
+        else:
+            slot = self._slot_at(index)
+            item = self._slots.pop(slot)
+        self._forget(item, slot)
+        return item
+
+    def popleft(self):
+        return self.pop(0)
+
+    def remove(self, value):
+        """Remove the first occurrence of a value."""
+        if value not in self:
+            raise ValueError(f"{value} is not in OrderIndex")
+        self._own()
+        slot = self._positions[value][0]
+        del self._slots[slot]
+        self._forget(value, slot)
+
+    def count(self, value):
+        return len(self._positions.get(value, ())) if value in self else 0
+
+    def clear(self):
+        self.edits += 1
+        if self._shared:
+            self._slots, self._positions = OrderedDict(), {}
+            self._shared = False
+            return
+        self._slots.clear()
+        self._positions.clear()
+
+    def copy(self):
+        new = OrderIndex.__new__(OrderIndex)
+        new._slots, new._positions = self._slots, self._positions
+        new._counter = self._counter
+        new.edits = 0
+        new._shared = self._shared = True
+        return new
+
+
 class Progression(Element, Ordering):
 
     name: str | None = Field(
@@ -28,8 +245,10 @@ class Progression(Element, Ordering):
         title="Name",
         description="The name of the progression.",
     )
+    model_config = ConfigDict(validate_assignment=True)
+
     order: list = Field(
-        default_factory=list,
+        default_factory=OrderIndex,
         title="Order",
         description="The order of the progression.",
     )
@@ -39,16 +258,25 @@ class Progression(Element, Ordering):
         """Validate and convert the order field."""
         return _validate_order(value)
 
+    @field_validator("order", mode="after")
+    def _index_order(cls, value) -> OrderIndex:
+        """Store the validated order in an indexed backing sequence."""
+        return OrderIndex(value)
+
+    @field_serializer("order")
+    def _serialize_order(self, value) -> list[str]:
+        return list(value)
+
     def __contains__(self, item):
         """Check if an item or items are in the progression."""
         if not item:
             return False
         if isinstance(item, Progression):
-            return all([i in self.order for i in item.order])
+            return all(i in self.order for i in item.order)
         if isinstance(item, LionIDable) and len(a := get_lion_id(item)) == 32:
             return a in self.order
         item = self._validate_order(item)
-        return all([i in self.order for i in item])
+        return all(i in self.order for i in item)
 
     def __len__(self):
         return len(self.order)
@@ -67,8 +295,8 @@ class Progression(Element, Ordering):
         return len(self)
 
     def copy(self):
-        """create a deep copy"""
-        return self.model_copy()
+        """create a copy whose order is copied on write"""
+        return self.model_copy(update={"order": self.order.copy()})
 
     def append(self, item):
         """Append an item to the end of the progression."""
@@ -104,12 +332,12 @@ class Progression(Element, Ordering):
         """Remove the next occurrence of an item from the progression."""
         if item in self:
             item = self._validate_order(item)
-            l_ = SysUtil.create_copy(self.order)
-
-            with contextlib.suppress(Exception):
+            # remove all or nothing
+            if all(
+                self.order.count(i) >= n for i, n in Counter(item).items()
+            ):
                 for i in item:
-                    l_.remove(i)
-                self.order = l_
+                    self.order.remove(i)
                 return
 
         raise ItemNotFoundError(f"{item}")
@@ -120,14 +348,14 @@ class Progression(Element, Ordering):
     def popleft(self):
         """Remove and return the leftmost item from the progression."""
         try:
-            return self.order.pop(0)
+            return self.order.popleft()
         except IndexError as e:
             raise ItemNotFoundError("None") from e
 
     def pop(self, index=None):
         """Remove and return an item from the progression."""
         try:
-            return self.order.pop(index)
+            return self.order.pop(-1 if index is None else index)
         except IndexError as e:
             raise ItemNotFoundError("None") from e
 
@@ -157,8 +385,8 @@ class Progression(Element, Ordering):
     def __radd__(self, other):
         if not isinstance(other, Progression):
             _copy = self.copy()
-            l_ = SysUtil.create_copy(_copy.order)
-            l_.insert(0, get_lion_id(other))
+            l_ = OrderIndex(_copy.order)
+            l_.appendleft(get_lion_id(other))
             _copy.order = l_
             return _copy
 
@@ -166,6 +394,9 @@ class Progression(Element, Ordering):
 
     def __setitem__(self, key, value):
         a = self._validate_order(value)
+        if not isinstance(key, slice):
+            idx = range(len(self.order))[key]
+            key = slice(idx, idx + 1)
         self.order[key] = a
 
     def __iadd__(self, other):
@@ -204,7 +435,7 @@ class Progression(Element, Ordering):
 
     def __list__(self):
         """Return a list representation of the progression."""
-        return SysUtil.create_copy(self.order)
+        return list(self.order)
 
     def __reversed__(self):
         """Return a reversed progression."""
@@ -212,11 +443,11 @@ class Progression(Element, Ordering):
 
     def clear(self):
         """Clear the progression."""
-        self.order = []
+        self.order.clear()
 
     def to_dict(self):
         """Return a dictionary representation of the progression."""
-        return {"order": self.order, "name": self.name}
+        return {"order": list(self.order), "name": self.name}
 
     def __bool__(self):
         return True
@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Generator
+from collections.abc import Mapping, Generator, MutableSequence
 from collections import deque
 
 from .abc import LionTypeError, Record, Ordering, Component, get_lion_id, Element
@@ -27,7 +27,7 @@ def to_list_type(value):
         return list(value.values())
     # if isinstance(value, Ordering):
     #     return list(value.order)
-    if isinstance(value, (tuple, list, set, Generator, deque)):
+    if isinstance(value, (tuple, list, set, Generator, deque, MutableSequence)):
         return list(value)
     return [value]
 
@@ -53,7 +53,7 @@ def _validate_order(value) -> list[str]:
     if isinstance(value, str) and len(value) == 32:
         return [value]
     elif isinstance(value, Ordering):
-        return value.order
+        return list(value.order)
 
     elif isinstance(value, Element):
         return [value.ln_id]
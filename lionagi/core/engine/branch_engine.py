@@ -1,5 +1,7 @@
+import asyncio
 import contextlib
-from lionagi.libs import convert, AsyncUtil, ParseUtil
+from pydantic import PrivateAttr
+from lionagi.libs import convert, ParseUtil
 from lionagi.core.generic.edge import Edge
 from lionagi.core.action import ActionNode
 from lionagi.core.mail.mail import Mail
@@ -11,6 +13,18 @@ from lionagi.core.executor.base_executor import BaseExecutor
 
 
 class BranchExecutor(Branch, BaseExecutor):
+    """
+    Runs the nodes a structure sends on a branch.
+
+    The nodes of a node list run concurrently on the branch, so their messages interleave; while any of them runs,
+    the nodes sent next run concurrently too. An end mail only stops the executor once no node is running and every
+    node run has been answered, as the structure ends each path of a node list separately.
+    """
+
+    # nodes running concurrently
+    _node_tasks: set = PrivateAttr(default_factory=set)
+    # nodes running or waiting for the structure's answer to their run
+    _open_paths: int = PrivateAttr(0)
 
     def __init__(
         self,
@@ -42,47 +56,112 @@ class BranchExecutor(Branch, BaseExecutor):
         """
         Forwards the execution by processing all pending incoming mails in each branch. Depending on the category of the mail,
         it processes starts, nodes, node lists, conditions, or ends, accordingly executing different functions.
+        Consecutive condition mails are checked concurrently.
         """
         for key in list(self.mailbox.pending_ins.keys()):
+            conditions = []
             while self.mailbox.pending_ins[key].size() > 0:
                 mail_id = self.mailbox.pending_ins[key].popleft()
                 mail = self.mailbox.pile.pop(mail_id)
+                if mail.category == "condition":
+                    conditions.append(self._process_condition(mail))
+                    continue
+                if conditions:
+                    await asyncio.gather(*conditions)
+                    conditions = []
+                if mail.category in ("node", "node_list", "end"):
+                    # answers the start mail or a node run
+                    self._open_paths = max(self._open_paths - 1, 0)
                 if mail.category == "start":
                     self._process_start(mail)
                 elif mail.category == "node":
-                    await self._process_node(mail)
+                    self._open_paths += 1
+                    if self._node_tasks:
+                        self._start_node(mail, mail.package.package)
+                    else:
+                        await self._process_node(mail)
                 elif mail.category == "node_list":
                     self._process_node_list(mail)
-                elif mail.category == "condition":
-                    await self._process_condition(mail)
                 elif mail.category == "end":
                     self._process_end(mail)
+            if conditions:
+                await asyncio.gather(*conditions)
             if self.mailbox.pending_ins[key].size() == 0:
                 self.mailbox.pending_ins.pop(key)
 
     async def execute(self, refresh_time=1) -> None:
         """
-        Executes the forward process repeatedly at specified time intervals until execution is instructed to stop.
+        Executes the forward process whenever mail arrives until execution is instructed to stop.
+
+        Args:
+            refresh_time (int): The maximum time in seconds to wait for incoming mail between calls to forward.
+        """
+        try:
+            while not self.execute_stop:
+                self._reap_nodes()
+                await self.forward()
+                if not self.execute_stop:
+                    await self._wait_for_work(refresh_time)
+        finally:
+            for task in self._node_tasks:
+                task.cancel()
+            if self._node_tasks:
+                await asyncio.gather(*self._node_tasks, return_exceptions=True)
+            self._node_tasks.clear()
+
+    async def _wait_for_work(self, refresh_time) -> None:
+        """
+        Waits until mail arrives or a running node finishes.
+
+        Args:
+            refresh_time (int): The maximum time in seconds to wait.
+        """
+        if not self._node_tasks:
+            await self.mailbox.wait_for_incoming(refresh_time)
+            return
+        incoming = asyncio.ensure_future(self.mailbox.wait_for_incoming(refresh_time))
+        try:
+            await asyncio.wait(
+                {incoming, *self._node_tasks}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            incoming.cancel()
+
+    def _start_node(self, mail: Mail, node) -> None:
+        """
+        Starts processing a node concurrently with the nodes already running.
 
         Args:
-            refresh_time (int): The interval, in seconds, at which the forward method is called repeatedly.
+            mail (Mail): The mail the node came in.
+            node (Node): The node to process.
+        """
+        self._node_tasks.add(asyncio.ensure_future(self._process_node(mail, node)))
+
+    def _reap_nodes(self) -> None:
+        """
+        Forgets the nodes that finished running.
+
+        Raises:
+            Exception: The exception a finished node raised.
         """
-        while not self.execute_stop:
-            await self.forward()
-            await AsyncUtil.sleep(refresh_time)
+        for task in [t for t in self._node_tasks if t.done()]:
+            self._node_tasks.discard(task)
+            task.result()
 
-    async def _process_node(self, mail: Mail):
+    async def _process_node(self, mail: Mail, node=None):
         """
         Processes a single node based on the node type specified in the mail's package. It handles different types of nodes such as System,
         Instruction, ActionNode, and generic nodes through separate processes.
 
         Args:
             mail (Mail): The mail containing the node to be processed along with associated details.
+            node (Node, optional): The node to process, when the mail holds a list of nodes. Defaults to the node the
+                mail holds.
 
         Raises:
             ValueError: If an invalid mail is encountered or the process encounters errors.
         """
-        node = mail.package.package
+        node = mail.package.package if node is None else node
         if isinstance(node, System):
             self._system_process(node, verbose=self.verbose)
             self.send(
@@ -123,17 +202,14 @@ class BranchExecutor(Branch, BaseExecutor):
 
     def _process_node_list(self, mail: Mail):
         """
-        Processes a list of nodes provided in the mail, but currently only sends an end signal as multiple path selection is not supported.
+        Starts processing the nodes of a node list concurrently.
 
         Args:
             mail (BaseMail): The mail containing a list of nodes to be processed.
-
-        Raises:
-            ValueError: When trying to process multiple paths which is currently unsupported.
         """
-        self.send(mail.sender, category="end", package="end", request_source=self.ln_id)
-        self.execute_stop = True
-        raise ValueError("Multiple path selection is not supported in BranchExecutor")
+        for node in mail.package.package:
+            self._open_paths += 1
+            self._start_node(mail, node)
 
     async def _process_condition(self, mail: Mail):
         """
@@ -310,6 +386,7 @@ class BranchExecutor(Branch, BaseExecutor):
         """
         start_mail_content = mail.package.package
         self.context = start_mail_content["context"]
+        self._open_paths += 1
         self.send(
             recipient=start_mail_content["structure_id"],
             category="start",
@@ -324,6 +401,9 @@ class BranchExecutor(Branch, BaseExecutor):
         Args:
             mail (BaseMail): The end mail to process.
         """
+        if self._open_paths:
+            # another path of a node list is still running
+            return
         self.execute_stop = True
         self.send(
             recipient=mail.sender,
@@ -142,13 +142,7 @@ class InstructionMapEngine(BaseExecutor):
             system = base_branch.system.clone() if base_branch.system else None
             if system:
                 system.sender = base_branch.ln_id
-            progress = progression()
-            messages = pile()
-
-            for id_ in base_branch.progress:
-                clone_message = base_branch.messages[id_].clone()
-                progress.append(clone_message.ln_id)
-                messages.append(clone_message)
+            messages, progress = base_branch._share_messages()
 
             branch = BranchExecutor(
                 verbose=self.verbose,
@@ -158,10 +152,8 @@ class InstructionMapEngine(BaseExecutor):
                 progress=progress,
                 imodel=base_branch.imodel,
             )
-            for message in branch.messages:
-                message.sender = base_branch.ln_id
-                message.recipient = branch.ln_id
-
+            branch._chat_messages = list(base_branch._chat_messages)
+            branch._share_from(base_branch)
             branch.context = shared_context
             branch.context_log = shared_context_log
             self.branches[branch.ln_id] = branch
@@ -194,11 +186,13 @@ class InstructionMapEngine(BaseExecutor):
 
     async def execute(self, refresh_time=1):
         """
-        Continuously executes the forward process at specified intervals until instructed to stop.
+        Continuously executes the forward process whenever mail arrives until instructed to stop.
 
         Args:
-            refresh_time (int): The time in seconds between execution cycles.
+            refresh_time (int): The maximum time in seconds to wait for incoming mail between execution cycles.
         """
         while not self.execute_stop:
             await self.forward()
-            await asyncio.sleep(refresh_time)
+            # mails sent by the branches during forward are already delivered
+            if not (self.execute_stop or self.mail_transfer.has_incoming):
+                await self.mailbox.wait_for_incoming(refresh_time)
@@ -1,7 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from lionagi.core.collections.abc import Element, Progressable, Executable
 from lionagi.core.collections import Exchange
@@ -36,6 +37,13 @@ class BaseExecutor(Element, Progressable, Executable, ABC):
         True, description="A flag indicating whether to provide verbose output."
     )
 
+    condition_timeout: float | None = Field(
+        None,
+        description="Seconds to wait for an executable to check an edge condition.",
+    )
+
+    _condition_requests: dict = PrivateAttr(default_factory=dict)
+
     def send(
         self, recipient: str, category: str, package: Any, request_source: str = None
     ) -> None:
@@ -58,6 +66,65 @@ class BaseExecutor(Element, Progressable, Executable, ABC):
         )
         self.mailbox.include(mail, "out")
 
+    async def request_condition(self, edge, executable_id: str, request_source: str):
+        """
+        Sends an edge to an executable to check its condition and waits for the
+        result.
+
+        The reply is taken out of the mailbox as soon as it arrives, so any
+        number of checks can wait at once without scanning the mailbox.
+
+        Args:
+            edge (Edge): The edge whose condition is checked.
+            executable_id (str): The ID of the executable checking the condition.
+            request_source (str): The source of the request.
+
+        Returns:
+            bool: The result of the condition check.
+
+        Raises:
+            asyncio.TimeoutError: If no result arrives within `condition_timeout`.
+        """
+        self.mailbox.subscribe(self._receive_condition, "in")
+        # the reply names the executable that checked the edge; checks of the
+        # same edge by the same executable are answered in the order asked
+        key = (edge.ln_id, executable_id)
+        future = asyncio.get_running_loop().create_future()
+        self._condition_requests.setdefault(key, []).append(future)
+        try:
+            self.send(
+                recipient=executable_id,
+                category="condition",
+                package=edge,
+                request_source=request_source,
+            )
+            return await asyncio.wait_for(future, self.condition_timeout)
+        finally:
+            waiting = self._condition_requests.get(key, [])
+            if future in waiting:
+                waiting.remove(future)
+            if not waiting:
+                self._condition_requests.pop(key, None)
+
+    def _receive_condition(self, mailbox: Exchange, mail: Mail) -> None:
+        """
+        Resolves the condition check a reply answers.
+
+        Args:
+            mailbox (Exchange): The mailbox the reply arrived in.
+            mail (Mail): The arriving mail.
+        """
+        if mail.category != "condition" or not isinstance(mail.package.package, dict):
+            return
+        reply = mail.package.package
+        waiting = self._condition_requests.get((reply["edge_id"], reply.get("from")))
+        future = next((f for f in waiting or () if not f.done()), None)
+        if future is None:
+            return
+        mailbox.pending_ins[mail.sender].exclude(mail)
+        mailbox.pile.pop(mail.ln_id)
+        future.set_result(reply["check_result"])
+
     @abstractmethod
     async def execute(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -1,6 +1,7 @@
+import asyncio
 from collections import deque
 
-from lionagi.libs import AsyncUtil, convert
+from lionagi.libs import convert
 
 from lionagi.core.generic.node import Node
 from lionagi.core.generic.edge import Edge
@@ -8,21 +9,24 @@ from lionagi.core.executor.base_executor import BaseExecutor
 
 from lionagi.core.action import Tool, DirectiveSelection, ActionNode
 
+from pydantic import PrivateAttr
+
 from lionagi.core.mail import Mail
 from lionagi.core.generic.graph import Graph
-from lionagi.core.collections.progression import progression
+from lionagi.core.executor.graph_scheduler import GraphScheduler
 
 
 class GraphExecutor(BaseExecutor, Graph):
     """
     Executes tasks within a graph structure, handling dynamic node flows and conditional edge logic.
 
-    Attributes:
-        condition_check_result (bool | None): Result of the last condition check performed during execution,
-            used to control flow based on dynamic conditions.
+    The conditions of the outgoing edges of a node are checked concurrently. Each run started by an executable is
+    scheduled by a `GraphScheduler`: every node whose predecessors have all run or been skipped is sent at once, as a
+    node list when there are several, and a node reached by several paths is sent once.
     """
 
-    condition_check_result: bool | None = None
+    # the scheduler of each run, by the ID of the executable that started it
+    _runs: dict = PrivateAttr(default_factory=dict)
 
     async def check_edge_condition(self, edge: Edge, executable_id, request_source):
         """
@@ -53,28 +57,6 @@ class GraphExecutor(BaseExecutor, Graph):
         else:
             raise ValueError("Invalid source_type.")
 
-    def _process_edge_condition(self, edge_id):
-        """
-        Process the condition of a edge.
-
-        Args:
-            edge_id (str): The ID of the edge.
-        """
-        for key in list(self.mailbox.pending_ins.keys()):
-            skipped_requests = progression()
-            while self.mailbox.pending_ins[key].size() > 0:
-                mail_id = self.mailbox.pending_ins[key].popleft()
-                mail = self.mailbox.pile[mail_id]
-                if (
-                    mail.category == "condition"
-                    and mail.package.package["edge_id"] == edge_id
-                ):
-                    self.mailbox.pile.pop(mail_id)
-                    self.condition_check_result = mail.package.package["check_result"]
-                else:
-                    skipped_requests.append(mail)
-            self.mailbox.pending_ins[key] = skipped_requests
-
     async def _check_executable_condition(
         self, edge: Edge, executable_id, request_source
     ):
@@ -89,19 +71,7 @@ class GraphExecutor(BaseExecutor, Graph):
         Returns:
             bool: The result of the condition check.
         """
-        self.send(
-            recipient=executable_id,
-            category="condition",
-            package=edge,
-            request_source=request_source,
-        )
-        while self.condition_check_result is None:
-            await AsyncUtil.sleep(0.1)
-            self._process_edge_condition(edge.ln_id)
-            continue
-        check_result = self.condition_check_result
-        self.condition_check_result = None
-        return check_result
+        return await self.request_condition(edge, executable_id, request_source)
 
     async def _handle_node_id(self, mail: Mail):
         """
@@ -118,6 +88,15 @@ class GraphExecutor(BaseExecutor, Graph):
             raise ValueError(
                 f"Node {mail.package.package}: Node does not exist in the structure {self.ln_id}"
             )
+        scheduler = self._runs.get(mail.sender)
+        if scheduler is not None:
+            await scheduler.finish(
+                mail.package.package,
+                lambda edge: self.check_edge_condition(
+                    edge, mail.sender, mail.package.request_source
+                ),
+            )
+            return self._take(mail.sender)
         return await self._next_node(
             self.internal_nodes[mail.package.package],
             mail.sender,
@@ -153,7 +132,8 @@ class GraphExecutor(BaseExecutor, Graph):
             ValueError: If the mail type is invalid for the current structure or an error occurs in handling the node ID.
         """
         if mail.category == "start":
-            return self.get_heads()
+            self._runs[mail.sender] = GraphScheduler(self, condition_target=self)
+            return self._take(mail.sender)
 
         elif mail.category == "end":
             self.execute_stop = True
@@ -174,6 +154,41 @@ class GraphExecutor(BaseExecutor, Graph):
         else:
             raise ValueError(f"Invalid mail type for structure")
 
+    def _take(self, executable_id) -> list[Node]:
+        """
+        Starts the nodes of a run that are ready, ending the run once every node has been run or skipped.
+
+        Args:
+            executable_id (str): The ID of the executable that started the run.
+
+        Returns:
+            list[Node]: The nodes to send to the executable.
+        """
+        scheduler = self._runs[executable_id]
+        next_nodes = [self._bundle(self.internal_nodes[i]) for i in scheduler.take()]
+        if scheduler.done:
+            self._runs.pop(executable_id)
+        return next_nodes
+
+    def _bundle(self, node: Node) -> Node:
+        """
+        Returns the node, or an action node combining it with the nodes bundled with it.
+
+        Args:
+            node (Node): The node.
+
+        Returns:
+            Node: The node to send to the executable.
+        """
+        further_edges = self.get_node_edges(node, direction="out")
+        bundled_nodes = deque()
+        for f_edge in convert.to_list(list(further_edges.values())):
+            if f_edge.bundle:
+                bundled_nodes.append(self.internal_nodes[f_edge.tail])
+        if bundled_nodes:
+            node = self.parse_bundled_to_action(node, bundled_nodes)
+        return node
+
     async def _next_node(self, current_node: Node, executable_id, request_source):
         """
         Get the next step nodes based on the current node.
@@ -187,24 +202,29 @@ class GraphExecutor(BaseExecutor, Graph):
         """
         next_nodes = []
         next_edges = self.get_node_edges(current_node, direction="out")
-        for edge in convert.to_list(list(next_edges.values())):
-            if edge.bundle:
+        edges = [
+            edge
+            for edge in convert.to_list(list(next_edges.values()))
+            if not edge.bundle
+        ]
+
+        async def _check(edge):
+            if not edge.condition:
+                return True
+            return await self.check_edge_condition(edge, executable_id, request_source)
+
+        tasks = [asyncio.ensure_future(_check(edge)) for edge in edges]
+        try:
+            checks = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        for edge, check in zip(edges, checks):
+            if not check:
                 continue
-            if edge.condition:
-                check = await self.check_edge_condition(
-                    edge, executable_id, request_source
-                )
-                if not check:
-                    continue
-            node = self.internal_nodes[edge.tail]
-            further_edges = self.get_node_edges(node, direction="out")
-            bundled_nodes = deque()
-            for f_edge in convert.to_list(list(further_edges.values())):
-                if f_edge.bundle:
-                    bundled_nodes.append(self.internal_nodes[f_edge.tail])
-            if bundled_nodes:
-                node = self.parse_bundled_to_action(node, bundled_nodes)
-            next_nodes.append(node)
+            next_nodes.append(self._bundle(self.internal_nodes[edge.tail]))
         return next_nodes
 
     def _send_mail(self, next_nodes: list | None, mail: Mail):
@@ -293,10 +313,10 @@ class GraphExecutor(BaseExecutor, Graph):
 
     async def execute(self, refresh_time=1):
         """
-        Executes the forward processing loop, checking conditions and processing nodes at defined intervals.
+        Executes the forward processing loop, processing nodes as soon as their mails arrive.
 
         Args:
-            refresh_time (int): The delay between execution cycles, allowing for asynchronous operations to complete.
+            refresh_time (int): The maximum time in seconds to wait for incoming mail between execution cycles.
 
         Raises:
             ValueError: If the graph structure is found to be cyclic, which is unsupported.
@@ -306,7 +326,8 @@ class GraphExecutor(BaseExecutor, Graph):
 
         while not self.execute_stop:
             await self.forward()
-            await AsyncUtil.sleep(refresh_time)
+            if not self.execute_stop:
+                await self.mailbox.wait_for_incoming(refresh_time)
 
     def to_excel(self, structure_name, dir="structure_storage"):
         """
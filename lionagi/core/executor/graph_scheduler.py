@@ -0,0 +1,247 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+This module contains the GraphScheduler class, which runs the nodes of a
+graph in topological order, running the nodes that are ready concurrently.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from lionagi.core.collections.abc import Actionable
+from lionagi.core.generic.graph import Graph
+from lionagi.core.generic.node import Node
+
+
+@dataclass(slots=True)
+class NodeTiming:
+    """When a node was waiting, started and finished, in `time.monotonic` seconds."""
+
+    ready: float
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def queue_wait(self) -> float | None:
+        """Seconds the node waited for a free slot once ready."""
+        return None if self.started is None else self.started - self.ready
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds the node ran."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class GraphScheduler:
+    """
+    Runs the nodes of a graph with Kahn's algorithm.
+
+    `run` runs the whole graph with a coroutine function. Executors driving
+    the nodes themselves call `take` for the nodes to start and `finish`
+    for each node once it has run.
+
+    A node is ready once every node of the graph with an edge to it has been
+    run or skipped. Ready nodes run concurrently, at most `max_concurrency`
+    at a time. When a node finishes, the conditions of its outgoing edges are
+    checked concurrently: a node runs if at least one of its incoming edges
+    holds, and is skipped if none does, which in turn resolves the edges
+    leaving it. Heads always run. Actionable nodes and bundled edges are not
+    scheduled; they belong to the node they are bundled with.
+
+    Attributes:
+        graph (Graph): The graph to run.
+        max_concurrency (int | None): The maximum number of nodes running at
+            once, unbounded if None.
+        condition_target (Any): The object edge conditions are checked
+            against. Defaults to the graph.
+        results (dict[str, Any]): The result of each node run, by node id.
+        skipped (set[str]): The ids of the nodes skipped by conditions.
+        timings (dict[str, NodeTiming]): The timing of each ready node.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        max_concurrency: int = None,
+        condition_target: Any = None,
+    ):
+        """
+        Initializes a new instance of GraphScheduler.
+
+        Args:
+            graph (Graph): The graph to run.
+            max_concurrency (int, optional): The maximum number of nodes
+                running at once. Defaults to no cap.
+            condition_target (Any, optional): The object edge conditions are
+                checked against. Defaults to the graph.
+
+        Raises:
+            ValueError: If the graph contains a cycle.
+        """
+        graph.topological_sort()
+        self.graph = graph
+        self.max_concurrency = max_concurrency
+        self.condition_target = graph if condition_target is None else condition_target
+        self.results: dict[str, Any] = {}
+        self.skipped: set[str] = set()
+        self.timings: dict[str, NodeTiming] = {}
+
+        self._edges: dict[str, list] = {}
+        self._waiting: dict[str, int] = {}
+        self._activated: set[str] = set()
+        self._running = 0
+        nodes = {
+            node.ln_id: node
+            for node in graph.internal_nodes
+            if not isinstance(node, Actionable)
+        }
+        for node in nodes.values():
+            self._edges[node.ln_id] = [
+                edge
+                for edge in graph.get_node_edges(node, "out") or []
+                if not edge.bundle and edge.tail in nodes
+            ]
+            self._waiting.setdefault(node.ln_id, 0)
+            for edge in self._edges[node.ln_id]:
+                self._waiting[edge.tail] = self._waiting.get(edge.tail, 0) + 1
+        self._ready = deque(i for i, n in self._waiting.items() if n == 0)
+        self._activated.update(self._ready)
+
+    def ready(self) -> list[str]:
+        """Return the ids of the nodes ready to run and not started yet."""
+        return list(self._ready)
+
+    @property
+    def done(self) -> bool:
+        """Whether every node has been run or skipped."""
+        return not self._ready and not self._running
+
+    def take(self) -> list[str]:
+        """
+        Starts the ready nodes, as many as `max_concurrency` allows.
+
+        Each node started must be passed to `finish` once it has run.
+
+        Returns:
+            list[str]: The ids of the nodes started.
+        """
+        now = time.monotonic()
+        for node_id in self._ready:
+            self.timings.setdefault(node_id, NodeTiming(ready=now))
+        started = []
+        while self._ready and (
+            not self.max_concurrency or self._running < self.max_concurrency
+        ):
+            node_id = self._ready.popleft()
+            self.timings[node_id].started = time.monotonic()
+            self._running += 1
+            started.append(node_id)
+        return started
+
+    async def finish(
+        self, node_id: str, check: Callable[[Any], Awaitable[bool]] = None
+    ) -> None:
+        """
+        Marks a started node as run and checks the conditions of its outgoing
+        edges concurrently, readying or skipping the nodes they complete.
+
+        Args:
+            node_id (str): The id of the node.
+            check (Callable, optional): The coroutine function checking the
+                condition of an edge, called with the edge. Defaults to
+                checking it against `condition_target`.
+
+        Raises:
+            ValueError: If the node is not running.
+        """
+        timing = self.timings.get(node_id)
+        if timing is None or timing.started is None or timing.finished is not None:
+            raise ValueError(f"Node {node_id} is not running")
+        timing.finished = time.monotonic()
+        self._running -= 1
+
+        check = check or (lambda edge: edge.check_condition(self.condition_target))
+
+        async def _holds(edge):
+            return not edge.condition or bool(await check(edge))
+
+        edges = self._edges[node_id]
+        checks = await asyncio.gather(*[_holds(edge) for edge in edges])
+        self._resolve(list(zip(edges, checks)))
+
+    async def _run_node(self, node_id: str, func: Callable) -> None:
+        try:
+            self.results[node_id] = await func(self.graph.internal_nodes[node_id])
+        except BaseException:
+            self.timings[node_id].finished = time.monotonic()
+            raise
+        await self.finish(node_id)
+
+    def _resolve(self, resolved: list[tuple]) -> None:
+        """Resolves edges, queuing or skipping the nodes they complete."""
+        stack = list(resolved)
+        while stack:
+            edge, holds = stack.pop()
+            tail = edge.tail
+            if holds:
+                self._activated.add(tail)
+            self._waiting[tail] -= 1
+            if self._waiting[tail]:
+                continue
+            if tail in self._activated:
+                self._ready.append(tail)
+            else:
+                self.skipped.add(tail)
+                stack.extend((e, False) for e in self._edges[tail])
+
+    async def run(self, func: Callable[[Node], Awaitable[Any]]) -> dict[str, Any]:
+        """
+        Runs every node of the graph, or skips it when its conditions fail.
+
+        Args:
+            func (Callable): The coroutine function running a node, called
+                with the node.
+
+        Returns:
+            dict[str, Any]: The result of each node run, by node id.
+
+        Raises:
+            Exception: The first exception raised by `func` or a condition,
+                after cancelling the nodes still running.
+        """
+        running: set[asyncio.Task] = set()
+        try:
+            while self._ready or running:
+                for node_id in self.take():
+                    running.add(asyncio.ensure_future(self._run_node(node_id, func)))
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    running.discard(task)
+                    task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        return self.results
@@ -11,9 +11,6 @@ from lionagi.core.engine.instruction_map_engine import InstructionMapEngine
 from lionagi.core.mail import Mail
 from lionagi.core.action import Tool, DirectiveSelection, ActionNode
 from lionagi.core.generic.edge import Edge
-from lionagi.core.collections.progression import progression
-
-from lionagi.libs import AsyncUtil
 
 
 class Neo4jExecutor(BaseExecutor):
@@ -26,7 +23,6 @@ class Neo4jExecutor(BaseExecutor):
         structure_name (str | None): Name of the structure being executed.
         middle_agents (list | None): List of agents operating within the structure.
         default_agent_executable (BaseExecutor): Default executor for running tasks not handled by specific agents.
-        condition_check_result (bool | None): Result of the last condition check performed during execution.
     """
 
     driver: Neo4j | None
@@ -34,7 +30,6 @@ class Neo4jExecutor(BaseExecutor):
     structure_name: str = None
     middle_agents: list | None = None
     default_agent_executable: BaseExecutor = InstructionMapEngine()
-    condition_check_result: bool | None = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -62,28 +57,6 @@ class Neo4jExecutor(BaseExecutor):
                 condition, executable_id, head, tail, request_source
             )
 
-    def _process_edge_condition(self, edge_id):
-        """
-        Process the condition of a edge.
-
-        Args:
-            edge_id (str): The ID of the edge.
-        """
-        for key in list(self.mailbox.pending_ins.keys()):
-            skipped_requests = progression()
-            while self.mailbox.pending_ins[key].size() > 0:
-                mail_id = self.mailbox.pending_ins[key].popleft()
-                mail = self.mailbox.pile[mail_id]
-                if (
-                    mail.category == "condition"
-                    and mail.package.package["edge_id"] == edge_id
-                ):
-                    self.mailbox.pile.pop(mail_id)
-                    self.condition_check_result = mail.package.package["check_result"]
-                else:
-                    skipped_requests.append(mail)
-            self.mailbox.pending_ins[key] = skipped_requests
-
     async def _check_executable_condition(
         self, condition, executable_id, head, tail, request_source
     ):
@@ -101,19 +74,7 @@ class Neo4jExecutor(BaseExecutor):
             bool: The result of the condition check.
         """
         edge = Edge(head=head, tail=tail, condition=condition)
-        self.send(
-            recipient=executable_id,
-            category="condition",
-            package=edge,
-            request_source=request_source,
-        )
-        while self.condition_check_result is None:
-            await AsyncUtil.sleep(0.1)
-            self._process_edge_condition(edge.ln_id)
-            continue
-        check_result = self.condition_check_result
-        self.condition_check_result = None
-        return check_result
+        return await self.request_condition(edge, executable_id, request_source)
 
     @staticmethod
     def parse_bundled_to_action(instruction, bundle_list):
@@ -374,11 +335,12 @@ class Neo4jExecutor(BaseExecutor):
 
     async def execute(self, refresh_time=1):
         """
-        Continuously executes the forward process at specified intervals until instructed to stop.
+        Continuously executes the forward process whenever mail arrives until instructed to stop.
 
         Args:
-            refresh_time (int): The time in seconds between execution cycles.
+            refresh_time (int): The maximum time in seconds to wait for incoming mail between execution cycles.
         """
         while not self.execute_stop:
             await self.forward()
-            await AsyncUtil.sleep(refresh_time)
+            if not self.execute_stop:
+                await self.mailbox.wait_for_incoming(refresh_time)
@@ -2,6 +2,8 @@ import contextlib
 from collections import deque
 from typing import Any
 
+from pydantic import PrivateAttr
+
 from lionagi.libs.ln_convert import to_list
 from lionagi.core.collections.abc import (
     Condition,
@@ -9,25 +11,67 @@ from lionagi.core.collections.abc import (
     LionTypeError,
     ItemNotFoundError,
     LionIDable,
+    get_lion_id,
 )
 from lionagi.core.collections import pile, Pile
+from lionagi.core.collections.util import to_list_type
 
 from lionagi.core.generic.edge import Edge
 from lionagi.core.generic.node import Node
 
 
 class Graph(Node):
-    """Represents a graph structure with nodes and edges."""
+    """
+    Represents a graph structure with nodes and edges.
+
+    The graph keeps a pile of the edges of its nodes and maps of the incoming
+    and outgoing edge ids of each node, updated as nodes and edges are added
+    and removed through the graph. Nodes related directly with `Node.relate`
+    after being added are indexed again when passed to `add_node`.
+    """
 
     internal_nodes: Pile = pile()
 
+    _edges: Pile = PrivateAttr(default_factory=pile)
+    _in: dict[str, set[str]] = PrivateAttr(default_factory=dict)
+    _out: dict[str, set[str]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        for node in self.internal_nodes:
+            self._index_node(node)
+
     @property
     def internal_edges(self) -> Pile[Edge]:
-        """Return a pile of all edges in the graph."""
-        return pile(
-            {edge.ln_id: edge for node in self.internal_nodes for edge in node.edges},
-            Edge,
-        )
+        """Return the pile of all edges in the graph, which must not be modified."""
+        return self._edges
+
+    def _index_edge(self, edge: Edge) -> None:
+        self._edges.include(edge)
+        self._out.setdefault(edge.head, set()).add(edge.ln_id)
+        self._in.setdefault(edge.tail, set()).add(edge.ln_id)
+
+    def _unindex_edge(self, edge_id: str) -> None:
+        edge = self._edges.pop(edge_id, None)
+        if edge is not None:
+            self._out.get(edge.head, set()).discard(edge_id)
+            self._in.get(edge.tail, set()).discard(edge_id)
+
+    def _index_node(self, node: Node) -> None:
+        """Index the current edges of a node, dropping the ones it lost."""
+        edges = {edge.ln_id: edge for edge in node.edges}
+        indexed = self._in.get(node.ln_id, set()) | self._out.get(node.ln_id, set())
+        for edge_id in indexed - edges.keys():
+            self._unindex_edge(edge_id)
+        for edge in edges.values():
+            self._index_edge(edge)
+
+    def _unindex_node(self, node: Node) -> None:
+        """Drop the edges of a removed node that no other node of the graph holds."""
+        for edge in node.edges:
+            other = edge.tail if edge.head == node.ln_id else edge.head
+            if other not in self.internal_nodes:
+                self._unindex_edge(edge.ln_id)
 
     def is_empty(self) -> bool:
         """Check if the graph is empty (has no nodes)."""
@@ -36,6 +80,9 @@ class Graph(Node):
     def clear(self):
         """Clear all nodes and edges from the graph."""
         self.internal_nodes.clear()
+        self._edges.clear()
+        self._in.clear()
+        self._out.clear()
 
     def add_edge(
         self,
@@ -56,7 +103,7 @@ class Graph(Node):
         self.internal_nodes.include(head)
         self.internal_nodes.include(tail)
 
-        head.relate(
+        edge = head.relate(
             tail,
             direction="out",
             condition=condition,
@@ -65,12 +112,13 @@ class Graph(Node):
             edge_class=edge_class,
             **kwargs,
         )
+        self._index_edge(edge)
 
     def remove_edge(self, edge: Any) -> bool:
         """Remove an edge from the graph."""
         edge = edge if isinstance(edge, list) else [edge]
         for i in edge:
-            if i not in self.internal_edges:
+            if i not in self._edges:
                 raise ItemNotFoundError(f"Edge {i} does not exist in structure.")
             with contextlib.suppress(ItemNotFoundError):
                 self._remove_edge(i)
@@ -78,6 +126,8 @@ class Graph(Node):
     def add_node(self, node: Any) -> None:
         """Add a node to the graph."""
         self.internal_nodes.update(node)
+        for i in to_list_type(node):
+            self._index_node(i)
 
     def get_node(self, item: LionIDable, default=...):
         """Get a node from the graph by its identifier."""
@@ -116,22 +166,27 @@ class Graph(Node):
 
     def pop_node(self, item, default=...):
         """Remove and return a node from the graph by its identifier."""
-        return self.internal_nodes.pop(item, default)
+        nodes = self.internal_nodes.pop(item, default)
+        if nodes is not default:
+            for node in to_list_type(nodes):
+                self._unindex_node(node)
+        return nodes
 
     def remove_node(self, item):
         """Remove a node from the graph by its identifier."""
-        return self.internal_nodes.remove(item)
+        self.pop_node(item)
 
     def _remove_edge(self, edge: Edge | str) -> bool:
         """Remove a specific edge from the graph."""
-        if edge not in self.internal_edges:
+        if edge not in self._edges:
             raise ItemNotFoundError(f"Edge {edge} does not exist in structure.")
 
-        edge = self.internal_edges[edge]
+        edge = self._edges[edge]
         head: Node = self.internal_nodes[edge.head]
         tail: Node = self.internal_nodes[edge.tail]
 
         head.unrelate(tail, edge=edge)
+        self._unindex_edge(edge.ln_id)
         return True
 
     def get_heads(self) -> Pile:
@@ -140,38 +195,54 @@ class Graph(Node):
             [
                 node
                 for node in self.internal_nodes
-                if node.relations["in"].is_empty() and not isinstance(node, Actionable)
+                if not self._in.get(node.ln_id) and not isinstance(node, Actionable)
             ]
         )
 
+    def get_successors(self, node: Node | str) -> list[str]:
+        """Return the ids of the nodes of the graph the node has edges to."""
+        tails = (self._edges[i].tail for i in self._out.get(get_lion_id(node), ()))
+        return [i for i in dict.fromkeys(tails) if i in self.internal_nodes]
+
+    def get_predecessors(self, node: Node | str) -> list[str]:
+        """Return the ids of the nodes of the graph with edges to the node."""
+        heads = (self._edges[i].head for i in self._in.get(get_lion_id(node), ()))
+        return [i for i in dict.fromkeys(heads) if i in self.internal_nodes]
+
+    def topological_sort(self) -> list[str]:
+        """
+        Return the node ids in an order where every node comes after its
+        predecessors, using Kahn's algorithm.
+
+        Raises:
+            ValueError: If the graph contains a cycle.
+        """
+        in_degree = {i: 0 for i in self.internal_nodes.keys()}
+        for node_id in in_degree:
+            for tail in self.get_successors(node_id):
+                in_degree[tail] += 1
+
+        ready = deque(i for i, d in in_degree.items() if d == 0)
+        order = []
+        while ready:
+            node_id = ready.popleft()
+            order.append(node_id)
+            for tail in self.get_successors(node_id):
+                in_degree[tail] -= 1
+                if in_degree[tail] == 0:
+                    ready.append(tail)
+
+        if len(order) < len(in_degree):
+            raise ValueError("Graph contains a cycle.")
+        return order
+
     def is_acyclic(self) -> bool:
         """Check if the graph is acyclic (contains no cycles)."""
-        node_ids = list(self.internal_nodes.keys())
-        check_deque = deque(node_ids)
-        check_dict = {key: 0 for key in node_ids}  # 0: not visited, 1: temp, 2: perm
-
-        def visit(key):
-            if check_dict[key] == 2:
-                return True
-            elif check_dict[key] == 1:
-                return False
-
-            check_dict[key] = 1
-
-            for edge in self.internal_nodes[key].relations["out"]:
-                check = visit(edge.tail)
-                if not check:
-                    return False
-
-            check_dict[key] = 2
+        try:
+            self.topological_sort()
             return True
-
-        while check_deque:
-            key = check_deque.pop()
-            check = visit(key)
-            if not check:
-                return False
-        return True
+        except ValueError:
+            return False
 
     def to_networkx(self, **kwargs) -> Any:
         """Convert the graph to a NetworkX graph object."""
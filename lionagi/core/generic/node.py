@@ -125,7 +125,7 @@ class Node(Component, Relatable):
         bundle: bool = False,
         edge_class: Callable = Edge,
         **kwargs
-    ) -> None:
+    ) -> Edge:
         """
         Establish directed relationship from this node to another.
 
@@ -136,6 +136,9 @@ class Node(Component, Relatable):
             label: Optional label for edge.
             bundle: Whether to bundle edge with others. Default False.
 
+        Returns:
+            The created edge.
+
         Raises:
             ValueError: If direction is neither 'in' nor 'out'.
         """
@@ -155,6 +158,7 @@ class Node(Component, Relatable):
 
         self.relations[direction].include(edge)
         node.relations["in" if direction == "out" else "out"].include(edge)
+        return edge
 
     def remove_edge(self, node: "Node", edge: Edge | str) -> bool:
         """
@@ -1,6 +1,6 @@
+import asyncio
 from collections import deque
-from pydantic import Field
-from lionagi.libs import AsyncUtil
+from pydantic import Field, PrivateAttr
 from lionagi.core.collections.abc import Executable, Element
 from lionagi.core.collections import Exchange
 from lionagi.core.collections.util import to_list_type, get_lion_id
@@ -15,6 +15,10 @@ class MailManager(Element, Executable):
     This class acts as a central hub for managing mail transactions within a system. It allows for the addition
     and deletion of sources, and it handles the collection and dispatch of mails to and from these sources.
 
+    The manager subscribes to the mailbox of every source, so a mail is routed to the inbox of its recipient as
+    soon as it is sent, waking whoever waits on that inbox. Mails to recipients the manager does not know stay
+    in the outbox of their sender until `collect` is called.
+
     Attributes:
             sources (Dict[str, Any]): A dictionary mapping source identifiers to their attributes.
             mails (Dict[str, Dict[str, deque]]): A nested dictionary storing queued mail items, organized by recipient
@@ -37,6 +41,8 @@ class MailManager(Element, Executable):
         False, description="A flag indicating whether to stop execution."
     )
 
+    _stop: asyncio.Event | None = PrivateAttr(None)
+
     def __init__(self, sources=None):
         """
         Initializes the MailManager with optional sources.
@@ -63,6 +69,7 @@ class MailManager(Element, Executable):
             self.sources.include(sources)
             for item in sources:
                 self.mails[item.ln_id] = {}
+                self._mailbox(item.ln_id).subscribe(self._route)
         except Exception as e:
             raise ValueError(f"Failed to add source. Error {e}")
 
@@ -100,9 +107,30 @@ class MailManager(Element, Executable):
         """
         if source_id not in self.sources:
             raise ValueError(f"Source {source_id} does not exist.")
+        self._mailbox(source_id).unsubscribe(self._route)
         self.sources.pop(source_id)
         self.mails.pop(source_id)
 
+    def _mailbox(self, source_id) -> Exchange:
+        source = self.sources[source_id]
+        return source if isinstance(source, Exchange) else source.mailbox
+
+    def _route(self, mailbox: Exchange, mail: Mail) -> None:
+        """
+        Delivers a mail to its recipient as soon as it is sent.
+
+        Args:
+            mailbox (Exchange): The outbox the mail was included in.
+            mail (Mail): The mail to deliver.
+        """
+        if mail.recipient not in self.sources:
+            return
+        mailbox.pending_outs.exclude(mail)
+        mailbox.pile.pop(mail.ln_id)
+        # mails queued by an earlier collect go first
+        self.send(mail.recipient)
+        self._mailbox(mail.recipient).include(mail, "in")
+
     def collect(self, sender):
         """
         Collects mails from a sender's outbox and queues them for the recipient.
@@ -115,11 +143,7 @@ class MailManager(Element, Executable):
         """
         if sender not in self.sources:
             raise ValueError(f"Sender source {sender} does not exist.")
-        mailbox = (
-            self.sources[sender]
-            if isinstance(self.sources[sender], Exchange)
-            else self.sources[sender].mailbox
-        )
+        mailbox = self._mailbox(sender)
         while mailbox.pending_outs.size() > 0:
             mail_id = mailbox.pending_outs.popleft()
             mail = mailbox.pile.pop(mail_id)
@@ -145,11 +169,7 @@ class MailManager(Element, Executable):
             return
         for key in list(self.mails[recipient].keys()):
             pending_mails = self.mails[recipient].pop(key)
-            mailbox = (
-                self.sources[recipient]
-                if isinstance(self.sources[recipient], Exchange)
-                else self.sources[recipient].mailbox
-            )
+            mailbox = self._mailbox(recipient)
             while pending_mails:
                 mail = pending_mails.popleft()
                 mailbox.include(mail, "in")
@@ -168,14 +188,29 @@ class MailManager(Element, Executable):
         for source in self.sources:
             self.send(get_lion_id(source))
 
+    def stop(self):
+        """
+        Stops the execution started by `execute`.
+        """
+        self.execute_stop = True
+        if self._stop is not None:
+            self._stop.set()
+
     async def execute(self, refresh_time=1):
         """
-        Continuously collects and sends mails until execution is stopped.
+        Delivers the mails sent before execution, then waits until execution is stopped.
+
+        Mails sent during execution are routed as they are sent, so the manager does not scan the sources.
 
         Args:
-            refresh_time (int): The time in seconds to wait between each cycle. Defaults to 1.
+            refresh_time (int): The time in seconds between checks of `execute_stop`, for callers setting the flag
+                instead of calling `stop`. Defaults to 1.
         """
+        self._stop = asyncio.Event()
+        self.collect_all()
+        self.send_all()
         while not self.execute_stop:
-            self.collect_all()
-            self.send_all()
-            await AsyncUtil.sleep(refresh_time)
+            try:
+                await asyncio.wait_for(self._stop.wait(), refresh_time)
+            except asyncio.TimeoutError:
+                pass
@@ -30,6 +30,8 @@ class ActionRequest(RoledMessage):
         function (str): The name of the function to be called.
         arguments (dict): The keyword arguments to be passed to the function.
         action_response (str): The ID of the action response that this request corresponds to.
+        depends_on (list[str]): The IDs of the earlier requests of the same batch whose calls must succeed before
+            this one is called.
     """
 
     function: str | None = Field(
@@ -45,6 +47,11 @@ class ActionRequest(RoledMessage):
         description="The id of the action response that this request corresponds to",
     )
 
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="The ids of the earlier requests of the same batch this request waits for",
+    )
+
     def __init__(
         self,
         function=None,
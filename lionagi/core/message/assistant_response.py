@@ -77,14 +77,6 @@ class AssistantResponse(RoledMessage):
         response_copy.metadata["origin_ln_id"] = self.ln_id
         return response_copy
 
-    @property
-    def chat_msg(self) -> dict | None:
-        """Return message in chat representation."""
-        try:
-            return self._check_chat_msg()
-        except:
-            return None
-
     def _check_chat_msg(self):
         text_msg = super()._check_chat_msg()
         return text_msg
@@ -115,12 +115,14 @@ class Instruction(RoledMessage):
             context (dict or str, optional): Additional context to be added.
             **kwargs: Additional context fields to be added.
         """
+        self._before_write()
         if "context" not in self.content:
             self.content["context"] = {}
         if isinstance(context, dict):
             self.content["context"].update({**context, **kwargs})
         elif isinstance(context, str):
             self.content["context"]["additional_context"] = context
+        self.invalidate_chat_msg()
 
     def _update_requested_fields(self, requested_fields: dict):
         """
@@ -129,10 +131,12 @@ class Instruction(RoledMessage):
         Args:
             requested_fields (dict): The fields requested in the instruction.
         """
+        self._before_write()
         if "context" not in self.content:
             self.content["context"] = {}
             self.content["context"]["requested_fields"] = {}
         self.content["context"]["requested_fields"].update(requested_fields)
+        self.invalidate_chat_msg()
 
     def _initiate_content(
         self, context, requested_fields, images, image_detail, **kwargs
@@ -163,6 +167,7 @@ class Instruction(RoledMessage):
         if images:
             self.content["images"] = images if isinstance(images, list) else [images]
             self.content["image_detail"] = image_detail
+        self.invalidate_chat_msg()
 
     def clone(self, **kwargs):
         """
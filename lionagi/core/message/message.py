@@ -14,11 +14,26 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import weakref
+from copy import deepcopy
 from enum import Enum
+from pydantic import PrivateAttr
 from lionagi.core.collections.abc import Sendable, Field
 from lionagi.core.generic.node import Node
 
 
+class ChatEdits:
+    """
+    Counts the edits of the messages a branch has rendered, so the branch
+    knows whether its rendered conversation is still valid.
+    """
+
+    __slots__ = ("count", "__weakref__")
+
+    def __init__(self):
+        self.count = 0
+
+
 # Enums for defining message fields and roles
 class MessageField(str, Enum):
     """
@@ -55,6 +70,76 @@ class RoledMessage(Node, Sendable):
         examples=["system", "user", "assistant"],
     )
 
+    _chat_msg_cache: dict | None = PrivateAttr(None)
+    _chat_version: int = PrivateAttr(0)
+    # edit counts of the branches that rendered the message
+    _chat_watchers: weakref.WeakSet = PrivateAttr(default_factory=weakref.WeakSet)
+    # branches split from the branch owning the message that still hold it,
+    # by ln_id; they are handed a copy before the message changes
+    _sharers: dict = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name, value):
+        if not name.startswith("_"):
+            self._before_write()
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate_chat_msg()
+
+    def _before_write(self) -> None:
+        """
+        Hand the branches sharing the message a copy of it as it is, so a
+        change only shows in the branch owning the message.
+
+        Assigning a field does this automatically; call it before mutating
+        `content` in place.
+        """
+        if not self._sharers:
+            return
+        sharers, self._sharers = self._sharers, {}
+        copy = self._private_copy()
+        holders = [
+            branch
+            for branch in (ref() for ref in sharers.values())
+            if branch is not None and branch._replace_shared(self, copy)
+        ]
+        # the first branch holding the copy owns it, the others share it
+        copy._sharers = {b.ln_id: weakref.ref(b) for b in holders[1:]}
+
+    def _private_copy(self, **update) -> "RoledMessage":
+        """Returns a deep copy of the message, with the same ln_id and the
+        fields in `update` replaced, that no branch shares yet."""
+        fields = dict(update)
+        for name, value in self.__dict__.items():
+            if name in update:
+                continue
+            if name == "relations" and not any(len(p) for p in value.values()):
+                # most messages have no edges, skip copying the empty piles
+                value = type(self).model_fields[name].default_factory()
+            else:
+                value = deepcopy(value)
+            fields[name] = value
+        copy = self.model_copy(update=fields)
+        copy._chat_msg_cache = None
+        copy._chat_watchers = weakref.WeakSet()
+        copy._sharers = {}
+        return copy
+
+    def invalidate_chat_msg(self) -> None:
+        """
+        Drop the cached chat representation.
+
+        Assigning a field does this automatically; call it after mutating
+        `content` in place.
+        """
+        self._chat_msg_cache = None
+        self._chat_version += 1
+        for edits in self._chat_watchers:
+            edits.count += 1
+
+    def _watch_chat(self, edits: ChatEdits) -> None:
+        """Count the edits of the message in the edits of a branch."""
+        self._chat_watchers.add(edits)
+
     @property
     def image_content(self):
         msg_ = self.chat_msg
@@ -65,11 +150,18 @@ class RoledMessage(Node, Sendable):
 
     @property
     def chat_msg(self) -> dict | None:
-        """return message in chat representation"""
-        try:
-            return self._check_chat_msg()
-        except:
-            return None
+        """
+        return message in chat representation
+
+        the representation is rendered once and cached until the message is
+        changed, see `invalidate_chat_msg`.
+        """
+        if self._chat_msg_cache is None:
+            try:
+                self._chat_msg_cache = self._check_chat_msg()
+            except:
+                return None
+        return dict(self._chat_msg_cache)
 
     def _check_chat_msg(self):
         if self.role is None:
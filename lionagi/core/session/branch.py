@@ -14,7 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import itertools
+import weakref
 from typing import Any
+from pydantic import PrivateAttr
 from lionagi.libs.ln_convert import is_same_dtype, to_df
 from lionagi.core.collections.abc import Field
 from lionagi.core.collections import (
@@ -37,6 +40,7 @@ from lionagi.core.message import (
     ActionResponse,
     RoledMessage,
 )
+from lionagi.core.message.message import ChatEdits
 
 from lionagi.core.session.directive_mixin import DirectiveMixin
 
@@ -63,6 +67,16 @@ class Branch(Node, DirectiveMixin):
     mailbox: Exchange[Mail] = Field(None)
     imodel: iModel = Field(None)
 
+    # rendered conversation: (ln_id, message, chat version, chat message)
+    _chat_messages: list[tuple] = PrivateAttr(default_factory=list)
+    # state of the progression, pile and messages the rendering matches
+    _chat_state: tuple | None = PrivateAttr(None)
+    # the progression index and pile dict of that state, kept alive so
+    # their ids are not reused
+    _chat_refs: tuple = PrivateAttr(())
+    # edits of the rendered messages, counted by the messages themselves
+    _chat_edits: ChatEdits = PrivateAttr(default_factory=ChatEdits)
+
     def __init__(
         self,
         system: System | None = None,
@@ -163,6 +177,15 @@ class Branch(Node, DirectiveMixin):
         if assistant_response:
             sender = self.ln_id
 
+        # messages shared with the branch this one was split from are copied
+        # before create_message and the addressing below change them
+        system = self._writable(system)
+        instruction = self._writable(instruction)
+        assistant_response = self._writable(assistant_response)
+        action_response = self._writable(action_response)
+        if not (func_outputs or action_response):
+            action_request = self._writable(action_request)
+
         _msg = create_message(
             system=system,
             instruction=instruction,
@@ -204,16 +227,127 @@ class Branch(Node, DirectiveMixin):
         if metadata:
             _msg._meta_insert(["extra"], metadata)
 
-        return self.messages.include(_msg) and self.progress.include(_msg)
+        rendered = self._chat_state is not None and self._chat_state == self._chat_token()
+        size = len(self.progress)
+        added = self.messages.include(_msg) and self.progress.include(_msg)
+        if rendered and added and len(self.progress) == size + 1:
+            # a new message appended at the end leaves the rendered prefix valid
+            self._chat_state = self._chat_token()
+        return added
+
+    def _chat_token(self) -> tuple:
+        """
+        Returns the state the rendered conversation depends on: the
+        progression and pile objects with their edit counts, and the count
+        of edits of the messages the branch rendered. The progression may
+        only have grown at the end while it is unchanged.
+        """
+        order = self.progress.order
+        return (
+            id(order),
+            getattr(order, "edits", None),
+            id(self.messages.pile),
+            self.messages._replacements,
+            self._chat_edits.count,
+        )
 
     def to_chat_messages(self) -> list[dict[str, Any]]:
         """
         Converts the messages to chat message format.
 
+        The rendered conversation is kept between calls. When only messages
+        were appended since, only those are rendered. Otherwise the longest
+        prefix that still matches the progression, with the same message
+        objects at unchanged versions, is reused.
+
         Returns:
             list[dict[str, Any]]: A list of chat messages.
         """
-        return [self.messages[j].chat_msg for j in self.progress]
+        cache = self._chat_messages
+        order = self.progress.order
+        token = self._chat_token()
+
+        if token[1] is not None and token == self._chat_state:
+            new = list(itertools.islice(reversed(order), len(order) - len(cache)))
+            new.reverse()
+        else:
+            pile = self.messages.pile
+            valid = 0
+            for (ln_id, msg, version, _), j in zip(cache, order):
+                if ln_id != j or pile.get(j) is not msg or msg._chat_version != version:
+                    break
+                valid += 1
+            del cache[valid:]
+            new = list(itertools.islice(order, valid, None))
+
+        for j in new:
+            msg = self.messages[j]
+            msg._watch_chat(self._chat_edits)
+            cache.append((j, msg, msg._chat_version, msg.chat_msg))
+        self._chat_state = self._chat_token()
+        self._chat_refs = (order, self.messages.pile)
+
+        return [dict(i[3]) if i[3] is not None else None for i in cache]
+
+    def _share_messages(self) -> tuple[Pile, Progression]:
+        """
+        Returns a pile and a progression of the messages of the branch, for a
+        branch forked from it, which then calls `_share_from`.
+
+        The messages are shared rather than cloned and are not validated
+        again, and the progression is copied on write, so forking costs a
+        shallow copy of the id mapping whatever the size of the messages.
+        """
+        order = self.progress.order.copy()
+        messages = Pile.model_construct(
+            pile={i: self.messages.pile[i] for i in order},
+            item_type=self.messages.item_type,
+            order=list(order),
+        )
+        return messages, Progression.model_construct(order=order)
+
+    def _share_from(self, branch: "Branch") -> None:
+        """
+        Registers the branch as sharing the messages it holds from the
+        branch it was split from. Those stay owned by that branch: a change
+        made there first hands this branch a copy of the message, and this
+        branch copies a message before changing it itself.
+
+        Args:
+            branch (Branch): The branch this one was split from.
+        """
+        ref = weakref.ref(self)
+        held = branch.messages.pile
+        for ln_id, msg in self.messages.pile.items():
+            if held.get(ln_id) is msg:
+                msg._sharers[self.ln_id] = ref
+
+    def _writable(self, message: Any) -> Any:
+        """
+        Returns a message for the branch to change: its own copy of the
+        message if it shares it with the branch it was split from.
+        """
+        if not isinstance(message, RoledMessage):
+            return message
+        if message._sharers.pop(self.ln_id, None) is None:
+            return message
+        copy = message._private_copy()
+        self._replace_shared(message, copy)
+        return copy
+
+    def _replace_shared(self, message: RoledMessage, copy: RoledMessage) -> bool:
+        """
+        Swaps a shared message for a copy of it, if the branch holds it.
+
+        Returns:
+            bool: Whether the branch held the message.
+        """
+        if self.messages.pile.get(message.ln_id) is not message:
+            return False
+        self.messages[message.ln_id] = copy
+        if self.system is message:
+            self.system = copy
+        return True
 
     def _remove_system(self) -> None:
         """
@@ -227,6 +361,8 @@ class Branch(Node, DirectiveMixin):
         """
         Clears all messages and progression in the branch.
         """
+        for msg in self.messages.pile.values():
+            msg._sharers.pop(self.ln_id, None)
         self.messages.clear()
         self.progress.clear()
 
@@ -147,6 +147,81 @@ class DirectiveMixin:
             **kwargs,
         )
 
+    async def stream_chat(
+        self,
+        instruction=None,  # additional instruction
+        context=None,  # context to perform the instruction on
+        system=None,  # optionally swap system message
+        sender=None,  # sender of the instruction, default "user"
+        recipient=None,  # recipient of the instruction, default "branch.ln_id"
+        requested_fields=None,  # fields to request from the context, default None
+        tools=False,  # the tools to use, use True to consider all tools, no tools by default
+        invoke_tool=True,  # whether to invoke the tool when function calling, default True
+        imodel=None,  # the optinally swappable iModel for the commands, otherwise self.branch.imodel
+        clear_messages=False,
+        images=None,
+        image_path=None,
+        **kwargs,
+    ):
+        """
+        Asynchronously streams the response of a chat interaction.
+
+        The instruction is added to the branch before the request is sent, and
+        the content of the response is yielded as it arrives. Once the stream
+        ends, the complete response is added to the branch as an
+        `AssistantResponse` and the actions it requests are invoked. Unlike
+        `chat`, failed calls are not retried and no form is validated.
+
+        Args:
+            instruction (str, optional): Additional instruction to process.
+            context (Any, optional): Context to perform the instruction on.
+            system (str, optional): Optionally swap the system message.
+            sender (str, optional): Sender of the instruction, default is "user".
+            recipient (str, optional): Recipient of the instruction, default is
+                "branch.ln_id".
+            requested_fields (dict[str, str], optional): Fields to request from
+                the context.
+            tools (bool, optional): Tools to use, use True to consider all tools,
+                no tools by default.
+            invoke_tool (bool, optional): Whether to invoke the tool when function
+                calling, default is True.
+            imodel (iModel, optional): Optionally swappable iModel for the
+                commands, otherwise self.branch.imodel.
+            clear_messages (bool, optional): Whether to clear previous messages,
+                default is False.
+            **kwargs: Additional keyword arguments for the model.
+
+        Yields:
+            str: The content of the response as it arrives.
+
+        Examples:
+            >>> async for text in branch.stream_chat("Tell me a story"):
+            ...     print(text, end="")
+            >>> story = branch.last_response.response
+        """
+        directive = Unit(self, imodel=imodel)
+        if system:
+            self.add_message(system=system)
+
+        if not images and image_path:
+            from lionagi.libs import ImageUtil
+
+            images = ImageUtil.read_image_to_base64(image_path)
+
+        async for content in directive._stream_chat(
+            instruction=instruction,
+            context=context,
+            sender=sender,
+            recipient=recipient,
+            requested_fields=requested_fields,
+            tools=tools,
+            invoke_tool=invoke_tool,
+            clear_messages=clear_messages,
+            images=images,
+            **kwargs,
+        ):
+            yield content
+
     async def direct(
         self,
         *,
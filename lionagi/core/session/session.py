@@ -23,6 +23,7 @@ from lionagi.core.collections import (
 )
 from lionagi.core.message import System
 from typing import Any
+from lionagi.core.action.executor import ToolExecutor
 from lionagi.core.action.tool_manager import ToolManager
 
 from lionagi.libs import SysUtil
@@ -48,6 +49,8 @@ class Session:
         imodel (iModel): The model associated with the session.
         user (str): The user associated with the session.
         default_branch (Branch): The default branch of the session.
+        tool_executor (ToolExecutor): The thread and process pools shared by
+            the tools of all branches.
     """
 
     def __init__(
@@ -58,13 +61,17 @@ class Session:
         user: str | None = None,
         imodel=None,
         tools=None,
+        tool_executor: ToolExecutor | None = None,
     ):
         self.ln_id = SysUtil.create_id()
+        self.tool_executor = tool_executor or ToolExecutor()
         self.timestamp = SysUtil.get_timestamp(sep=None)[:-6]
         system = system or "You are a helpful assistant, let's think step by step"
         self.system = System(system=system, sender=system_sender)
         self.system_sender = system_sender
         self.branches: Pile[Branch] = self._validate_branches(branches)
+        for branch in self.branches:
+            branch.tool_manager.executor = self.tool_executor
         self.mail_transfer = Exchange()
         self.mail_manager = MailManager([self.mail_transfer])
         self.imodel = imodel or iModel()
@@ -140,7 +147,7 @@ class Session:
             user=user,
             messages=messages,
             progress=progress,
-            tool_manager=tool_manager,
+            tool_manager=tool_manager or ToolManager(executor=self.tool_executor),
             tools=tools,
             imodel=imodel or self.imodel,
         )
@@ -167,12 +174,24 @@ class Session:
             else:
                 self.default_branch = self.branches[0]
 
-    def split_branch(self, branch):
+    def split_branch(self, branch, readdress: bool = True):
         """
         Splits a branch, creating a new branch with the same messages and tools.
 
+        Without `readdress`, the new branch shares the message objects of
+        the branch instead of copying them, so splitting is cheap however
+        long the conversation is; the two branches then add and remove
+        messages independently. A shared message is copied before it
+        changes: the new branch copies it before changing it itself, and a
+        change made to it in `branch`, or to the message object directly,
+        first hands the new branch a copy of the message as it was.
+
         Args:
             branch (Branch | str): The branch or its ID to split.
+            readdress (bool): Whether the messages of the new branch are
+                sent by the branch and addressed to the new branch, which
+                copies every message. Defaults to True; pass False to share
+                the messages as they are.
 
         Returns:
             Branch: The newly created branch.
@@ -181,13 +200,7 @@ class Session:
         system = branch.system.clone() if branch.system else None
         if system:
             system.sender = branch.ln_id
-        progress = progression()
-        messages = pile()
-
-        for id_ in branch.progress:
-            clone_message = branch.messages[id_].clone()
-            progress.append(clone_message.ln_id)
-            messages.append(clone_message)
+        messages, progress = branch._share_messages()
 
         tools = (
             list(branch.tool_manager.registry.values())
@@ -200,11 +213,26 @@ class Session:
             user=branch.user,
             progress=progress,
             messages=messages,
+            tool_manager=ToolManager(executor=self.tool_executor),
             tools=tools,
         )
-        for message in branch_clone.messages:
-            message.sender = branch.ln_id
-            message.recipient = branch_clone.ln_id
+        branch_clone.tool_manager.policies.update(branch.tool_manager.policies)
+        copies = messages.pile
+        if readdress:
+            # every message changes, so copy them all now rather than share
+            # them; the fork is not using its pile yet
+            for ln_id, message in copies.items():
+                copies[ln_id] = message._private_copy(
+                    sender=branch.ln_id, recipient=branch_clone.ln_id
+                )
+        else:
+            branch_clone._share_from(branch)
+        # the rendered chat messages stay valid, the addresses are not part
+        # of them
+        branch_clone._chat_messages = [
+            (ln_id, copies.get(ln_id, msg), version, rendered)
+            for ln_id, msg, version, rendered in branch._chat_messages
+        ]
         self.branches.append(branch_clone)
         self.mail_manager.add_sources(branch_clone)
         return branch_clone
@@ -289,6 +317,28 @@ class Session:
             raise ValueError("Branch not found in session branches")
         return await self.branches[branch].chat(*args, **kwargs)
 
+    async def stream_chat(self, *args, branch=None, **kwargs):
+        """
+        Streams the response of a chat interaction with a branch.
+
+        Args:
+            *args: Positional arguments to pass to the stream_chat method.
+            branch (Branch, optional): The branch to chat with. Defaults to the default branch.
+            **kwargs: Keyword arguments to pass to the stream_chat method.
+
+        Yields:
+            str: The content of the response as it arrives.
+
+        Raises:
+            ValueError: If the specified branch is not found in the session branches.
+        """
+        if branch is None:
+            branch = self.default_branch
+        if branch not in self.branches:
+            raise ValueError("Branch not found in session branches")
+        async for content in self.branches[branch].stream_chat(*args, **kwargs):
+            yield content
+
     async def direct(self, *args, branch=None, **kwargs):
         """
         Initiates a direct interaction with a branch.
@@ -24,7 +24,7 @@ from abc import ABC
 
 from typing import Any, Optional
 
-from lionagi.libs import ParseUtil, StringMatch, to_list
+from lionagi.libs import APIUtil, ParseUtil, StringMatch, to_list
 from lionagi.libs.ln_nested import nmerge
 from lionagi.core.collections.abc import ActionError
 from lionagi.core.message import ActionRequest, ActionResponse, Instruction
@@ -230,19 +230,19 @@ class DirectiveMixin(ABC):
                 branch.add_message(action_request=i, recipient=i.recipient)
 
         if invoke_tool:
-            tasks = []
-            for i in action_request:
-                tool = branch.tool_manager.registry[i.function]
-                tasks.append(asyncio.create_task(tool.invoke(i.arguments)))
-            results = await asyncio.gather(*tasks)
-
-            for idx, item in enumerate(results):
+            # each response is added as soon as its call finishes, a failed
+            # call answers with its error so the model can react to it
+            async for request, item, error in branch.tool_manager.invoke_all(
+                action_request
+            ):
+                if error is not None:
+                    item = {"error": f"{type(error).__name__}: {error}"}
                 if item is not None:
                     branch.add_message(
-                        action_request=action_request[idx],
+                        action_request=request,
                         func_outputs=item,
-                        sender=action_request[idx].recipient,
-                        recipient=action_request[idx].sender,
+                        sender=request.recipient,
+                        recipient=request.sender,
                     )
 
         return None
@@ -407,6 +407,89 @@ class DirectiveMixin(ABC):
 
         return out_, branch if return_branch else out_
 
+    async def _stream_chat(
+        self,
+        instruction: Any = None,
+        *,
+        system: Any = None,
+        context: Any = None,
+        sender: Any = None,
+        recipient: Any = None,
+        requested_fields: dict = None,
+        tools: Any = False,
+        images: Optional[str] = None,
+        invoke_tool: bool = True,
+        imodel: Any = None,
+        branch: Any = None,
+        clear_messages: bool = False,
+        **kwargs,
+    ):
+        """
+        Handles a chat operation whose response is streamed.
+
+        Once the stream ends, the assembled response is added to the branch
+        and the actions it requests are processed, as in `_base_chat`.
+
+        Args:
+            instruction: Instruction message.
+            system: System message.
+            context: Context message.
+            sender: Sender identifier.
+            recipient: Recipient identifier.
+            requested_fields: Fields requested in the response.
+            tools: Flag indicating if tools should be used.
+            invoke_tool: Flag indicating if tools should be invoked.
+            imodel: Model instance.
+            branch: Branch instance.
+            clear_messages: Flag indicating if messages should be cleared.
+            kwargs: Additional keyword arguments.
+
+        Yields:
+            str: The content of the response as it arrives.
+        """
+        branch = branch or self.branch
+        if clear_messages:
+            branch.clear()
+            branch.set_system(system)
+
+        config = self._create_chat_config(
+            system=system,
+            instruction=instruction,
+            context=context,
+            sender=sender,
+            recipient=recipient,
+            requested_fields=requested_fields,
+            tools=tools,
+            branch=branch,
+            images=images,
+            **kwargs,
+        )
+
+        imodel = imodel or self.imodel
+        payload, stream = await imodel.stream_chat_completion(
+            branch.to_chat_messages(), **config
+        )
+
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            for choice in chunk.get("choices") or []:
+                if choice.get("index", 0) == 0:
+                    if content := (choice.get("delta") or {}).get("content"):
+                        yield content
+
+        if not chunks:
+            raise RuntimeError("The chat completion stream returned no chunks.")
+
+        await self._process_chatcompletion(
+            payload=payload,
+            completion=APIUtil.merge_stream_chunks(chunks),
+            sender=sender,
+            invoke_tool=invoke_tool,
+            branch=branch,
+            costs=imodel.costs,
+        )
+
     async def _chat(
         self,
         instruction=None,
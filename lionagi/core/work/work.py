@@ -16,9 +16,12 @@ limitations under the License.
 
 from enum import Enum
 import asyncio
+import time
 from typing import Any
 from collections.abc import Coroutine
 
+from pydantic import PrivateAttr
+
 from lionagi.libs import SysUtil
 from lionagi.core.collections.abc import Component
 
@@ -43,6 +46,9 @@ class Work(Component):
         async_task (Coroutine | None): The asynchronous task associated with the work.
         completion_timestamp (str | None): The timestamp when the work was completed.
         duration (float | None): The duration of the work.
+        priority (int): The priority of the work in a queue, lower runs first.
+        deadline (float | None): The `time.monotonic` time by which the work
+            must complete. Work past its deadline fails with a TimeoutError.
     """
 
     status: WorkStatus = WorkStatus.PENDING
@@ -52,11 +58,22 @@ class Work(Component):
     async_task_name: str | None = None
     completion_timestamp: str | None = None
     duration: float | None = None
+    priority: int = 0
+    deadline: float | None = None
+
+    _finished: asyncio.Event = PrivateAttr(default_factory=asyncio.Event)
 
     async def perform(self):
         """Perform the work and update the status, result, and duration."""
         try:
-            result, duration = await self.async_task
+            if self.deadline is None:
+                result, duration = await self.async_task
+            else:
+                remaining = self.deadline - time.monotonic()
+                if remaining <= 0:
+                    self.async_task.close()
+                    raise asyncio.TimeoutError("Work deadline passed before it started.")
+                result, duration = await asyncio.wait_for(self.async_task, remaining)
             self.result = result
             self.status = WorkStatus.COMPLETED
             self.duration = duration
@@ -66,6 +83,11 @@ class Work(Component):
             self.status = WorkStatus.FAILED
         finally:
             self.completion_timestamp = SysUtil.get_timestamp(sep=None)[:-6]
+            self._finished.set()
+
+    async def wait_for_completion(self) -> None:
+        """Wait until the work has completed or failed."""
+        await self._finished.wait()
 
     def __str__(self):
         return (
@@ -107,7 +107,7 @@ class WorkFunction:
 
     async def process(self):
         """
-        Process the first capacity_size works in the work queue.
+        Process the works in the work queue, capacity_size at a time.
         """
         await self.worklog.queue.process()
 
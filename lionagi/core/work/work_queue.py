@@ -15,20 +15,65 @@ limitations under the License.
 """
 
 import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+
 from lionagi.core.work.work import WorkStatus
 
 
+@dataclass(slots=True)
+class WorkQueueMetrics:
+    """Wait and service times of the work finished by a queue, in seconds."""
+
+    completed: int = 0
+    failed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    total_service: float = 0.0
+
+    def record(self, wait: float, service: float, failed: bool) -> None:
+        """Record a finished work item."""
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_service += service
+
+    @property
+    def finished(self) -> int:
+        """The number of work items completed or failed."""
+        return self.completed + self.failed
+
+    @property
+    def avg_wait(self) -> float:
+        """The average time a work item waited in the queue."""
+        return self.total_wait / self.finished if self.finished else 0.0
+
+    @property
+    def avg_service(self) -> float:
+        """The average time a work item ran."""
+        return self.total_service / self.finished if self.finished else 0.0
+
+
 class WorkQueue:
     """
     A class representing a queue for managing work.
 
+    Work is taken by priority, lowest first, then in enqueue order. Up to
+    `capacity` items run at once, and each slot is refilled as soon as its
+    work finishes.
+
     Attributes:
-        capacity (int): The maximum number of tasks the queue can handle.
-        queue (asyncio.Queue): The queue holding the tasks.
+        capacity (int): The maximum number of tasks running at once.
+        queue (asyncio.PriorityQueue): The queue holding the tasks.
         _stop_event (asyncio.Event): Event to signal stopping the execution of the queue.
-        available_capacity (int): The remaining number of tasks the queue can handle.
+        available_capacity (int): The number of free slots.
         execution_mode (bool): If `execute` is running.
-        refresh_time (int): The time interval between task processing.
+        refresh_time (int): Kept for compatibility, the queue no longer polls.
+        metrics (WorkQueueMetrics): Wait and service times of finished work.
     """
 
     def __init__(self, capacity=5, refresh_time=1):
@@ -36,8 +81,8 @@ class WorkQueue:
         Initializes a new instance of WorkQueue.
 
         Args:
-            capacity (int): The maximum number of tasks the queue can handle.
-            refresh_time (int): The time interval between task processing.
+            capacity (int): The maximum number of tasks running at once.
+            refresh_time (int): Kept for compatibility, the queue no longer polls.
 
         Raises:
             ValueError: If capacity is less than 0 or refresh_time is negative.
@@ -47,19 +92,33 @@ class WorkQueue:
         if refresh_time < 0:
             raise ValueError("refresh time for execution can not be negative")
         self.capacity = capacity
-        self.queue = asyncio.Queue()
+        self.queue = asyncio.PriorityQueue()
         self._stop_event = asyncio.Event()
+        self._count = itertools.count()
         self.available_capacity = capacity
         self.execution_mode = False
         self.refresh_time = refresh_time
+        self.metrics = WorkQueueMetrics()
+
+    async def enqueue(self, work, priority=None, timeout=None) -> None:
+        """
+        Enqueue a work item.
 
-    async def enqueue(self, work) -> None:
-        """Enqueue a work item."""
-        await self.queue.put(work)
+        Args:
+            work (Work): The work item.
+            priority (int, optional): Overrides the priority of the work.
+            timeout (float, optional): Sets the deadline of the work to this
+                many seconds from now, queue wait included.
+        """
+        if priority is not None:
+            work.priority = priority
+        if timeout is not None:
+            work.deadline = time.monotonic() + timeout
+        await self.queue.put((work.priority, next(self._count), time.monotonic(), work))
 
     async def dequeue(self):
         """Dequeue a work item."""
-        return await self.queue.get()
+        return (await self.queue.get())[-1]
 
     async def join(self) -> None:
         """Block until all items in the queue have been processed."""
@@ -74,32 +133,65 @@ class WorkQueue:
         """Return whether the queue has been stopped."""
         return self._stop_event.is_set()
 
+    @property
+    def depth(self) -> int:
+        """Return the number of work items waiting in the queue."""
+        return self.queue.qsize()
+
+    async def _perform(self, entry) -> None:
+        _, _, enqueued, work = entry
+        self.available_capacity -= 1
+        started = time.monotonic()
+        work.status = WorkStatus.IN_PROGRESS
+        try:
+            await work.perform()
+        finally:
+            self.available_capacity += 1
+            self.queue.task_done()
+            self.metrics.record(
+                started - enqueued,
+                time.monotonic() - started,
+                work.status == WorkStatus.FAILED,
+            )
+
     async def process(self) -> None:
-        """Process the work items in the queue."""
-        tasks = set()
-        while self.available_capacity > 0 and self.queue.qsize() > 0:
-            next = await self.dequeue()
-            next.status = WorkStatus.IN_PROGRESS
-            task = asyncio.create_task(next.perform())
-            tasks.add(task)
-            self.available_capacity -= 1
-
-        if tasks:
-            await asyncio.wait(tasks)
-            self.available_capacity = self.capacity
+        """Process the work items in the queue until it is empty."""
+        running = set()
+        while running or self.queue.qsize() > 0:
+            while len(running) < self.capacity and self.queue.qsize() > 0:
+                entry = self.queue.get_nowait()
+                running.add(asyncio.ensure_future(self._perform(entry)))
+            if not running:
+                break
+            _, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
 
     async def execute(self):
         """
-            Continuously executes the process method at a specified refresh interval.
-
-            Args:
-                refresh_time (int, optional): The time in seconds to wait between
-                    successive calls to `process`. Defaults to 1.
+        Runs the work items as they are enqueued until the queue is stopped,
+        then waits for the running ones to finish.
         """
         self.execution_mode = True
         self._stop_event.clear()
-
-        while not self.stopped:
-            await self.process()
-            await asyncio.sleep(self.refresh_time)
-        self.execution_mode = False
+        stop = asyncio.ensure_future(self._stop_event.wait())
+        running = set()
+        get = None
+        try:
+            while not self.stopped:
+                if get is None and len(running) < self.capacity:
+                    get = asyncio.ensure_future(self.queue.get())
+                waiting = {stop, *running} | ({get} if get else set())
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                running = {task for task in running if not task.done()}
+                if get is not None and get.done():
+                    running.add(asyncio.ensure_future(self._perform(get.result())))
+                    get = None
+            if running:
+                await asyncio.wait(running)
+        finally:
+            stop.cancel()
+            if get is not None and not get.cancel() and not get.cancelled():
+                self.queue.put_nowait(get.result())
+                self.queue.task_done()
+            self.execution_mode = False
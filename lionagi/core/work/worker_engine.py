@@ -19,8 +19,10 @@ class WorkerEngine:
         active_tasks (Pile): A pile of currently active tasks.
         failed_tasks (Pile): A pile of tasks that have failed.
         worker_graph (Graph): A graph representing the relationships between work functions.
-        refresh_time (int): The time interval for refreshing the work log queue.
+        refresh_time (int): Kept for compatibility, the engine waits on work
+            completion instead of polling.
         _stop_event (asyncio.Event): An event to signal stopping the execution.
+        _task_added (asyncio.Event): An event set when a task is added.
     """
 
     def __init__(self, worker: Worker, refresh_time=1):
@@ -29,7 +31,7 @@ class WorkerEngine:
 
         Args:
             worker (Worker): The worker instance to be managed.
-            refresh_time (int): The time interval for refreshing the work log queue.
+            refresh_time (int): Kept for compatibility, the engine no longer polls.
         """
         self.worker = worker
         self.tasks = pile()
@@ -40,6 +42,7 @@ class WorkerEngine:
         self._construct_workedges()
         self.refresh_time = refresh_time
         self._stop_event = asyncio.Event()
+        self._task_added = asyncio.Event()
 
     async def add_task(self, *args, task_function: str, task_name=None, task_max_steps=10, task_post_processing=None, **kwargs):
         """
@@ -62,6 +65,7 @@ class WorkerEngine:
         work = await function(*args, **kwargs)
         task.current_work = work
         task.work_history.append(work)
+        self._task_added.set()
         return task
 
     async def activate_work_queues(self):
@@ -77,6 +81,7 @@ class WorkerEngine:
         Stops the execution of tasks.
         """
         self._stop_event.set()
+        self._task_added.set()
 
     @property
     def stopped(self) -> bool:
@@ -90,13 +95,15 @@ class WorkerEngine:
 
     async def process(self, task: WorkTask):
         """
-        Processes a single task.
+        Processes a single task, waiting for its current work to finish.
 
         Args:
             task (WorkTask): The task to be processed.
         """
         current_work_func_name = task.current_work.async_task_name
         current_work_func = self.worker.work_functions[current_work_func_name]
+        await current_work_func.forward()
+        await task.current_work.wait_for_completion()
         updated_task = await task.process(current_work_func)
         if updated_task == "COMPLETED":
             self.active_tasks.pop(task)
@@ -106,31 +113,50 @@ class WorkerEngine:
         elif isinstance(updated_task, list):
             self.tasks.include(updated_task)
             self.active_tasks.include(updated_task)
-        else:
-            await asyncio.sleep(self.refresh_time)
 
     async def execute(self, stop_queue=True):
         """
         Executes all tasks in the task queue.
 
+        Each task is processed as soon as its current work finishes, without
+        waiting for the other tasks, and tasks added while executing start
+        right away.
+
         Args:
             stop_queue (bool, optional): Whether to stop the queue after execution. Defaults to True.
         """
-        for task in self.tasks:
-            if task.status == WorkStatus.PENDING:
-                task.status = WorkStatus.IN_PROGRESS
-                self.active_tasks.append(task)
-
+        self._activate_pending_tasks()
         await self.activate_work_queues()
         self._stop_event.clear()
 
-        while len(self.active_tasks) > 0 and not self.stopped:
-            for work_function in self.worker.work_functions.values():
-                if len(work_function.worklog.pending) > 0:
-                    await work_function.worklog.forward()
-            tasks = list(self.active_tasks)
-            await asyncio.gather(*[self.process(task) for task in tasks])
-            await asyncio.sleep(self.refresh_time)
+        stop = asyncio.ensure_future(self._stop_event.wait())
+        added = None
+        running = {}
+        try:
+            while not self.stopped:
+                self._task_added.clear()
+                self._activate_pending_tasks()
+                for task in self.active_tasks:
+                    if task.ln_id not in running:
+                        running[task.ln_id] = asyncio.ensure_future(self.process(task))
+                if not running:
+                    break
+                if added is None or added.done():
+                    added = asyncio.ensure_future(self._task_added.wait())
+                await asyncio.wait(
+                    {stop, added, *running.values()},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task_id, future in list(running.items()):
+                    if future.done():
+                        running.pop(task_id)
+                        future.result()
+        finally:
+            stop.cancel()
+            if added is not None:
+                added.cancel()
+            for future in running.values():
+                future.cancel()
 
         if stop_queue:
             await self.stop()
@@ -144,10 +170,23 @@ class WorkerEngine:
         
         async def execute_lasting_inner():
             while not self.stopped:
+                self._task_added.clear()
                 await self.execute(stop_queue=False)
-                await asyncio.sleep(self.refresh_time)
+                if not self.stopped and not any(
+                    task.status == WorkStatus.PENDING for task in self.tasks
+                ):
+                    await self._task_added.wait()
         asyncio.create_task(execute_lasting_inner())
 
+    def _activate_pending_tasks(self):
+        """
+        Marks the pending tasks whose first work is created as in progress.
+        """
+        for task in self.tasks:
+            if task.status == WorkStatus.PENDING and task.current_work is not None:
+                task.status = WorkStatus.IN_PROGRESS
+                self.active_tasks.append(task)
+
     def _construct_work_functions(self):
         """
         Constructs work functions for the worker.
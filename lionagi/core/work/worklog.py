@@ -48,13 +48,17 @@ class WorkLog(Progressable):
 
     async def append(self, work: Work):
         """
-        Appends a new work item to the log.
+        Appends a new work item to the log, enqueuing it right away if the
+        queue is executing.
 
         Args:
             work (Work): The work item to append.
         """
         self.pile.append(work)
-        self.pending.append(work)
+        if self.queue.execution_mode:
+            await self.queue.enqueue(work)
+        else:
+            self.pending.append(work)
 
     async def forward(self):
         """
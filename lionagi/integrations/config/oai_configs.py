@@ -13,6 +13,7 @@ oai_chat_llmconfig = {
     "seed": None,
     "stop": None,
     "stream": False,
+    "stream_options": None,
     "temperature": 0.1,
     "top_p": 1,
     "tools": None,
@@ -36,6 +37,7 @@ oai_chat_schema = {
         "seed",
         "stop",
         "stream",
+        "stream_options",
         "tools",
         "tool_choice",
         "user",
@@ -142,32 +142,8 @@ class OpenAIService(BaseService):
             await self.init_endpoint("chat/completions")
             self.active_endpoint.append("chat/completions")
 
-        msgs = []
-
-        for msg in messages:
-            if isinstance(msg, dict):
-                content = msg.get("content")
-                if isinstance(content, (dict, str)):
-                    msgs.append({"role": msg["role"], "content": content})
-                elif isinstance(content, list):
-                    _content = []
-                    for i in content:
-                        if "text" in i:
-                            _content.append({"type": "text", "text": str(i["text"])})
-                        elif "image_url" in i:
-                            _content.append(
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"{i['image_url'].get('url')}",
-                                        "detail": i["image_url"].get("detail", "low"),
-                                    },
-                                }
-                            )
-                    msgs.append({"role": msg["role"], "content": _content})
-
         payload = PayloadPackage.chat_completion(
-            msgs,
+            self._format_messages(messages),
             self.endpoints["chat/completions"].config,
             self.schema["chat/completions"],
             **kwargs,
@@ -181,6 +157,38 @@ class OpenAIService(BaseService):
             self.status_tracker.num_tasks_failed += 1
             raise e
 
+    async def serve_chat_stream(self, messages, required_tokens=None, **kwargs):
+        """
+        Serves the chat completion request with a streamed response.
+
+        The request is sent once the returned stream is iterated. Token usage
+        is reported in the last chunk unless `stream_options` says otherwise.
+
+        Args:
+                messages: The messages to be included in the chat completion.
+                **kwargs: Additional keyword arguments for payload creation.
+
+        Returns:
+                A tuple containing the payload and an async iterator over the
+                completion chunks from the API.
+        """
+        if "chat/completions" not in self.active_endpoint:
+            await self.init_endpoint("chat/completions")
+            self.active_endpoint.append("chat/completions")
+
+        kwargs["stream"] = True
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        payload = PayloadPackage.chat_completion(
+            self._format_messages(messages),
+            self.endpoints["chat/completions"].config,
+            self.schema["chat/completions"],
+            **kwargs,
+        )
+        stream = self.stream_api(
+            payload, "chat/completions", "post", required_tokens=required_tokens
+        )
+        return payload, stream
+
     async def serve_embedding(self, embed_str, required_tokens=None, **kwargs):
         if "embeddings" not in self.active_endpoint:
             await self.init_endpoint("embeddings")
@@ -201,3 +209,31 @@ class OpenAIService(BaseService):
         except Exception as e:
             self.status_tracker.num_tasks_failed += 1
             raise e
+
+    @staticmethod
+    def _format_messages(messages):
+        """Keeps the fields of the messages that the chat API accepts."""
+        msgs = []
+
+        for msg in messages:
+            if isinstance(msg, dict):
+                content = msg.get("content")
+                if isinstance(content, (dict, str)):
+                    msgs.append({"role": msg["role"], "content": content})
+                elif isinstance(content, list):
+                    _content = []
+                    for i in content:
+                        if "text" in i:
+                            _content.append({"type": "text", "text": str(i["text"])})
+                        elif "image_url" in i:
+                            _content.append(
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": f"{i['image_url'].get('url')}",
+                                        "detail": i["image_url"].get("detail", "low"),
+                                    },
+                                }
+                            )
+                    msgs.append({"role": msg["role"], "content": _content})
+        return msgs
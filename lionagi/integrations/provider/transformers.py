@@ -1,5 +1,9 @@
 from typing import Union, Dict, Any
+import asyncio
+import queue
 import subprocess
+import threading
+import time
 
 from lionagi.libs.sys_util import SysUtil
 from lionagi.libs.ln_api import BaseService
@@ -43,12 +47,25 @@ def install_pytorch():
 
 
 class TransformersService(BaseService):
+    """
+    Service running a local transformers pipeline.
+
+    Generation runs on a dedicated worker thread, so the event loop stays
+    responsive. Concurrent requests are queued and grouped into micro-batches
+    of up to `max_batch_size` prompts: the worker waits at most
+    `batch_timeout` seconds after the first prompt of a batch for others to
+    arrive, then runs them in a single pipeline call. Each request awaits its
+    own future.
+    """
+
     def __init__(
         self,
         task: str = None,
         model: Union[str, Any] = None,
         config: Union[str, Dict, Any] = None,
         device="cpu",
+        max_batch_size: int = 8,
+        batch_timeout: float = 0.01,
         **kwargs,
     ):
         super().__init__()
@@ -56,6 +73,11 @@ class TransformersService(BaseService):
         self.model = model
         self.config = config
         self.allowed_kwargs = allowed_kwargs
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout
+        self._requests = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
         try:
             from transformers import pipeline
 
@@ -95,7 +117,7 @@ class TransformersService(BaseService):
 
         msg = "".join([i["content"] for i in messages if i["role"] == "user"])
         conversation = ""
-        response = self.pipe(msg, **config)
+        response = await self._generate(msg, config)
         try:
             conversation = response[0]["generated_text"]
         except:
@@ -104,3 +126,85 @@ class TransformersService(BaseService):
         completion = {"choices": [{"message": {"content": conversation}}]}
 
         return payload, completion
+
+    async def _generate(self, msg: str, config: dict) -> Any:
+        """Queues a prompt for the worker thread and waits for its output."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._ensure_worker()
+        self._requests.put((msg, config, loop, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="TransformersService-worker",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def close_worker(self) -> None:
+        """Stops the worker thread once the queued requests are served."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and worker.is_alive():
+            self._requests.put(None)
+            worker.join()
+
+    def _next_batch(self) -> list | None:
+        """Blocks for a request, then collects more until full or timed out."""
+        first = self._requests.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # serve what was collected, then stop
+                self._requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run_worker(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            # only prompts sharing a generation config run in the same call
+            groups = {}
+            for request in batch:
+                key = repr(sorted(request[1].items()))
+                groups.setdefault(key, []).append(request)
+
+            for requests in groups.values():
+                try:
+                    config = requests[0][1]
+                    if len(requests) == 1:
+                        outputs = [self.pipe(requests[0][0], **config)]
+                    else:
+                        msgs = [r[0] for r in requests]
+                        outputs = self.pipe(msgs, batch_size=len(msgs), **config)
+                except Exception as e:
+                    for *_, loop, future in requests:
+                        loop.call_soon_threadsafe(_set_exception, future, e)
+                    continue
+
+                for (*_, loop, future), output in zip(requests, outputs):
+                    loop.call_soon_threadsafe(_set_result, future, output)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+    if not future.done():
+        future.set_exception(exception)
@@ -25,6 +25,7 @@ from lionagi.libs.ln_api import (
     PayloadPackage,
 )
 
+from lionagi.libs.ln_cache import CompletionCache
 from lionagi.libs.ln_image import ImageUtil
 from lionagi.libs.ln_validate import validation_funcs
 
@@ -43,6 +44,7 @@ __all__ = [
     "PayloadPackage",
     "StatusTracker",
     "SimpleRateLimiter",
+    "CompletionCache",
     "CallDecorator",
     "validation_funcs",
     "ImageUtil",
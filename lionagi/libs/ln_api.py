@@ -14,14 +14,23 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from collections import OrderedDict, deque
 from collections.abc import Sequence, Mapping
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import bisect
 import contextlib
+import contextvars
+import hashlib
+import heapq
+import itertools
+import json
 import logging
 import re
+import threading
+import time
 import asyncio
 import aiohttp
 
@@ -32,6 +41,56 @@ from lionagi.libs.ln_convert import to_dict, strip_lower, to_str
 import lionagi.libs.ln_func_call as func_call
 from lionagi.libs.ln_nested import nget
 
+_EPSILON = 1e-9
+
+TOKEN_COUNT_CACHE_SIZE = 65_536
+
+
+class _LRUCache:
+    """A small thread-safe LRU mapping used to memoize token counts."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_token_counts = _LRUCache(TOKEN_COUNT_CACHE_SIZE)
+
+
+def _token_count_key(namespace: str, text: str) -> tuple[str, int, bytes]:
+    data = text.encode("utf-8", "surrogatepass")
+    return namespace, len(data), hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _to_list_of_str(value) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return []
+
 
 class APIUtil:
     """
@@ -185,6 +244,41 @@ class APIUtil:
 
         return response_json
 
+    @staticmethod
+    def parse_rate_limit_reset(value: str | float | None) -> float | None:
+        """
+        Parses a rate limit reset value into a number of seconds.
+
+        Accepts the duration strings returned in ``x-ratelimit-reset-*``
+        headers (e.g. ``"6m0s"``, ``"1.5s"``, ``"20ms"``) as well as plain
+        numbers of seconds, as found in ``retry-after``.
+
+        Args:
+                value: The header value.
+
+        Returns:
+                The number of seconds, or None if the value cannot be parsed.
+
+        Examples:
+                >>> APIUtil.parse_rate_limit_reset("1m30s")
+                90.0
+                >>> APIUtil.parse_rate_limit_reset("250ms")
+                0.25
+        """
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return max(float(value), 0.0)
+        value = str(value).strip()
+        with contextlib.suppress(ValueError):
+            return max(float(value), 0.0)
+
+        parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+        if not parts or "".join(n + u for n, u in parts) != value:
+            return None
+        units = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+        return sum(float(n) * units[u] for n, u in parts)
+
     @staticmethod
     def get_cache_key(url: str, params: Mapping[str, Any] | None) -> str:
         """
@@ -342,6 +436,240 @@ class APIUtil:
             logging.error(f"API call to {url} failed: {e}")
             return None
 
+    @staticmethod
+    async def iter_sse(lines) -> Any:
+        """
+        Parses a server-sent event stream into JSON events.
+
+        Data lines are accumulated until a blank line ends the event. Comment
+        lines are ignored and the ``[DONE]`` sentinel ends the stream.
+
+        Args:
+                lines: An async iterable of the raw lines of the stream, e.g. the
+                        ``content`` of an aiohttp response.
+
+        Yields:
+                The JSON payload of each event as a dictionary.
+
+        Examples:
+                >>> async for event in APIUtil.iter_sse(response.content):
+                ...     print(event["choices"][0]["delta"])
+        """
+        data = []
+        async for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            line = line.rstrip("\r\n")
+
+            if not line:
+                if data:
+                    event, data = "\n".join(data), []
+                    if event == "[DONE]":
+                        return
+                    yield json.loads(event)
+                continue
+
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if field == "data":
+                data.append(value[1:] if value.startswith(" ") else value)
+
+        if data and (event := "\n".join(data)) != "[DONE]":
+            yield json.loads(event)
+
+    @staticmethod
+    def merge_stream_chunks(chunks: Sequence[Mapping[str, Any]]) -> dict:
+        """
+        Assembles streamed chat completion chunks into a full completion.
+
+        Content and tool call arguments are concatenated per choice, so the
+        result has the shape of a non-streamed chat completion.
+
+        Args:
+                chunks: The chunks of a streamed chat completion, in order.
+
+        Returns:
+                The chat completion as a dictionary.
+
+        Examples:
+                >>> chunks = [
+                ...     {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hel"}}]},
+                ...     {"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]},
+                ... ]
+                >>> APIUtil.merge_stream_chunks(chunks)["choices"][0]["message"]
+                {'role': 'assistant', 'content': 'Hello'}
+        """
+        completion = {}
+        choices = {}
+
+        for chunk in chunks:
+            for key in ("id", "created", "model", "system_fingerprint"):
+                if key in chunk and key not in completion:
+                    completion[key] = chunk[key]
+            if chunk.get("usage"):
+                completion["usage"] = chunk["usage"]
+
+            for delta_choice in chunk.get("choices") or []:
+                idx = delta_choice.get("index", 0)
+                choice = choices.setdefault(
+                    idx,
+                    {
+                        "index": idx,
+                        "message": {"role": "assistant", "content": None},
+                        "finish_reason": None,
+                    },
+                )
+                message = choice["message"]
+                delta = delta_choice.get("delta") or {}
+
+                if delta.get("role"):
+                    message["role"] = delta["role"]
+                if delta.get("content"):
+                    message["content"] = (message["content"] or "") + delta["content"]
+
+                for call in delta.get("tool_calls") or []:
+                    calls = message.setdefault("tool_calls", [])
+                    call_idx = call.get("index", len(calls))
+                    while len(calls) <= call_idx:
+                        calls.append(
+                            {
+                                "id": None,
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            }
+                        )
+                    target = calls[call_idx]
+                    for key in ("id", "type"):
+                        if call.get(key):
+                            target[key] = call[key]
+                    function = call.get("function") or {}
+                    for key in ("name", "arguments"):
+                        if function.get(key):
+                            target["function"][key] += function[key]
+
+                if delta_choice.get("finish_reason"):
+                    choice["finish_reason"] = delta_choice["finish_reason"]
+
+        completion["object"] = "chat.completion"
+        completion["choices"] = [choices[i] for i in sorted(choices)]
+        return completion
+
+    @staticmethod
+    @func_call.lru_cache(maxsize=None)
+    def get_encoding(token_encoding_name: str = None):
+        """
+        Returns the tiktoken encoding of the given name, loaded once per process.
+
+        Args:
+                token_encoding_name: The name of the encoding, "cl100k_base" by default.
+
+        Returns:
+                The tiktoken ``Encoding`` object.
+        """
+        import tiktoken
+
+        return tiktoken.get_encoding(token_encoding_name or "cl100k_base")
+
+    @staticmethod
+    def count_tokens(text: str, token_encoding_name: str = None) -> int:
+        """
+        Counts the tokens of a text, memoized by a hash of its content.
+
+        Counts are kept in a process-wide LRU of ``TOKEN_COUNT_CACHE_SIZE``
+        entries, so a message that is resent on every turn of a conversation
+        is only encoded once.
+
+        Args:
+                text: The text to count.
+                token_encoding_name: The name of the encoding, "cl100k_base" by default.
+
+        Returns:
+                The number of tokens in the text.
+        """
+        token_encoding_name = token_encoding_name or "cl100k_base"
+        key = _token_count_key(token_encoding_name, text)
+        count = _token_counts.get(key)
+        if count is None:
+            count = len(APIUtil.get_encoding(token_encoding_name).encode(text))
+            _token_counts.set(key, count)
+        return count
+
+    @staticmethod
+    def count_tokens_batch(
+        texts: Sequence[str], token_encoding_name: str = None
+    ) -> list[int]:
+        """
+        Counts the tokens of many texts at once.
+
+        Texts missing from the cache are encoded together with tiktoken's
+        multithreaded ``encode_batch``.
+
+        Args:
+                texts: The texts to count.
+                token_encoding_name: The name of the encoding, "cl100k_base" by default.
+
+        Returns:
+                The number of tokens of each text, in order.
+        """
+        token_encoding_name = token_encoding_name or "cl100k_base"
+        keys = [_token_count_key(token_encoding_name, t) for t in texts]
+        counts = [_token_counts.get(k) for k in keys]
+
+        missing = {}
+        for idx, count in enumerate(counts):
+            if count is None:
+                missing.setdefault(keys[idx], texts[idx])
+
+        if missing:
+            encoding = APIUtil.get_encoding(token_encoding_name)
+            encoded = encoding.encode_batch(list(missing.values()))
+            new_counts = {k: len(codes) for k, codes in zip(missing, encoded)}
+            for key, count in new_counts.items():
+                _token_counts.set(key, count)
+            counts = [
+                c if c is not None else new_counts[k] for c, k in zip(counts, keys)
+            ]
+        return counts
+
+    @staticmethod
+    def _count_image_tokens(image_base64: str, detail: str) -> int:
+        from .ln_image import ImageUtil
+
+        key = _token_count_key(f"image:{detail}", image_base64)
+        count = _token_counts.get(key)
+        if count is None:
+            count = ImageUtil.calculate_image_token_usage_from_base64(
+                image_base64, detail
+            )
+            _token_counts.set(key, count)
+        return count
+
+    @staticmethod
+    def _payload_texts(payload: Mapping[str, Any], api_endpoint: str) -> list[str]:
+        """Collects the texts of a payload that ``calculate_num_token`` encodes."""
+        texts = []
+        if api_endpoint.endswith("completions"):
+            if api_endpoint.startswith("chat/"):
+                for message in payload["messages"]:
+                    _content = message.get("content")
+                    if isinstance(_content, str):
+                        texts.append(_content)
+                    elif isinstance(_content, list):
+                        for item in _content:
+                            if isinstance(item, dict):
+                                if "text" in item:
+                                    texts.append(to_str(item["text"]))
+                            elif isinstance(item, str):
+                                texts.append(item)
+                            else:
+                                texts.append(str(item))
+            else:
+                texts.extend(_to_list_of_str(payload.get("format_prompt")))
+        elif api_endpoint == "embeddings":
+            texts.extend(_to_list_of_str(payload.get("input")))
+        return texts
+
     @staticmethod
     def calculate_num_token(
         payload: Mapping[str, Any] = None,
@@ -352,8 +680,8 @@ class APIUtil:
         Calculates the number of tokens required for a request based on the payload and API endpoint.
 
         The token calculation logic might vary based on different API endpoints and payload content.
-        This method should be implemented in a subclass to provide the specific calculation logic
-        for the OpenAI API.
+        The encoding is loaded once per process and the token count of every
+        text is memoized, see ``count_tokens``.
 
         Parameters:
                 payload (Mapping[str, Any]): The payload of the request.
@@ -371,11 +699,11 @@ class APIUtil:
                 >>> rate_limiter.calculate_num_token(payload, 'completions')
                 # Expected token calculation for the given payload and endpoint.
         """
-        import tiktoken
-        from .ln_image import ImageUtil
-
         token_encoding_name = token_encoding_name or "cl100k_base"
-        encoding = tiktoken.get_encoding(token_encoding_name)
+
+        def _count(text):
+            return APIUtil.count_tokens(text, token_encoding_name)
+
         if api_endpoint.endswith("completions"):
             max_tokens = payload.get("max_tokens", 15)
             n = payload.get("n", 1)
@@ -388,41 +716,39 @@ class APIUtil:
 
                     _content = message.get("content")
                     if isinstance(_content, str):
-                        num_tokens += len(encoding.encode(_content))
+                        num_tokens += _count(_content)
 
                     elif isinstance(_content, list):
                         for item in _content:
                             if isinstance(item, dict):
                                 if "text" in item:
-                                    num_tokens += len(
-                                        encoding.encode(to_str(item["text"]))
-                                    )
+                                    num_tokens += _count(to_str(item["text"]))
                                 elif "image_url" in item:
                                     a: str = item["image_url"]["url"]
                                     if "data:image/jpeg;base64," in a:
                                         a = a.split("data:image/jpeg;base64,")[
                                             1
                                         ].strip()
-                                    num_tokens += ImageUtil.calculate_image_token_usage_from_base64(
+                                    num_tokens += APIUtil._count_image_tokens(
                                         a, item.get("detail", "low")
                                     )
                                     num_tokens += (
                                         20  # for every image we add 20 tokens buffer
                                     )
                             elif isinstance(item, str):
-                                num_tokens += len(encoding.encode(item))
+                                num_tokens += _count(item)
                             else:
-                                num_tokens += len(encoding.encode(str(item)))
+                                num_tokens += _count(str(item))
 
                 num_tokens += 2  # every reply is primed with <im_start>assistant
                 return num_tokens + completion_tokens
             else:
                 prompt = payload["format_prompt"]
                 if isinstance(prompt, str):  # single format_prompt
-                    prompt_tokens = len(encoding.encode(prompt))
+                    prompt_tokens = _count(prompt)
                     return prompt_tokens + completion_tokens
                 elif isinstance(prompt, list):  # multiple prompts
-                    prompt_tokens = sum(len(encoding.encode(p)) for p in prompt)
+                    prompt_tokens = sum(_count(p) for p in prompt)
                     return prompt_tokens + completion_tokens * len(prompt)
                 else:
                     raise TypeError(
@@ -431,9 +757,9 @@ class APIUtil:
         elif api_endpoint == "embeddings":
             input = payload["input"]
             if isinstance(input, str):  # single input
-                return len(encoding.encode(input))
+                return _count(input)
             elif isinstance(input, list):  # multiple inputs
-                return sum(len(encoding.encode(i)) for i in input)
+                return sum(_count(i) for i in input)
             else:
                 raise TypeError(
                     'Expecting either string or list of strings for "inputs" field in embedding request'
@@ -443,6 +769,38 @@ class APIUtil:
                 f'API endpoint "{api_endpoint}" not implemented in this script'
             )
 
+    @staticmethod
+    def calculate_num_tokens(
+        payloads: Sequence[Mapping[str, Any]],
+        api_endpoint: str = None,
+        token_encoding_name: str = None,
+    ) -> list[int]:
+        """
+        Calculates the number of tokens required for many requests at once.
+
+        The texts of all payloads are first counted together with
+        ``count_tokens_batch``, then each payload is priced from the cache.
+
+        Args:
+                payloads: The payloads of the requests.
+                api_endpoint: The API endpoint shared by the requests.
+                token_encoding_name: The name of the token encoding method.
+
+        Returns:
+                The estimated number of tokens of each request, in order.
+        """
+        texts = [
+            text
+            for payload in payloads
+            for text in APIUtil._payload_texts(payload, api_endpoint)
+        ]
+        if texts:
+            APIUtil.count_tokens_batch(texts, token_encoding_name)
+        return [
+            APIUtil.calculate_num_token(payload, api_endpoint, token_encoding_name)
+            for payload in payloads
+        ]
+
     @staticmethod
     def create_payload(input_, config, required_, optional_, input_key, **kwargs):
         config = {**config, **kwargs}
@@ -458,11 +816,145 @@ class APIUtil:
         return payload
 
 
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+TOKEN_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536)
+
+
+@dataclass(slots=True)
+class CallRecord:
+    """
+    Telemetry of a single API call.
+
+    Attributes:
+            endpoint (str): The endpoint called.
+            model (str | None): The model called.
+            started (float): The wall clock time the call started at.
+            queue_wait (float): Seconds spent waiting for rate limit capacity.
+            ttfb (float | None): Seconds from sending the request to the first
+                    byte of the response, for the last attempt.
+            latency (float | None): Seconds the whole call took.
+            retries (int): The number of failed attempts before the last one.
+            prompt_tokens (int): The prompt tokens billed.
+            completion_tokens (int): The completion tokens billed.
+            cost (float): The cost of the call in dollars.
+            success (bool): Whether the call returned a response.
+    """
+
+    endpoint: str
+    model: str | None = None
+    started: float = field(default_factory=time.time)
+    queue_wait: float = 0.0
+    ttfb: float | None = None
+    latency: float | None = None
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    success: bool = False
+
+    def add_usage(self, response: Mapping | None, costs=None) -> None:
+        """
+        Records the outcome and token usage of an API response.
+
+        Args:
+                response: The JSON response of the call.
+                costs: The prices of a million prompt and completion tokens.
+        """
+        self.success = bool(response) and "error" not in response
+        usage = (response or {}).get("usage") or {}
+        self.prompt_tokens = usage.get("prompt_tokens", 0) or 0
+        self.completion_tokens = usage.get("completion_tokens", 0) or 0
+        if costs:
+            self.cost = (
+                self.prompt_tokens * costs[0] + self.completion_tokens * costs[1]
+            ) / 1_000_000
+
+
+# the record of the call the current task is making, filled by the rate limiter
+_current_call: contextvars.ContextVar[CallRecord | None] = contextvars.ContextVar(
+    "lionagi_current_call", default=None
+)
+
+
+class _Histogram:
+    """A cumulative histogram that keeps a window of recent observations."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "recent")
+
+    def __init__(self, buckets: tuple, window: int) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(self.buckets, value)
+        if idx < len(self.counts):
+            self.counts[idx] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _CallStats:
+    """The aggregated telemetry of the calls to one endpoint and model."""
+
+    histograms = {
+        "queue_wait_seconds": ("queue_wait", LATENCY_BUCKETS),
+        "ttfb_seconds": ("ttfb", LATENCY_BUCKETS),
+        "latency_seconds": ("latency", LATENCY_BUCKETS),
+        "prompt_tokens": ("prompt_tokens", TOKEN_BUCKETS),
+        "completion_tokens": ("completion_tokens", TOKEN_BUCKETS),
+    }
+
+    def __init__(self, window: int) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.cost = 0.0
+        self.metrics = {
+            name: _Histogram(buckets, window)
+            for name, (_, buckets) in self.histograms.items()
+        }
+
+    def observe(self, record: CallRecord) -> None:
+        self.calls += 1
+        self.failures += not record.success
+        self.retries += record.retries
+        self.cost += record.cost
+        for name, (attr, _) in self.histograms.items():
+            if (value := getattr(record, attr)) is not None:
+                self.metrics[name].observe(value)
+
+
 @dataclass
 class StatusTracker:
     """
     Keeps track of various task statuses within a system.
 
+    Besides the task counters, the tracker aggregates the telemetry of the
+    API calls made through `track` per endpoint and model: counters of
+    calls, failures, retries and cost, and histograms of queue wait, time to
+    first byte, latency and token usage. Percentiles are computed over the
+    last `window` calls. The telemetry can be exported as Prometheus text,
+    and each call is emitted as an OpenTelemetry span if `tracer` is set.
+
     Attributes:
             num_tasks_started (int): The number of tasks that have been initiated.
             num_tasks_in_progress (int): The number of tasks currently being processed.
@@ -471,11 +963,17 @@ class StatusTracker:
             num_rate_limit_errors (int): The number of tasks that failed due to rate limiting.
             num_api_errors (int): The number of tasks that failed due to API errors.
             num_other_errors (int): The number of tasks that failed due to other errors.
+            window (int): The number of recent calls percentiles are computed over.
+            tracer (Any): An OpenTelemetry tracer to emit a span per call to.
 
     Examples:
             >>> tracker = StatusTracker()
             >>> tracker.num_tasks_started += 1
             >>> tracker.num_tasks_succeeded += 1
+            >>> with tracker.track("chat/completions", "gpt-4o") as record:
+            ...     response = await call()
+            ...     record.add_usage(response)
+            >>> tracker.summary()[("chat/completions", "gpt-4o")]["latency_seconds"]["p95"]
     """
 
     num_tasks_started: int = 0
@@ -485,78 +983,583 @@ class StatusTracker:
     num_rate_limit_errors: int = 0
     num_api_errors: int = 0
     num_other_errors: int = 0
+    window: int = 1024
+    tracer: Any = None
+    _stats: dict = field(default_factory=dict, repr=False)
+
+    @contextlib.contextmanager
+    def track(self, endpoint: str, model: str = None):
+        """
+        Measures an API call made inside the context.
+
+        Rate limited calls made by the current task fill in the queue wait,
+        time to first byte and retries of the record; the caller records the
+        response with `CallRecord.add_usage`. The call counts as failed if the
+        context raises.
+
+        Args:
+                endpoint: The endpoint called.
+                model: The model called.
+
+        Yields:
+                CallRecord: The record of the call.
+        """
+        record = CallRecord(endpoint, model)
+        token = _current_call.set(record)
+        started = time.monotonic()
+        try:
+            yield record
+        except BaseException:
+            record.success = False
+            raise
+        finally:
+            _current_call.reset(token)
+            record.latency = time.monotonic() - started
+            self.record(record)
+
+    async def track_stream(
+        self, stream, endpoint: str, model: str = None, costs=None
+    ):
+        """
+        Passes a streamed response through, measuring it like `track`.
+
+        Token usage is taken from the last chunk that reports it.
+
+        Args:
+                stream: The async iterator over the chunks of the response.
+                endpoint: The endpoint called.
+                model: The model called.
+                costs: The prices of a million prompt and completion tokens.
+
+        Yields:
+                The chunks of the response.
+        """
+        record = CallRecord(endpoint, model)
+        started = time.monotonic()
+        received, usage = False, None
+        try:
+            while True:
+                # only set while the stream runs, not while the consumer does
+                token = _current_call.set(record)
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    _current_call.reset(token)
+                received = True
+                usage = chunk.get("usage") or usage
+                yield chunk
+            record.add_usage({"usage": usage} if received else None, costs)
+        finally:
+            record.latency = time.monotonic() - started
+            self.record(record)
+
+    def record(self, record: CallRecord) -> None:
+        """
+        Adds the telemetry of a call to the aggregates.
+
+        Args:
+                record: The record of the call.
+        """
+        key = (record.endpoint, record.model)
+        if key not in self._stats:
+            self._stats[key] = _CallStats(self.window)
+        self._stats[key].observe(record)
+        if self.tracer is not None:
+            self._emit_span(record)
+
+    def _emit_span(self, record: CallRecord) -> None:
+        start = int(record.started * 1e9)
+        span = self.tracer.start_span(
+            f"lionagi {record.endpoint}",
+            start_time=start,
+            attributes={
+                "lionagi.endpoint": record.endpoint,
+                "lionagi.model": record.model or "",
+                "lionagi.queue_wait": record.queue_wait,
+                "lionagi.ttfb": record.ttfb if record.ttfb is not None else -1.0,
+                "lionagi.retries": record.retries,
+                "lionagi.prompt_tokens": record.prompt_tokens,
+                "lionagi.completion_tokens": record.completion_tokens,
+                "lionagi.cost": record.cost,
+                "lionagi.success": record.success,
+            },
+        )
+        span.end(end_time=start + int((record.latency or 0) * 1e9))
+
+    def summary(self, endpoint: str = None, model: str = None) -> dict:
+        """
+        Returns the aggregated telemetry of the tracked calls.
+
+        Args:
+                endpoint: Only include calls to this endpoint.
+                model: Only include calls to this model.
+
+        Returns:
+                A dictionary mapping (endpoint, model) to the call, failure and
+                retry counts, the total cost, and the count, mean and p50, p95
+                and p99 of each histogram.
+        """
+        out = {}
+        for (ep, m), stats in self._stats.items():
+            if (endpoint and ep != endpoint) or (model and m != model):
+                continue
+            out[(ep, m)] = {
+                "calls": stats.calls,
+                "failures": stats.failures,
+                "retries": stats.retries,
+                "cost": stats.cost,
+                **{name: h.summary() for name, h in stats.metrics.items()},
+            }
+        return out
+
+    def to_prometheus(self, prefix: str = "lionagi") -> str:
+        """
+        Exports the aggregated telemetry in the Prometheus text format.
+
+        Args:
+                prefix: The prefix of the metric names.
+
+        Returns:
+                The metrics as Prometheus exposition text.
+        """
+        lines = []
+        counters = {
+            "calls_total": "calls",
+            "failures_total": "failures",
+            "retries_total": "retries",
+            "cost_dollars_total": "cost",
+        }
+        for name, attr in counters.items():
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, stats in self._stats.items():
+                lines.append(
+                    f"{prefix}_{name}{{{_prometheus_labels(*key)}}} "
+                    f"{getattr(stats, attr)}"
+                )
+
+        for name in _CallStats.histograms:
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for key, stats in self._stats.items():
+                h, labels = stats.metrics[name], _prometheus_labels(*key)
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{prefix}_{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="+Inf"}} {h.count}')
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {h.sum}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_labels(endpoint: str, model: str | None) -> str:
+    def escape(value) -> str:
+        return str(value or "").replace("\\", "\\\\").replace('"', '\\"')
+
+    return f'endpoint="{escape(endpoint)}",model="{escape(model)}"'
 
 
 class BaseRateLimiter(ABC):
     """
     Abstract base class for implementing rate limiters.
 
-    This class provides the basic structure for rate limiters, including
-    the replenishment of request and token capacities at regular intervals.
+    Request and token capacities are modelled as token buckets that refill
+    continuously at ``max_requests / interval`` and ``max_tokens / interval``
+    per second, up to their maximum. Callers that cannot be served immediately
+    wait on a future that is resolved as soon as enough capacity has refilled.
+    Waiters are served strictly in order of priority (higher first), and in
+    FIFO order within the same priority.
+
+    When ``adaptive`` is set, the buckets are resynchronised from the
+    ``x-ratelimit-remaining-*`` and ``x-ratelimit-reset-*`` headers returned
+    by OpenAI-compatible providers, so quota used by other processes sharing
+    the same key is accounted for. Concurrent calls are also bounded by an
+    AIMD window: it grows by ``1 / window`` on every success and is cut by
+    ``backoff_ratio`` on a rate limit error.
 
     Attributes:
-            interval: The time interval in seconds for replenishing capacities.
+            interval: The time interval in seconds over which the full capacities refill.
             max_requests: The maximum number of requests allowed per interval.
             max_tokens: The maximum number of tokens allowed per interval.
             available_request_capacity: The current available request capacity.
             available_token_capacity: The current available token capacity.
-            rate_limit_replenisher_task: The asyncio task for replenishing capacities.
+            rate_limit_replenisher_task: Kept for backward compatibility, the
+                    buckets refill without a background task.
+            adaptive: Whether provider headers and rate limit errors adjust the limiter.
+            max_concurrency: The ceiling for concurrent calls, None for no ceiling.
+            concurrency_limit: The current AIMD window, None until the first
+                    rate limit error when no ceiling is set.
     """
 
+    backoff_ratio: float = 0.5
+    rate_limit_backoff: float = 15
+
     def __init__(
         self,
         max_requests: int,
         max_tokens: int,
         interval: int = 60,
         token_encoding_name=None,
+        adaptive: bool = True,
+        max_concurrency: int | None = None,
     ) -> None:
         self.interval: int = interval
         self.max_requests: int = max_requests
         self.max_tokens: int = max_tokens
-        self.available_request_capacity: int = max_requests
-        self.available_token_capacity: int = max_tokens
+        self._request_level: float = float(max_requests)
+        self._token_level: float = float(max_tokens)
+        self._last_refill: float = time.monotonic()
+        self._waiters: list = []  # heap of (-priority, seq, tokens, future)
+        self._waiter_seq = itertools.count()
+        self._wakeup_handle: asyncio.TimerHandle | None = None
         self.rate_limit_replenisher_task: AsyncUtil.Task | None = None
         self._stop_replenishing: AsyncUtil.Event = AsyncUtil.create_event()
         self._lock: AsyncUtil.Lock = AsyncUtil.create_lock()
         self.token_encoding_name = token_encoding_name
+        self.adaptive = adaptive
+        self.max_concurrency = max_concurrency
+        self.concurrency_limit: float | None = max_concurrency
+        self._in_flight: int = 0
+        self._in_flight_tokens: float = 0
+        self._slot_waiters: deque = deque()
+        self._blocked_until: float = 0.0
+        self._last_backoff: float = 0.0
+
+    @property
+    def available_request_capacity(self) -> float:
+        self._refill()
+        return self._request_level
+
+    @available_request_capacity.setter
+    def available_request_capacity(self, value: float) -> None:
+        self._refill()
+        self._request_level = value
+
+    @property
+    def available_token_capacity(self) -> float:
+        self._refill()
+        return self._token_level
+
+    @available_token_capacity.setter
+    def available_token_capacity(self, value: float) -> None:
+        self._refill()
+        self._token_level = value
+
+    @property
+    def num_waiting(self) -> int:
+        """The number of callers currently waiting for capacity."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _refill(self) -> None:
+        """Adds the capacity accrued since the last refill, up to the maximum."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed <= 0:
+            return
+        self._last_refill = now
+        if self.interval <= 0:
+            self._request_level = float(self.max_requests)
+            self._token_level = float(self.max_tokens)
+            return
+        self._request_level = min(
+            self.max_requests,
+            self._request_level + elapsed * self.max_requests / self.interval,
+        )
+        self._token_level = min(
+            self.max_tokens,
+            self._token_level + elapsed * self.max_tokens / self.interval,
+        )
+
+    def _cost(self, required_tokens) -> float:
+        # a request larger than the bucket is admitted once the bucket is full
+        return min(required_tokens or 0, self.max_tokens)
+
+    def _has_capacity(self, tokens: float) -> bool:
+        return (
+            self._request_level >= 1 - _EPSILON
+            and self._token_level >= tokens - _EPSILON
+            and time.monotonic() >= self._blocked_until
+        )
+
+    def _consume(self, tokens: float) -> None:
+        self._request_level -= 1
+        self._token_level -= tokens
+
+    def _time_until(self, requests: float, tokens: float) -> float:
+        """Seconds until the buckets hold the given amounts, ignoring the caps."""
+        wait = max(0.0, self._blocked_until - time.monotonic())
+        for needed, level, maximum in (
+            (requests, self._request_level, self.max_requests),
+            (tokens, self._token_level, self.max_tokens),
+        ):
+            if needed - level <= _EPSILON:
+                continue
+            if maximum <= 0 or self.interval <= 0:
+                return float("inf") if maximum <= 0 else 0.0
+            wait = max(wait, (needed - level) * self.interval / maximum)
+        return wait
+
+    def expected_wait(self, required_tokens: int = 0) -> float:
+        """
+        Estimates how long a request submitted now would wait for capacity.
+
+        The estimate accounts for the demand of every caller already queued
+        ahead of it at the same or higher priority.
+
+        Args:
+                required_tokens: The number of tokens the request needs.
+
+        Returns:
+                The expected wait in seconds, 0 if it can be served immediately.
+        """
+        self._refill()
+        queued = [w for w in self._waiters if not w[3].done()]
+        return self._time_until(
+            len(queued) + 1,
+            sum(w[2] for w in queued) + self._cost(required_tokens),
+        )
+
+    async def acquire(self, required_tokens: int = 0, priority: int = 0) -> float:
+        """
+        Waits until the request and its tokens fit in the buckets, then reserves them.
+
+        Args:
+                required_tokens: The number of tokens the request needs.
+                priority: Waiters with a higher priority are served first.
+
+        Returns:
+                The number of seconds spent waiting.
+        """
+        tokens = self._cost(required_tokens)
+        self._refill()
+        if not self._waiters and self._has_capacity(tokens):
+            self._consume(tokens)
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (-priority, next(self._waiter_seq), tokens, future)
+        )
+        start = time.monotonic()
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(tokens)
+            else:
+                future.cancel()
+                self._dispatch()
+            raise
+        return time.monotonic() - start
+
+    def release(self, required_tokens: int = 0) -> None:
+        """Returns capacity reserved by a request that was never sent."""
+        self._refill()
+        self._request_level = min(self.max_requests, self._request_level + 1)
+        self._token_level = min(
+            self.max_tokens, self._token_level + self._cost(required_tokens)
+        )
+        if self._waiters:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Serves queued waiters that fit and schedules a wakeup for the next one."""
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+
+        self._refill()
+        while self._waiters:
+            *_, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._has_capacity(tokens):
+                break
+            heapq.heappop(self._waiters)
+            self._consume(tokens)
+            future.set_result(True)
+
+        if self._waiters:
+            delay = self._time_until(1, self._waiters[0][2])
+            if delay != float("inf"):
+                self._wakeup_handle = asyncio.get_running_loop().call_later(
+                    delay, self._dispatch
+                )
+
+    def block_for(self, seconds: float) -> None:
+        """Holds back every waiter for at least the given number of seconds."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._refill()
+        if any(not w[3].done() for w in self._waiters):
+            self._dispatch()
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Resynchronises the buckets with the rate limit headers of a response.
+
+        The remaining requests and tokens reported by the provider replace the
+        local estimates, minus what this limiter still has in flight. When a
+        bucket is reported empty, waiters are held until its reset time.
+
+        Args:
+                headers: The response headers.
+        """
+        if not self.adaptive or not headers:
+            return
+        headers = {str(k).lower(): v for k, v in headers.items()}
+        self._refill()
+
+        for kind, in_flight in (
+            ("requests", self._in_flight),
+            ("tokens", self._in_flight_tokens),
+        ):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            try:
+                remaining = float(remaining)
+            except (TypeError, ValueError):
+                continue
+
+            level = max(0.0, remaining - in_flight)
+            if kind == "requests":
+                self._request_level = min(self.max_requests, level)
+                exhausted = self._request_level < 1
+            else:
+                self._token_level = min(self.max_tokens, level)
+                exhausted = self._token_level <= 0
+
+            reset = APIUtil.parse_rate_limit_reset(
+                headers.get(f"x-ratelimit-reset-{kind}")
+            )
+            if exhausted and reset:
+                self.block_for(reset)
+
+        if self._waiters:
+            self._dispatch()
+
+    def on_rate_limited(
+        self, headers: Mapping[str, str] | None = None, started: float = None
+    ) -> float:
+        """
+        Backs off after a rate limit error.
+
+        The concurrency window is cut multiplicatively, at most once for the
+        calls started before the previous cut, and every waiter is held until
+        the provider's retry hint, or ``rate_limit_backoff`` seconds without one.
+
+        Args:
+                headers: The headers of the rate limited response.
+                started: The ``time.monotonic()`` at which the failed call started.
+
+        Returns:
+                The number of seconds waiters are held back.
+        """
+        headers = {str(k).lower(): v for k, v in (headers or {}).items()}
+        retry_after = None
+        if "retry-after-ms" in headers:
+            retry_after = APIUtil.parse_rate_limit_reset(headers["retry-after-ms"])
+            retry_after = retry_after / 1000 if retry_after is not None else None
+        if retry_after is None:
+            retry_after = APIUtil.parse_rate_limit_reset(headers.get("retry-after"))
+        if retry_after is None:
+            resets = [
+                APIUtil.parse_rate_limit_reset(headers.get(f"x-ratelimit-reset-{k}"))
+                for k in ("requests", "tokens")
+            ]
+            resets = [r for r in resets if r is not None]
+            retry_after = max(resets) if resets else self.rate_limit_backoff
+
+        if self.adaptive and (started is None or started >= self._last_backoff):
+            # without a window yet, start from the calls in flight plus this one
+            window = self.concurrency_limit or self._in_flight + 1
+            self.concurrency_limit = max(1.0, window * self.backoff_ratio)
+            self._last_backoff = time.monotonic()
+
+        self.block_for(retry_after)
+        return retry_after
+
+    def on_success(self) -> None:
+        """Grows the concurrency window additively after a successful call."""
+        if not self.adaptive or self.concurrency_limit is None:
+            return
+        ceiling = self.max_concurrency or float("inf")
+        self.concurrency_limit = min(
+            ceiling, self.concurrency_limit + 1 / self.concurrency_limit
+        )
+        self._wake_slot_waiters()
+
+    def _free_slots(self) -> float:
+        if self.concurrency_limit is None:
+            return float("inf")
+        return max(int(self.concurrency_limit), 1) - self._in_flight
+
+    def _wake_slot_waiters(self) -> None:
+        free = self._free_slots()
+        while free > 0 and self._slot_waiters:
+            future = self._slot_waiters.popleft()
+            if not future.done():
+                future.set_result(True)
+                free -= 1
+
+    async def _begin_request(self, tokens: float) -> None:
+        """Waits for a free slot in the concurrency window and occupies it."""
+        while self._free_slots() <= 0:
+            future = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._wake_slot_waiters()
+                else:
+                    future.cancel()
+                raise
+        self._in_flight += 1
+        self._in_flight_tokens += tokens
+
+    def _end_request(self, tokens: float) -> None:
+        self._in_flight -= 1
+        self._in_flight_tokens -= tokens
+        self._wake_slot_waiters()
 
     async def start_replenishing(self) -> NoReturn:
-        """Starts the replenishment of rate limit capacities at regular intervals."""
+        """
+        Kept for backward compatibility.
+
+        Capacities refill continuously as they are read, so this only waits
+        until ``stop_replenishing`` is called.
+        """
         try:
-            while not self._stop_replenishing.is_set():
-                await AsyncUtil.sleep(self.interval)
-                async with self._lock:
-                    self.available_request_capacity = self.max_requests
-                    self.available_token_capacity = self.max_tokens
+            await self._stop_replenishing.wait()
         except asyncio.CancelledError:
             logging.info("Rate limit replenisher task cancelled.")
-        except Exception as e:
-            logging.error(f"An error occurred in the rate limit replenisher: {e}")
 
     async def stop_replenishing(self) -> None:
-        """Stops the replenishment task."""
+        """Stops the replenisher task, if any, and cancels the pending wakeup."""
         if self.rate_limit_replenisher_task:
             self.rate_limit_replenisher_task.cancel()
             await self.rate_limit_replenisher_task
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
         self._stop_replenishing.set()
 
     async def request_permission(self, required_tokens) -> bool:
         """Requests permission to make an API call.
 
         Returns True if the request can be made immediately, otherwise False.
+        Never jumps ahead of callers already waiting in ``acquire``.
         """
-        async with self._lock:
-            if (
-                self.available_request_capacity > 0
-                and self.available_token_capacity > 0
-            ):
-                self.available_request_capacity -= 1
-                self.available_token_capacity -= (
-                    required_tokens
-                    # Assuming 1 token per request for simplicity
-                )
-                return True
-            return False
+        tokens = self._cost(required_tokens)
+        self._refill()
+        if not self._waiters and self._has_capacity(tokens):
+            self._consume(tokens)
+            return True
+        return False
 
     async def _call_api(
         self,
@@ -568,6 +1571,7 @@ class BaseRateLimiter(ABC):
         method: str = "post",
         payload: Mapping[str, any] = None,
         required_tokens: int = None,
+        priority: int = 0,
         **kwargs,
     ) -> Mapping[str, any] | None:
         """
@@ -581,57 +1585,175 @@ class BaseRateLimiter(ABC):
                 max_attempts: The maximum number of attempts for the API call.
                 method: The HTTP method to use for the API call.
                 payload: The payload to send with the API call.
+                required_tokens: The number of tokens the call needs, computed
+                        from the payload if not given.
+                priority: Calls with a higher priority acquire capacity first.
 
         Returns:
                 The JSON assistant_response from the API call if successful, otherwise None.
         """
         endpoint = APIUtil.api_endpoint_from_url(base_url + endpoint)
-        while True:
-            if (
-                self.available_request_capacity < 1
-                or self.available_token_capacity < 10
-            ):  # Minimum token count
-                await AsyncUtil.sleep(1)  # Wait for capacity
-                continue
+        if not required_tokens:
+            required_tokens = APIUtil.calculate_num_token(
+                payload, endpoint, self.token_encoding_name, **kwargs
+            )
 
-            if not required_tokens:
-                required_tokens = APIUtil.calculate_num_token(
-                    payload, endpoint, self.token_encoding_name, **kwargs
-                )
+        request_headers = {"Authorization": f"Bearer {api_key}"}
+        tokens = self._cost(required_tokens)
+        attempts_left = max_attempts
+
+        record = _current_call.get()
+        while attempts_left > 0:
+            if record is not None and attempts_left < max_attempts:
+                record.retries += 1
+            waiting = time.monotonic()
+            await self.acquire(required_tokens, priority=priority)
+            await self._begin_request(tokens)
+            started = time.monotonic()
+            if record is not None:
+                record.queue_wait += started - waiting
+            in_flight = True
+            try:
+                api_call = APIUtil.api_method(http_session, method)
+                async with api_call(
+                    url=(base_url + endpoint),
+                    headers=request_headers,
+                    json=payload,
+                ) as response:
+                    self._end_request(tokens)
+                    in_flight = False
+                    if record is not None:
+                        record.ttfb = time.monotonic() - started
+                    self.update_from_headers(response.headers)
+                    response_json = await response.json()
+
+                    if "error" not in response_json:
+                        self.on_success()
+                        return response_json
+                    logging.warning(
+                        f"API call failed with error: {response_json['error']}"
+                    )
+                    attempts_left -= 1
+
+                    error = response_json["error"]
+                    if response.status == 429 or (
+                        isinstance(error, dict)
+                        and "Rate limit" in error.get("message", "")
+                    ):
+                        self.on_rate_limited(response.headers, started)
+            except Exception as e:
+                logging.warning(f"API call failed with exception: {e}")
+                attempts_left -= 1
+            finally:
+                if in_flight:
+                    self._end_request(tokens)
+
+        logging.error("API call failed after all attempts.")
+
+    async def _stream_api(
+        self,
+        http_session,
+        endpoint: str,
+        base_url: str,
+        api_key: str,
+        max_attempts: int = 3,
+        method: str = "post",
+        payload: Mapping[str, any] = None,
+        required_tokens: int = None,
+        priority: int = 0,
+        **kwargs,
+    ):
+        """
+        Makes a streaming API call and yields its server-sent events.
 
-            if await self.request_permission(required_tokens):
-                request_headers = {"Authorization": f"Bearer {api_key}"}
-                attempts_left = max_attempts
-
-                while attempts_left > 0:
-                    try:
-                        method = APIUtil.api_method(http_session, method)
-                        async with method(
-                            url=(base_url + endpoint),
-                            headers=request_headers,
-                            json=payload,
-                        ) as response:
-                            response_json = await response.json()
-
-                            if "error" not in response_json:
-                                return response_json
-                            logging.warning(
-                                f"API call failed with error: {response_json['error']}"
-                            )
-                            attempts_left -= 1
-
-                            if "Rate limit" in response_json["error"].get(
-                                "message", ""
-                            ):
-                                await AsyncUtil.sleep(15)
-                    except Exception as e:
-                        logging.warning(f"API call failed with exception: {e}")
-                        attempts_left -= 1
+        Capacity is acquired as in `_call_api`, and the request counts as in
+        flight until the stream ends. Failed attempts are retried only until
+        the first event arrives; a stream that fails midway, or whose every
+        attempt fails, raises.
 
-                logging.error("API call failed after all attempts.")
-                break
-            else:
-                await AsyncUtil.sleep(1)
+        Args:
+                http_session: The aiohttp client session to use for the API call.
+                endpoint: The API endpoint to call.
+                base_url: The base URL of the API.
+                api_key: The API key for authentication.
+                max_attempts: The maximum number of attempts for the API call.
+                method: The HTTP method to use for the API call.
+                payload: The payload to send with the API call.
+                required_tokens: The number of tokens the call needs, computed
+                        from the payload if not given.
+                priority: Calls with a higher priority acquire capacity first.
+
+        Yields:
+                The JSON payload of each event of the response stream.
+        """
+        endpoint = APIUtil.api_endpoint_from_url(base_url + endpoint)
+        if not required_tokens:
+            required_tokens = APIUtil.calculate_num_token(
+                payload, endpoint, self.token_encoding_name, **kwargs
+            )
+
+        request_headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "text/event-stream",
+        }
+        tokens = self._cost(required_tokens)
+        attempts_left = max_attempts
+        last_error = None
+
+        record = _current_call.get()
+        while attempts_left > 0:
+            if record is not None and attempts_left < max_attempts:
+                record.retries += 1
+            waiting = time.monotonic()
+            await self.acquire(required_tokens, priority=priority)
+            await self._begin_request(tokens)
+            started = time.monotonic()
+            if record is not None:
+                record.queue_wait += started - waiting
+            streamed = False
+            try:
+                api_call = APIUtil.api_method(http_session, method)
+                async with api_call(
+                    url=(base_url + endpoint),
+                    headers=request_headers,
+                    json=payload,
+                ) as response:
+                    self.update_from_headers(response.headers)
+                    if response.status >= 400:
+                        response_json = await response.json()
+                        error = response_json.get("error", response_json)
+                        logging.warning(f"API call failed with error: {error}")
+                        last_error = RuntimeError(f"API call failed with error: {error}")
+                        attempts_left -= 1
+                        if response.status == 429 or (
+                            isinstance(error, dict)
+                            and "Rate limit" in error.get("message", "")
+                        ):
+                            self.on_rate_limited(response.headers, started)
+                        continue
+
+                    async for event in APIUtil.iter_sse(response.content):
+                        if "error" in event:
+                            raise RuntimeError(
+                                f"API call failed with error: {event['error']}"
+                            )
+                        if not streamed and record is not None:
+                            record.ttfb = time.monotonic() - started
+                        streamed = True
+                        yield event
+                    self.on_success()
+                    return
+            except Exception as e:
+                if streamed:
+                    raise
+                logging.warning(f"API call failed with exception: {e}")
+                last_error = e
+                attempts_left -= 1
+            finally:
+                self._end_request(tokens)
+
+        logging.error("API call failed after all attempts.")
+        raise RuntimeError("API call failed after all attempts.") from last_error
 
     @classmethod
     async def create(
@@ -640,24 +1762,23 @@ class BaseRateLimiter(ABC):
         max_tokens: int,
         interval: int = 60,
         token_encoding_name=None,
+        **kwargs,
     ) -> "BaseRateLimiter":
         """
-        Creates an instance of BaseRateLimiter and starts the replenisher task.
+        Creates an instance of BaseRateLimiter.
 
         Args:
                 max_requests: The maximum number of requests allowed per interval.
                 max_tokens: The maximum number of tokens allowed per interval.
                 interval: The time interval in seconds for replenishing capacities.
                 token_encoding_name: The name of the token encoding to use.
+                **kwargs: Additional arguments for the rate limiter, such as
+                        ``adaptive`` or ``max_concurrency``.
 
         Returns:
-                An instance of BaseRateLimiter with the replenisher task started.
+                An instance of BaseRateLimiter with full capacities.
         """
-        instance = cls(max_requests, max_tokens, interval, token_encoding_name)
-        instance.rate_limit_replenisher_task = AsyncUtil.create_task(
-            instance.start_replenishing(), obj=False
-        )
-        return instance
+        return cls(max_requests, max_tokens, interval, token_encoding_name, **kwargs)
 
 
 class SimpleRateLimiter(BaseRateLimiter):
@@ -673,9 +1794,18 @@ class SimpleRateLimiter(BaseRateLimiter):
         max_tokens: int,
         interval: int = 60,
         token_encoding_name=None,
+        adaptive: bool = True,
+        max_concurrency: int | None = None,
     ) -> None:
         """Initializes the SimpleRateLimiter with the specified parameters."""
-        super().__init__(max_requests, max_tokens, interval, token_encoding_name)
+        super().__init__(
+            max_requests,
+            max_tokens,
+            interval,
+            token_encoding_name,
+            adaptive=adaptive,
+            max_concurrency=max_concurrency,
+        )
 
 
 class EndPoint:
@@ -691,6 +1821,8 @@ class EndPoint:
             max_tokens (int): The maximum number of tokens allowed per interval.
             interval (int): The time interval in seconds for replenishing rate limit capacities.
             config (Mapping): Configuration parameters for the endpoint.
+            rate_limiter_config (Mapping): Additional arguments for the rate limiter,
+                such as ``adaptive`` or ``max_concurrency``.
             rate_limiter (Optional[li.BaseRateLimiter]): The rate limiter instance for this endpoint.
 
     Examples:
@@ -715,6 +1847,7 @@ class EndPoint:
         rate_limiter_class: Type[BaseRateLimiter] = SimpleRateLimiter,
         token_encoding_name=None,
         config: Mapping = None,
+        rate_limiter_config: Mapping = None,
     ) -> None:
         self.endpoint = endpoint_ or "chat/completions"
         self.rate_limiter_class = rate_limiter_class
@@ -723,13 +1856,18 @@ class EndPoint:
         self.interval = interval
         self.token_encoding_name = token_encoding_name
         self.config = config or {}
+        self.rate_limiter_config = rate_limiter_config or {}
         self.rate_limiter: BaseRateLimiter | None = None
         self._has_initialized = False
 
     async def init_rate_limiter(self) -> None:
         """Initializes the rate limiter for the endpoint."""
         self.rate_limiter = await self.rate_limiter_class.create(
-            self.max_requests, self.max_tokens, self.interval, self.token_encoding_name
+            self.max_requests,
+            self.max_tokens,
+            self.interval,
+            self.token_encoding_name,
+            **self.rate_limiter_config,
         )
         self._has_initialized = True
 
@@ -740,11 +1878,22 @@ class BaseService:
 
     This class provides a foundation for services that need to make API calls with rate limiting.
 
+    By default, calls share a lazily created, per-service aiohttp session whose
+    connector keeps connections alive, caches DNS lookups and bounds the number
+    of connections per host. Set ``pooled=False`` to open a fresh session for
+    every call. Pooled services should be closed with ``await service.close()``
+    or used as an async context manager; a session left open is closed when
+    its event loop shuts down under ``asyncio.run``, and one whose loop is
+    already gone has its connections closed when it is replaced.
+
     Attributes:
             api_key (Optional[str]): The API key used for authentication.
             schema (Mapping[str, Any]): The schema defining the service's endpoints.
             status_tracker (StatusTracker): The object tracking the status of API calls.
             endpoints (Mapping[str, EndPoint]): A dictionary of endpoint objects.
+            pooled (bool): Whether calls reuse the service's pooled HTTP session.
+            connector_config (Mapping[str, Any]): Keyword arguments for the pooled
+                    session's ``aiohttp.TCPConnector``.
     """
 
     base_url: str = ""
@@ -758,6 +1907,11 @@ class BaseService:
         max_tokens: int = 100_000,
         max_requests: int = 1_000,
         interval: int = 60,
+        pooled: bool = True,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 50,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
     ) -> None:
         self.api_key = api_key
         self.schema = schema or {}
@@ -769,6 +1923,92 @@ class BaseService:
             "max_tokens": max_tokens,
             "interval": interval,
         }
+        self.pooled = pooled
+        self.connector_config = {
+            "limit": connection_limit,
+            "limit_per_host": connection_limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl,
+        }
+        self._http_session: aiohttp.ClientSession | None = None
+        self._http_session_loop: asyncio.AbstractEventLoop | None = None
+        self._http_session_guard: asyncio.Task | None = None
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled HTTP session of the service, creating it lazily.
+
+        The session is bound to the event loop it was created on. If that loop
+        is no longer the running one (e.g. after successive ``asyncio.run``
+        calls), the stale session is discarded and a new one is created.
+
+        Returns:
+                The long-lived aiohttp client session for this service.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_session is not None and not self._http_session.closed:
+            if self._http_session_loop is loop:
+                return self._http_session
+            self._discard_http_session()
+        elif self._http_session_guard is not None and self._http_session_loop is loop:
+            self._http_session_guard.cancel()
+
+        self._http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**self.connector_config)
+        )
+        self._http_session_loop = loop
+        self._http_session_guard = loop.create_task(
+            self._close_at_shutdown(self._http_session)
+        )
+        return self._http_session
+
+    @staticmethod
+    async def _close_at_shutdown(session: aiohttp.ClientSession) -> None:
+        """
+        Waits until cancelled, as ``asyncio.run`` does with the tasks still
+        pending when it shuts the loop down, then closes the session.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if not session.closed:
+                await session.close()
+
+    def _discard_http_session(self) -> None:
+        """Drops a session that belongs to an event loop other than the running one."""
+        session, self._http_session = self._http_session, None
+        loop, self._http_session_loop = self._http_session_loop, None
+        self._http_session_guard = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # the owning loop cannot run the close, shut the sockets directly
+            connector = session.connector
+            session.detach()
+            if connector is not None:
+                connector._close()
+
+    async def close(self) -> None:
+        """Closes the pooled HTTP session and releases its connections."""
+        session, self._http_session = self._http_session, None
+        loop, self._http_session_loop = self._http_session_loop, None
+        guard, self._http_session_guard = self._http_session_guard, None
+        if loop is not asyncio.get_running_loop():
+            self._http_session, self._http_session_loop = session, loop
+            self._discard_http_session()
+            return
+        if guard is not None:
+            guard.cancel()
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     async def init_endpoint(
         self,
@@ -864,20 +2104,71 @@ class BaseService:
         Raises:
                 ValueError: If the endpoint has not been initialized.
         """
-        if endpoint not in self.endpoints.keys():
-            raise ValueError(f"The endpoint {endpoint} has not initialized.")
+        call_kwargs = self._call_kwargs(
+            payload, endpoint, method, required_tokens, **kwargs
+        )
+        rate_limiter = self.endpoints[endpoint].rate_limiter
+
+        if self.pooled:
+            return await rate_limiter._call_api(
+                http_session=self._get_http_session(), **call_kwargs
+            )
+
         async with aiohttp.ClientSession() as http_session:
-            return await self.endpoints[endpoint].rate_limiter._call_api(
-                http_session=http_session,
-                endpoint=endpoint,
-                base_url=self.base_url,
-                api_key=self.api_key,
-                method=method,
-                payload=payload,
-                required_tokens=required_tokens,
-                **kwargs,
+            return await rate_limiter._call_api(
+                http_session=http_session, **call_kwargs
             )
 
+    async def stream_api(
+        self, payload, endpoint, method, required_tokens=None, **kwargs
+    ):
+        """
+        Calls the specified API endpoint and streams the response.
+
+        Args:
+                payload: The payload to send with the API call, which should ask
+                        the API to stream its response.
+                endpoint: The endpoint to call.
+                method: The HTTP method to use for the call.
+
+        Yields:
+                The JSON payload of each server-sent event of the response.
+
+        Raises:
+                ValueError: If the endpoint has not been initialized.
+        """
+        call_kwargs = self._call_kwargs(
+            payload, endpoint, method, required_tokens, **kwargs
+        )
+        rate_limiter = self.endpoints[endpoint].rate_limiter
+
+        if self.pooled:
+            async for event in rate_limiter._stream_api(
+                http_session=self._get_http_session(), **call_kwargs
+            ):
+                yield event
+            return
+
+        async with aiohttp.ClientSession() as http_session:
+            async for event in rate_limiter._stream_api(
+                http_session=http_session, **call_kwargs
+            ):
+                yield event
+
+    def _call_kwargs(self, payload, endpoint, method, required_tokens, **kwargs):
+        if endpoint not in self.endpoints.keys():
+            raise ValueError(f"The endpoint {endpoint} has not initialized.")
+
+        return {
+            "endpoint": endpoint,
+            "base_url": self.base_url,
+            "api_key": self.api_key,
+            "method": method,
+            "payload": payload,
+            "required_tokens": required_tokens,
+            **kwargs,
+        }
+
 
 class PayloadPackage:
 
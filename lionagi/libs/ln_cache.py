@@ -0,0 +1,472 @@
+"""
+Copyright 2024 HaiyangLi
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+from lionagi.libs.sys_util import SysUtil
+
+# parameters that do not change what the model generates
+UNCACHED_PARAMS = ("sender", "stream", "stream_options", "user", "required_tokens")
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached responses.
+
+    Values must be JSON serializable. Entries older than `ttl` seconds are
+    treated as missing, and the least recently used entries are evicted once
+    the backend holds more than `maxsize` entries.
+
+    Attributes:
+        maxsize (int | None): The maximum number of entries, unbounded if None.
+        ttl (float | None): Seconds an entry stays valid, forever if None.
+        evictions (int): The number of entries evicted to respect `maxsize`.
+        blocking (bool): Whether calls do I/O, in which case async callers run
+            them in a worker thread instead of on the event loop.
+    """
+
+    blocking = True
+
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Returns the value stored under a key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Stores a value under a key."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def close(self) -> None:
+        """Releases the resources held by the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    An in-memory LRU backend. Values are copied in and out, so callers may
+    mutate what they store or get.
+    """
+
+    blocking = False
+
+    def __init__(self, maxsize: int | None = 10_000, ttl: float | None = None):
+        super().__init__(maxsize, ttl)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            if (entry := self._data.get(key)) is None:
+                return None
+            if self._expired(entry[0]):
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return deepcopy(entry[1])
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.time(), deepcopy(value))
+            self._data.move_to_end(key)
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    An on-disk backend stored in a SQLite database, so cached responses
+    survive restarts and can be shared between processes.
+
+    The number of entries is counted once when the database is opened and
+    kept up to date on every write, so `maxsize` is enforced without
+    scanning the table. Entries written by other processes are not counted
+    until the database is reopened.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "lionagi_cache.sqlite",
+        maxsize: int | None = None,
+        ttl: float | None = None,
+    ):
+        super().__init__(maxsize, ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)"
+            )
+        self._size = self._count()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[1]):
+                self._delete(key)
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        row = (json.dumps(value), now, now, key)
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                "UPDATE cache SET value = ?, created = ?, accessed = ? WHERE key = ?",
+                row,
+            ).rowcount
+            if not updated:
+                self._conn.execute(
+                    "INSERT INTO cache (value, created, accessed, key) "
+                    "VALUES (?, ?, ?, ?)",
+                    row,
+                )
+                self._size += 1
+            if self.maxsize is not None and self._size > self.maxsize:
+                evicted = self._conn.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY accessed LIMIT ?)",
+                    (self._size - self.maxsize,),
+                ).rowcount
+                self._size -= evicted
+                self.evictions += evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._delete(key)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+            self._size = 0
+
+    def _delete(self, key: str) -> None:
+        self._size -= self._conn.execute(
+            "DELETE FROM cache WHERE key = ?", (key,)
+        ).rowcount
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LMDBCacheBackend(CacheBackend):
+    """
+    An on-disk backend stored in an LMDB environment. Requires the `lmdb`
+    package. Entries are evicted oldest first, since LMDB keeps no access
+    order.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "lionagi_cache.lmdb",
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        map_size: int = 1 << 30,
+    ):
+        super().__init__(maxsize, ttl)
+        SysUtil.check_import("lmdb")
+        import lmdb
+
+        self.path = Path(path)
+        self._env = lmdb.open(str(self.path), map_size=map_size, subdir=True)
+        self._db = self._env.open_db()
+
+    def get(self, key: str) -> Any | None:
+        with self._env.begin() as txn:
+            raw = txn.get(key.encode())
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        if self._expired(entry["created"]):
+            self.delete(key)
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        entry = json.dumps({"created": time.time(), "value": value}).encode()
+        with self._env.begin(write=True) as txn:
+            txn.put(key.encode(), entry)
+            if self.maxsize is None:
+                return
+            excess = txn.stat(self._db)["entries"] - self.maxsize
+            if excess > 0:
+                created = sorted(
+                    (json.loads(raw)["created"], k) for k, raw in txn.cursor()
+                )
+                for _, k in created[:excess]:
+                    txn.delete(k)
+                self.evictions += excess
+
+    def delete(self, key: str) -> None:
+        with self._env.begin(write=True) as txn:
+            txn.delete(key.encode())
+
+    def clear(self) -> None:
+        with self._env.begin(write=True) as txn:
+            cursor = txn.cursor()
+            while cursor.first():
+                cursor.delete()
+
+    def __len__(self) -> int:
+        return self._env.stat()["entries"]
+
+    def close(self) -> None:
+        self._env.close()
+
+
+CACHE_BACKENDS = {
+    "memory": MemoryCacheBackend,
+    "sqlite": SQLiteCacheBackend,
+    "lmdb": LMDBCacheBackend,
+}
+
+
+class CompletionCache:
+    """
+    A content-addressed cache of model responses.
+
+    Responses are keyed by a hash of the canonical JSON of the endpoint, the
+    input and the request parameters, so identical requests share an entry
+    whatever order their parameters were given in. Chat completions are only
+    cached when they are deterministic: a temperature of 0 or a fixed seed.
+
+    Attributes:
+        backend (CacheBackend): The storage of the cached responses.
+        hits (int): The number of lookups that found a response.
+        misses (int): The number of lookups that did not.
+
+    Examples:
+        >>> cache = CompletionCache("sqlite", path="cache.sqlite", ttl=86400)
+        >>> imodel = iModel(cache=cache, temperature=0)
+    """
+
+    def __init__(
+        self,
+        backend: str | CacheBackend = "memory",
+        *,
+        maxsize: int | None = 10_000,
+        ttl: float | None = None,
+        **kwargs,
+    ):
+        """
+        Initializes a new instance of CompletionCache.
+
+        Args:
+            backend (str | CacheBackend): "memory", "sqlite", "lmdb" or a
+                backend instance. Defaults to "memory".
+            maxsize (int, optional): The maximum number of cached responses.
+            ttl (float, optional): Seconds a cached response stays valid.
+            **kwargs: Additional arguments for the backend, such as `path`.
+
+        Raises:
+            ValueError: If the backend name is unknown.
+        """
+        if isinstance(backend, str):
+            if backend not in CACHE_BACKENDS:
+                raise ValueError(
+                    f"Invalid cache backend {backend}. "
+                    f"Expected one of {list(CACHE_BACKENDS)}"
+                )
+            backend = CACHE_BACKENDS[backend](maxsize=maxsize, ttl=ttl, **kwargs)
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint: str, input_: Any, params: dict) -> str:
+        """
+        Computes the key of a request.
+
+        Args:
+            endpoint (str): The endpoint of the request, e.g. "chat/completions".
+            input_ (Any): The messages or text of the request.
+            params (dict): The request parameters, including the model.
+
+        Returns:
+            str: The hex digest identifying the request.
+        """
+        params = {
+            k: v
+            for k, v in params.items()
+            if k not in UNCACHED_PARAMS and v is not None
+        }
+        canonical = json.dumps(
+            [endpoint, input_, params],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def is_cacheable(endpoint: str, params: dict) -> bool:
+        """
+        Checks whether the response to a request is deterministic enough to
+        be cached.
+
+        Args:
+            endpoint (str): The endpoint of the request.
+            params (dict): The request parameters.
+
+        Returns:
+            bool: True for embeddings, and for chat completions with a
+                temperature of 0 or a fixed seed.
+        """
+        if endpoint != "chat/completions":
+            return True
+        return params.get("temperature") == 0 or params.get("seed") is not None
+
+    def get(self, key: str) -> Any | None:
+        """
+        Looks up a cached response and records a hit or a miss.
+
+        Args:
+            key (str): The key of the request.
+
+        Returns:
+            Any | None: The cached response, or None if there is none.
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Caches a response.
+
+        Args:
+            key (str): The key of the request.
+            value (Any): The JSON serializable response.
+        """
+        self.backend.set(key, value)
+
+    async def aget(self, key: str) -> Any | None:
+        """
+        Looks up a cached response without blocking the event loop.
+
+        Args:
+            key (str): The key of the request.
+
+        Returns:
+            Any | None: The cached response, or None if there is none.
+        """
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """
+        Caches a response without blocking the event loop.
+
+        Args:
+            key (str): The key of the request.
+            value (Any): The JSON serializable response.
+        """
+        if self.backend.blocking:
+            await asyncio.to_thread(self.set, key, value)
+        else:
+            self.set(key, value)
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        self.backend.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups that found a cached response."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """
+        Returns the metrics of the cache.
+
+        Returns:
+            dict: The hits, misses, hit rate, size and evictions of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self.backend),
+            "evictions": self.backend.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self.backend)
@@ -21,7 +21,7 @@ import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
-from typing import Any, Callable, Coroutine
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterable
 
 from lionagi.libs.sys_util import SysUtil
 from lionagi.libs.ln_convert import to_list
@@ -93,6 +93,7 @@ async def alcall(
     *,
     flatten: bool = False,
     dropna=False,
+    max_concurrent: int | None = None,
     **kwargs,
 ) -> list[Any]:
     # noinspection GrazieInspection
@@ -115,6 +116,10 @@ async def alcall(
             flatten (bool, optional):
                     Whether to flatten the result. useful when `func` returns a list or iterable
                     that should be merged into a single list. defaults to False.
+            max_concurrent (int, optional):
+                    The maximum number of calls in flight. calls are only created as earlier
+                    ones finish, so at most `max_concurrent` coroutines exist at any time.
+                    defaults to None, which runs all calls at once.
             **kwargs:
                     Keyword arguments to pass to the function.
 
@@ -128,6 +133,15 @@ async def alcall(
             >>> await alcall([1, 2, 3], square)
             [1, 4, 9]
     """
+    if input_ is not None and max_concurrent:
+        lst = to_list(input_)
+        outs_ = [None] * len(lst)
+        async for idx, out in _window_call(
+            lst, func, max_concurrent, ordered=False, **kwargs
+        ):
+            outs_[idx] = out
+        return to_list(outs_, flatten=flatten, dropna=dropna)
+
     tasks = []
     if input_ is not None:
         lst = to_list(input_)
@@ -193,7 +207,13 @@ async def mcall(
 
 
 async def bcall(
-    input_: Any, /, func: Callable, *, batch_size: int, **kwargs
+    input_: Any,
+    /,
+    func: Callable,
+    *,
+    batch_size: int,
+    sliding: bool = False,
+    **kwargs,
 ) -> list[Any]:
     """
     asynchronously call a function on batches of inputs.
@@ -202,6 +222,10 @@ async def bcall(
             input_ (Any): The input_ to process.
             func (Callable): The function to apply.
             batch_size (int): The size of each batch.
+            sliding (bool, optional): If True, use a sliding window instead of fixed
+                    batches: a new call starts as soon as any call finishes, so
+                    `batch_size` calls stay in flight and a slow element does not stall
+                    the others. default is False.
             **kwargs: Keyword arguments to pass to the function.
 
     Returns:
@@ -212,6 +236,9 @@ async def bcall(
             >>> asyncio.run(bcall([1, 2, 3, 4], sum_batch, batch_size=2))
             [3, 7]
     """
+    if sliding:
+        return await alcall(input_, func, max_concurrent=batch_size, **kwargs)
+
     results = []
     input_ = to_list(input_)
     for i in range(0, len(input_), batch_size):
@@ -222,6 +249,47 @@ async def bcall(
     return results
 
 
+async def scall(
+    input_: Iterable[Any],
+    /,
+    func: Callable,
+    *,
+    max_concurrent: int | None = None,
+    ordered: bool = False,
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    asynchronously apply a function to each input, yielding results as they complete.
+
+    inputs are consumed lazily and a new call only starts when a slot frees up, so
+    generators and very long inputs can be streamed with bounded memory. when the
+    consumer stops pulling results, no new calls are started (backpressure). leaving
+    the loop early cancels the calls still in flight.
+
+    Args:
+            input_ (Iterable[Any]): The inputs to process, consumed lazily.
+            func (Callable): The function to apply.
+            max_concurrent (int, optional): The maximum number of calls in flight.
+                    default is None, which starts all calls at once.
+            ordered (bool, optional): If True, yield results in input order; results
+                    waiting for an earlier one count toward `max_concurrent`. default
+                    is False, yielding results in completion order.
+            **kwargs: Keyword arguments to pass to the function.
+
+    Yields:
+            Any: The result of each call.
+
+    examples:
+            >>> async def square(x): return x * x
+            >>> [i async for i in scall([1, 2, 3], square, ordered=True)]
+            [1, 4, 9]
+    """
+    async for _, out in _window_call(
+        input_, func, max_concurrent, ordered=ordered, **kwargs
+    ):
+        yield out
+
+
 async def tcall(
     func: Callable,
     *args,
@@ -394,6 +462,74 @@ async def rcall(
         raise RuntimeError("rcall failed without catching an exception")
 
 
+async def _window_call(
+    input_: Iterable[Any],
+    func: Callable,
+    max_concurrent: int | None,
+    ordered: bool = False,
+    **kwargs,
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    apply a function over a sliding window of in-flight calls.
+
+    Args:
+            input_ (Iterable[Any]): The inputs to process, consumed lazily.
+            func (Callable): The function to apply.
+            max_concurrent (int | None): The size of the window, None for unbounded.
+            ordered (bool, optional): Whether to yield in input order.
+            **kwargs: Keyword arguments to pass to the function.
+
+    Yields:
+            tuple[int, Any]: The index of each input and its result.
+    """
+    if max_concurrent is not None and max_concurrent < 1:
+        raise ValueError("max_concurrent must be a positive integer.")
+
+    async def _run(idx, item):
+        out = await call_handler(func, item, **kwargs)
+        if isinstance(out, (Coroutine, asyncio.Future)):
+            out = await out
+        return idx, out
+
+    inputs = enumerate(input_)
+    pending = set()
+    finished = {}
+    next_idx = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and (
+                max_concurrent is None
+                or len(pending) + len(finished) < max_concurrent
+            ):
+                try:
+                    idx, item = next(inputs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run(idx, item)))
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                idx, out = task.result()
+                if not ordered:
+                    yield idx, out
+                    continue
+                finished[idx] = out
+                while next_idx in finished:
+                    yield next_idx, finished.pop(next_idx)
+                    next_idx += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 def _dropna(lst_: list[Any]) -> list[Any]:
     """
     Remove None values from a list.
@@ -22,6 +22,7 @@ import platform
 import re
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from hashlib import sha256
@@ -30,6 +31,35 @@ from typing import Any
 
 _timestamp_syms = ["-", ":", "."]
 
+# last millisecond and counter of the time-ordered identifiers
+_id_state = [0, 0]
+_id_lock = threading.Lock()
+
+# os.urandom bytes read ahead for the random bits of identifiers, and the
+# offset of the next unused byte
+_ID_ENTROPY_CHUNK = 4096
+_id_entropy = [b"", 0]
+
+
+def _reset_id_entropy() -> None:
+    _id_entropy[:] = [b"", 0]
+
+
+if hasattr(os, "register_at_fork"):
+    # a child must not hand out the bytes its parent still holds
+    os.register_at_fork(after_in_child=_reset_id_entropy)
+
+
+def _random_bits(k: int) -> int:
+    """Returns k bits read from os.urandom in chunks. Hold _id_lock."""
+    n = (k + 7) // 8
+    buf, pos = _id_entropy
+    if pos + n > len(buf):
+        buf, pos = os.urandom(max(n, _ID_ENTROPY_CHUNK)), 0
+        _id_entropy[0] = buf
+    _id_entropy[1] = pos + n
+    return int.from_bytes(buf[pos : pos + n], "big") >> (8 * n - k)
+
 PATH_TYPE = str | Path
 
 
@@ -125,17 +155,85 @@ class SysUtil:
     @staticmethod
     def create_id(n: int = 32) -> str:
         """
-        Generates a unique identifier based on the current time and random bytes.
+        Generates a unique identifier.
+
+        Identifiers of the default length are time ordered and laid out like
+        a UUIDv7: a 48-bit millisecond timestamp, a 12-bit counter that keeps
+        the identifiers created within a millisecond increasing, and 62
+        random bits. They sort in creation order within a process. Identifiers
+        of other lengths are random.
+
+        Args:
+                n (int): The length of the generated identifier.
+
+        Returns:
+                str: A unique identifier string of hex digits.
+        """
+        if n != 32:
+            with _id_lock:
+                return "%0*x" % (n, _random_bits(4 * n))
+
+        ms = time.time_ns() // 1_000_000
+        with _id_lock:
+            if ms > _id_state[0]:
+                # start low so the counter rarely overflows into the next ms
+                seq = _random_bits(11)
+            else:
+                ms, seq = _id_state[0], _id_state[1] + 1
+                if seq > 0xFFF:
+                    ms, seq = ms + 1, 0
+            _id_state[0], _id_state[1] = ms, seq
+            rand = _random_bits(62)
+
+        return "%032x" % (
+            (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand
+        )
+
+    @staticmethod
+    def id_to_bytes(ln_id: str) -> bytes:
+        """
+        Packs a 32-character identifier into its compact 16-byte form.
+
+        Args:
+                ln_id (str): The identifier.
+
+        Returns:
+                bytes: The identifier as 16 bytes.
+
+        Raises:
+                ValueError: If the identifier is not made of hex digits.
+        """
+        return bytes.fromhex(ln_id)
+
+    @staticmethod
+    def id_from_bytes(raw: bytes) -> str:
+        """
+        Unpacks an identifier from its compact 16-byte form.
+
+        Args:
+                raw (bytes): The identifier as bytes.
+
+        Returns:
+                str: The 32-character identifier.
+        """
+        return raw.hex()
+
+    @staticmethod
+    def content_hash(content: Any, n: int = 32) -> str:
+        """
+        Generates a deterministic identifier of some content.
 
         Args:
+                content (Any): The content to hash, converted with `str` if not
+                        already a string.
                 n (int): The length of the generated identifier.
 
         Returns:
-                str: A unique identifier string.
+                str: The hex digest of the content.
         """
-        current_time = datetime.now().isoformat().encode("utf-8")
-        random_bytes = os.urandom(42)
-        return sha256(current_time + random_bytes).hexdigest()[:n]
+        if not isinstance(content, str):
+            content = str(content)
+        return sha256(content.encode("utf-8")).hexdigest()[:n]
 
     @staticmethod
     def get_bins(input_: list[str], upper: int | None = 2000) -> list[list[int]]:
@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+
+class FakePipe:
+    """Stands in for a transformers pipeline, upper-casing its prompts."""
+
+    def __init__(self, **kwargs):
+        self.calls = []
+
+    def _output(self, msg):
+        if "boom" in msg:
+            raise RuntimeError("generation failed")
+        return [{"generated_text": msg.upper()}]
+
+    def __call__(self, msgs, **config):
+        self.calls.append((msgs, config))
+        if isinstance(msgs, list):
+            return [self._output(m) for m in msgs]
+        return self._output(msgs)
+
+
+class TestTransformersService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        stub = types.ModuleType("transformers")
+        stub.pipeline = FakePipe
+        patcher = patch.dict(sys.modules, {"transformers": stub})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        from lionagi.integrations.provider.transformers import TransformersService
+
+        self.service = TransformersService(max_batch_size=4, batch_timeout=0.05)
+        self.addCleanup(self.service.close_worker)
+
+    async def chat(self, prompt, **kwargs):
+        messages = [{"role": "user", "content": prompt}]
+        _, completion = await self.service.serve_chat(messages, **kwargs)
+        return completion["choices"][0]["message"]["content"]
+
+    async def test_concurrent_requests_share_a_batch(self):
+        prompts = ["a", "b", "c", "d"]
+        results = await asyncio.gather(*[self.chat(p) for p in prompts])
+
+        self.assertEqual(results, ["A", "B", "C", "D"])
+        self.assertEqual(len(self.service.pipe.calls), 1)
+        msgs, config = self.service.pipe.calls[0]
+        self.assertEqual(msgs, prompts)
+        self.assertEqual(config, {"batch_size": 4})
+
+    async def test_batches_split_by_size_and_config(self):
+        results = await asyncio.gather(
+            *[self.chat(p) for p in "abcde"], self.chat("f", max_tokens=5)
+        )
+
+        self.assertEqual(results, list("ABCDEF"))
+        calls = self.service.pipe.calls
+        sizes = sorted(len(m) if isinstance(m, list) else 1 for m, _ in calls)
+        self.assertEqual(sizes, [1, 1, 4])
+        self.assertIn(("f", {"max_new_tokens": 5}), calls)
+
+    async def test_exception_fails_its_batch_only(self):
+        failed, ok = await asyncio.gather(
+            self.chat("boom"), self.chat("fine", max_tokens=5), return_exceptions=True
+        )
+
+        self.assertIsInstance(failed, RuntimeError)
+        self.assertEqual(ok, "FINE")
+
+    async def test_close_worker_stops_thread(self):
+        await self.chat("a")
+        worker = self.service._worker
+        self.service.close_worker()
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(await self.chat("b"), "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
+import asyncio
 import aiohttp
 import unittest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from lionagi.libs.ln_api import *
 
@@ -42,6 +43,397 @@ class TestAPIUtilExtended(unittest.TestCase):
         invalid_url = "https://api.example.com/users"
         self.assertEqual(APIUtil.api_endpoint_from_url(invalid_url), "")
 
+    def test_parse_rate_limit_reset(self):
+        self.assertEqual(APIUtil.parse_rate_limit_reset("1m30s"), 90)
+        self.assertEqual(APIUtil.parse_rate_limit_reset("20ms"), 0.02)
+        self.assertEqual(APIUtil.parse_rate_limit_reset("7"), 7)
+        self.assertIsNone(APIUtil.parse_rate_limit_reset("soon"))
+
+
+class TestBaseServiceSession(unittest.IsolatedAsyncioTestCase):
+    async def test_pooled_session_is_reused(self):
+        service = BaseService()
+        session = service._get_http_session()
+        self.assertIs(service._get_http_session(), session)
+        self.assertEqual(session.connector.limit_per_host, 50)
+        await service.close()
+        self.assertTrue(session.closed)
+        self.assertIsNone(service._http_session)
+
+    async def test_closed_session_is_recreated(self):
+        async with BaseService(connection_limit=10) as service:
+            session = service._get_http_session()
+            await session.close()
+            new_session = service._get_http_session()
+            self.assertIsNot(new_session, session)
+            self.assertEqual(new_session.connector.limit, 10)
+        self.assertTrue(new_session.closed)
+
+    async def test_call_api_uses_pooled_session(self):
+        service = BaseService()
+        rate_limiter = AsyncMock()
+        rate_limiter._call_api.return_value = {"result": "Success"}
+        endpoint = EndPoint()
+        endpoint.rate_limiter = rate_limiter
+        service.endpoints["chat/completions"] = endpoint
+
+        await service.call_api({}, "chat/completions", "post")
+        await service.call_api({}, "chat/completions", "post")
+        sessions = [
+            call.kwargs["http_session"]
+            for call in rate_limiter._call_api.call_args_list
+        ]
+        self.assertIs(sessions[0], sessions[1])
+        await service.close()
+
+
+class TestBaseServiceSessionLoops(unittest.TestCase):
+    async def _session(self, service):
+        return service._get_http_session()
+
+    def test_session_closed_at_loop_shutdown(self):
+        service = BaseService()
+        first = asyncio.run(self._session(service))
+        self.assertTrue(first.closed)
+        second = asyncio.run(self._session(service))
+        self.assertIsNot(second, first)
+        self.assertTrue(second.closed)
+
+    def test_stale_session_connector_closed(self):
+        service = BaseService()
+        loop = asyncio.new_event_loop()
+        stale = loop.run_until_complete(self._session(service))
+        connector = stale.connector
+        loop.close()
+
+        fresh = asyncio.run(self._session(service))
+        self.assertTrue(stale.closed)
+        self.assertTrue(connector.closed)
+        self.assertTrue(fresh.closed)
+
+
+class TestBaseRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_within_capacity_does_not_wait(self):
+        limiter = await SimpleRateLimiter.create(10, 1000, interval=60)
+        self.assertEqual(await limiter.acquire(100), 0.0)
+        self.assertAlmostEqual(limiter.available_request_capacity, 9, places=2)
+        self.assertAlmostEqual(limiter.available_token_capacity, 900, delta=1)
+
+    async def test_waiter_is_woken_by_continuous_refill(self):
+        limiter = SimpleRateLimiter(10, 1000, interval=1)
+        for _ in range(10):
+            await limiter.acquire(1)
+        self.assertFalse(await limiter.request_permission(1))
+        self.assertAlmostEqual(limiter.expected_wait(1), 0.1, delta=0.02)
+        waited = await limiter.acquire(1)
+        self.assertGreater(waited, 0.05)
+        self.assertLess(waited, 0.5)
+
+    async def test_waiters_are_served_by_priority_then_fifo(self):
+        limiter = SimpleRateLimiter(1, 1000, interval=0.05)
+        await limiter.acquire(1)
+        order = []
+
+        async def call(name, priority=0):
+            await limiter.acquire(1, priority=priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(call("first")),
+            asyncio.create_task(call("second")),
+            asyncio.create_task(call("urgent", priority=1)),
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.num_waiting, 3)
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, ["urgent", "first", "second"])
+
+    async def test_cancelled_waiter_is_skipped(self):
+        limiter = SimpleRateLimiter(1, 1000, interval=0.05)
+        await limiter.acquire(1)
+        cancelled = asyncio.create_task(limiter.acquire(1))
+        waiting = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, timeout=1)
+        self.assertEqual(limiter.num_waiting, 0)
+
+
+class _FakeResponse:
+    def __init__(self, json_, status=200, headers=None, lines=()):
+        self._json = json_
+        self.status = status
+        self.headers = headers or {}
+        self.content = _aiter(lines)
+
+    async def json(self):
+        return self._json
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class _FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def post(self, **kwargs):
+        return self.responses.pop(0)
+
+
+class TestAdaptiveRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_update_from_headers_resyncs_buckets(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        limiter.update_from_headers(
+            {
+                "X-RateLimit-Remaining-Requests": "40",
+                "X-RateLimit-Remaining-Tokens": "5000",
+            }
+        )
+        self.assertAlmostEqual(limiter.available_request_capacity, 40, places=1)
+        self.assertAlmostEqual(limiter.available_token_capacity, 5000, delta=1)
+
+    async def test_exhausted_bucket_blocks_until_reset(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        limiter.update_from_headers(
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "2s",
+            }
+        )
+        self.assertFalse(await limiter.request_permission(1))
+        self.assertGreater(limiter.expected_wait(1), 1.5)
+
+    async def test_aimd_window(self):
+        limiter = SimpleRateLimiter(100, 10_000, max_concurrency=8)
+        limiter.on_rate_limited({"retry-after-ms": "10"})
+        self.assertEqual(limiter.concurrency_limit, 4)
+        limiter.on_success()
+        self.assertEqual(limiter.concurrency_limit, 4.25)
+        limiter.adaptive = False
+        limiter.on_success()
+        self.assertEqual(limiter.concurrency_limit, 4.25)
+
+    async def test_call_api_retries_after_rate_limit(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        session = _FakeSession(
+            _FakeResponse(
+                {"error": {"message": "Rate limit reached"}},
+                status=429,
+                headers={"retry-after-ms": "50"},
+            ),
+            _FakeResponse({"result": "Success"}),
+        )
+        result = await limiter._call_api(
+            session,
+            "chat/completions",
+            "https://api.example.com/v1/",
+            "key",
+            required_tokens=10,
+        )
+        self.assertEqual(result, {"result": "Success"})
+        self.assertEqual(limiter.concurrency_limit, 2)
+        self.assertEqual(limiter._in_flight, 0)
+
+
+class TestStreaming(unittest.IsolatedAsyncioTestCase):
+    chunk_lines = [
+        b'data: {"id": "c1", "choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hel"}}]}\n',
+        b"\n",
+        b": keep-alive\n",
+        b"\n",
+        b'data: {"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]}\r\n',
+        b"\r\n",
+        b'data: {"choices": [], "usage": {"total_tokens": 3}}\n',
+        b"\n",
+        b"data: [DONE]\n",
+        b"\n",
+    ]
+
+    async def test_iter_sse(self):
+        events = [e async for e in APIUtil.iter_sse(_aiter(self.chunk_lines))]
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[1]["choices"][0]["delta"], {"content": "lo"})
+
+    async def test_merge_stream_chunks(self):
+        chunks = [e async for e in APIUtil.iter_sse(_aiter(self.chunk_lines))]
+        chunks.append(
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "id": "t1", "function": {"name": "add"}}
+                            ]
+                        },
+                    }
+                ]
+            }
+        )
+        chunks.append(
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "function": {"arguments": '{"a": 1}'}}
+                            ]
+                        },
+                    }
+                ]
+            }
+        )
+        completion = APIUtil.merge_stream_chunks(chunks)
+        self.assertEqual(completion["id"], "c1")
+        self.assertEqual(completion["usage"], {"total_tokens": 3})
+        choice = completion["choices"][0]
+        self.assertEqual(choice["message"]["content"], "Hello")
+        self.assertEqual(choice["finish_reason"], "stop")
+        self.assertEqual(
+            choice["message"]["tool_calls"][0]["function"],
+            {"name": "add", "arguments": '{"a": 1}'},
+        )
+
+    async def test_stream_api_retries_until_first_event(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        session = _FakeSession(
+            _FakeResponse({"error": {"message": "Server error"}}, status=500),
+            _FakeResponse({}, lines=self.chunk_lines),
+        )
+        events = [
+            e
+            async for e in limiter._stream_api(
+                session,
+                "chat/completions",
+                "https://api.example.com/v1/",
+                "key",
+                required_tokens=10,
+            )
+        ]
+        self.assertEqual(len(events), 3)
+        self.assertEqual(limiter._in_flight, 0)
+
+    async def test_stream_api_raises_after_all_attempts(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        session = _FakeSession(
+            *[_FakeResponse({"error": {"message": "Server error"}}, status=500)] * 2
+        )
+        with self.assertRaises(RuntimeError) as ctx:
+            async for _ in limiter._stream_api(
+                session,
+                "chat/completions",
+                "https://api.example.com/v1/",
+                "key",
+                max_attempts=2,
+                required_tokens=10,
+            ):
+                pass
+        self.assertIn("Server error", str(ctx.exception.__cause__))
+        self.assertEqual(limiter._in_flight, 0)
+
+
+class TestStatusTrackerTelemetry(unittest.IsolatedAsyncioTestCase):
+    async def test_track_records_rate_limited_call(self):
+        limiter = SimpleRateLimiter(100, 10_000)
+        session = _FakeSession(
+            _FakeResponse({"error": {"message": "Server error"}}, status=500),
+            _FakeResponse({"usage": {"prompt_tokens": 10, "completion_tokens": 5}}),
+        )
+        tracker = StatusTracker()
+        with tracker.track("chat/completions", "gpt-4o") as record:
+            response = await limiter._call_api(
+                session,
+                "chat/completions",
+                "https://api.example.com/v1/",
+                "key",
+                required_tokens=10,
+            )
+            record.add_usage(response, (1_000_000, 2_000_000))
+
+        self.assertEqual(record.retries, 1)
+        self.assertIsNotNone(record.ttfb)
+        self.assertEqual(record.cost, 20)
+        stats = tracker.summary()[("chat/completions", "gpt-4o")]
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["failures"], 0)
+        self.assertEqual(stats["prompt_tokens"]["p50"], 10)
+
+        text = tracker.to_prometheus()
+        self.assertIn(
+            'lionagi_calls_total{endpoint="chat/completions",model="gpt-4o"} 1', text
+        )
+        self.assertIn(
+            'lionagi_prompt_tokens_bucket{endpoint="chat/completions",'
+            'model="gpt-4o",le="16"} 1',
+            text,
+        )
+
+    async def test_track_counts_exceptions_as_failures(self):
+        tracker = StatusTracker()
+        with self.assertRaises(ValueError):
+            with tracker.track("embeddings"):
+                raise ValueError
+        self.assertEqual(tracker.summary("embeddings")[("embeddings", None)]["failures"], 1)
+
+
+class _WordEncoding:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(t) for t in texts]
+
+
+class TestTokenCounting(unittest.TestCase):
+    def setUp(self):
+        self.encoding = _WordEncoding()
+        patcher = patch.object(
+            APIUtil, "get_encoding", lambda *args: self.encoding
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_count_tokens_is_memoized(self):
+        text = "count these five words once"
+        self.assertEqual(APIUtil.count_tokens(text, "test_memo"), 5)
+        self.assertEqual(APIUtil.count_tokens(text, "test_memo"), 5)
+        self.assertEqual(self.encoding.calls, 1)
+
+    def test_count_tokens_batch(self):
+        texts = ["hello world", "a longer sentence to count", "hello world"]
+        self.assertEqual(APIUtil.count_tokens_batch(texts, "test_batch"), [2, 5, 2])
+        self.assertEqual(self.encoding.calls, 2)
+
+    def test_calculate_num_tokens(self):
+        payloads = [
+            {"messages": [{"role": "user", "content": "hi there"}], "max_tokens": 5},
+            {
+                "messages": [
+                    {"role": "system", "content": "be brief"},
+                    {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+                ]
+            },
+        ]
+        self.assertEqual(
+            APIUtil.calculate_num_tokens(payloads, "chat/completions", "test_calc"),
+            [4 + 2 + 2 + 5, 4 + 2 + 4 + 1 + 2 + 15],
+        )
+        self.assertEqual(self.encoding.calls, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
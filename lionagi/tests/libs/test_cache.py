@@ -0,0 +1,134 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from lionagi.core.collections import iModel
+from lionagi.libs import APIUtil
+from lionagi.libs.ln_cache import *
+
+
+class TestCacheBackends(unittest.TestCase):
+    def test_memory_backend_lru_and_ttl(self):
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.set("a", {"v": 1})
+        backend.set("b", {"v": 2})
+        backend.get("a")
+        backend.set("c", {"v": 3})
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("a"), {"v": 1})
+        self.assertEqual(backend.evictions, 1)
+
+        backend.get("a")["v"] = 0
+        self.assertEqual(backend.get("a"), {"v": 1})
+
+        backend.ttl = 0
+        with patch("time.time", return_value=1e12):
+            self.assertIsNone(backend.get("a"))
+
+    def test_sqlite_backend_persists(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            backend = SQLiteCacheBackend(path, maxsize=2)
+            for key in "abc":
+                backend.set(key, [key])
+            self.assertEqual(len(backend), 2)
+            self.assertIsNone(backend.get("a"))
+            backend.close()
+
+            reopened = SQLiteCacheBackend(path)
+            self.assertEqual(len(reopened), 2)
+            self.assertEqual(reopened.get("c"), ["c"])
+            reopened.close()
+
+    def test_sqlite_backend_keeps_count(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = SQLiteCacheBackend(os.path.join(tmp, "cache.sqlite"), maxsize=3)
+            for key in "aab":
+                backend.set(key, [key])
+            self.assertEqual(len(backend), 2)
+            backend.delete("a")
+            backend.delete("missing")
+            self.assertEqual(len(backend), 1)
+            for key in "cdef":
+                backend.set(key, [key])
+            self.assertEqual(len(backend), 3)
+            self.assertEqual(backend.evictions, 2)
+            self.assertEqual(len(backend), backend._count())
+
+            backend.ttl = 0
+            with patch("time.time", return_value=1e12):
+                self.assertIsNone(backend.get("f"))
+            self.assertEqual(len(backend), 2)
+            backend.clear()
+            self.assertEqual(len(backend), 0)
+            backend.close()
+
+
+class TestCompletionCache(unittest.TestCase):
+    def test_make_key_is_canonical(self):
+        msgs = [{"role": "user", "content": "hi"}]
+        key = CompletionCache.make_key(
+            "chat/completions", msgs, {"model": "m", "temperature": 0}
+        )
+        same = CompletionCache.make_key(
+            "chat/completions", msgs, {"temperature": 0, "model": "m", "sender": "x"}
+        )
+        other = CompletionCache.make_key(
+            "chat/completions", msgs, {"model": "m", "temperature": 0.5}
+        )
+        self.assertEqual(key, same)
+        self.assertNotEqual(key, other)
+
+    def test_is_cacheable(self):
+        self.assertTrue(CompletionCache.is_cacheable("chat/completions", {"temperature": 0}))
+        self.assertTrue(
+            CompletionCache.is_cacheable("chat/completions", {"temperature": 1, "seed": 7})
+        )
+        self.assertFalse(CompletionCache.is_cacheable("chat/completions", {"temperature": 1}))
+        self.assertTrue(CompletionCache.is_cacheable("embeddings", {}))
+
+    def test_async_access_runs_blocking_backends_in_thread(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = CompletionCache("sqlite", path=os.path.join(tmp, "cache.sqlite"))
+            with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+                asyncio.run(cache.aset("k", {"v": 1}))
+                self.assertEqual(asyncio.run(cache.aget("k")), {"v": 1})
+            self.assertEqual(to_thread.call_count, 2)
+            self.assertEqual(cache.hits, 1)
+            cache.backend.close()
+
+        cache = CompletionCache()
+        with patch("asyncio.to_thread") as to_thread:
+            asyncio.run(cache.aset("k", {"v": 1}))
+            self.assertEqual(asyncio.run(cache.aget("k")), {"v": 1})
+        to_thread.assert_not_called()
+
+    def test_imodel_serves_repeated_requests_from_cache(self):
+        cache = CompletionCache()
+        imodel = iModel(api_key="test", cache=cache)
+        calls = []
+
+        async def serve_chat(messages, required_tokens=None, **kwargs):
+            calls.append(kwargs)
+            return {"messages": messages}, {"choices": [{"message": {"content": "ok"}}]}
+
+        imodel.service.serve_chat = serve_chat
+        msgs = [{"role": "user", "content": "hi"}]
+        with patch.object(APIUtil, "calculate_num_token", lambda *args, **kwargs: 1):
+            for _ in range(3):
+                _, completion = asyncio.run(
+                    imodel.call_chat_completion(msgs, temperature=0)
+                )
+                completion.pop("choices")
+            asyncio.run(imodel.call_chat_completion(msgs, temperature=0.7))
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["size"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
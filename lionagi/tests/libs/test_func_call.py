@@ -95,6 +95,21 @@ class TestAlCall(unittest.IsolatedAsyncioTestCase):
         result = await alcall([1, 2, 3], async_func, y=2)
         self.assertEqual(result, [3, 4, 5])
 
+    async def test_max_concurrent(self):
+        running, peak = 0, 0
+
+        async def async_func(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (x % 3))
+            running -= 1
+            return x * 2
+
+        result = await alcall(list(range(10)), async_func, max_concurrent=3)
+        self.assertEqual(result, [x * 2 for x in range(10)])
+        self.assertEqual(peak, 3)
+
 
 import asyncio
 
@@ -274,6 +289,49 @@ class TestBCall(unittest.IsolatedAsyncioTestCase):
         result = await bcall([1, 2, 3], async_func, batch_size=2, y=3)
         self.assertEqual(result, [4, 5, 6])
 
+    async def test_sliding_window(self):
+        async def async_func(x):
+            await asyncio.sleep(0.05 if x == 0 else 0.01)
+            return x * 2
+
+        start = time.perf_counter()
+        result = await bcall(list(range(6)), async_func, batch_size=2, sliding=True)
+        self.assertEqual(result, [0, 2, 4, 6, 8, 10])
+        # the slow first call does not hold back the rest of the input
+        self.assertLess(time.perf_counter() - start, 0.09)
+
+
+class TestSCall(unittest.IsolatedAsyncioTestCase):
+
+    async def test_unordered_yields_as_completed(self):
+        async def async_func(x):
+            await asyncio.sleep(0.01 * (3 - x))
+            return x
+
+        result = [i async for i in scall([0, 1, 2], async_func)]
+        self.assertEqual(result, [2, 1, 0])
+
+    async def test_ordered(self):
+        async def async_func(x):
+            await asyncio.sleep(0.01 * (3 - x))
+            return x
+
+        stream = scall(iter(range(3)), async_func, max_concurrent=2, ordered=True)
+        result = [i async for i in stream]
+        self.assertEqual(result, [0, 1, 2])
+
+    async def test_backpressure(self):
+        started = []
+
+        async def async_func(x):
+            started.append(x)
+            return x
+
+        stream = scall(range(100), async_func, max_concurrent=2)
+        self.assertIn(await stream.__anext__(), (0, 1))
+        await stream.aclose()
+        self.assertLessEqual(len(started), 3)
+
 
 class TestRCall(unittest.IsolatedAsyncioTestCase):
 
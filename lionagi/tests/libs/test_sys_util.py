@@ -59,6 +59,28 @@ class TestSysUtil(unittest.TestCase):
         self.assertEqual(len(id1), 32)
         self.assertNotEqual(id1, id2)
 
+    def test_create_id_is_time_ordered(self):
+        ids = [SysUtil.create_id() for _ in range(5000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 5000)
+        self.assertEqual(ids[0][12], "7")
+
+    def test_create_id_draws_from_urandom(self):
+        from lionagi.libs import sys_util
+
+        sys_util._reset_id_entropy()
+        with patch("os.urandom", return_value=b"\xff" * 4096) as urandom:
+            ids = [SysUtil.create_id(n=8) for _ in range(1000)]
+        sys_util._reset_id_entropy()
+        urandom.assert_called_once_with(4096)
+        self.assertEqual(set(ids), {"ffffffff"})
+
+    def test_id_bytes_round_trip(self):
+        id_ = SysUtil.create_id()
+        raw = SysUtil.id_to_bytes(id_)
+        self.assertEqual(len(raw), 16)
+        self.assertEqual(SysUtil.id_from_bytes(raw), id_)
+
     def test_get_bins(self):
         input_ = ["a" * 500, "b" * 1000, "c" * 500, "d" * 1000]
         bins = SysUtil.get_bins(input_)
@@ -0,0 +1,75 @@
+import tempfile
+import threading
+import time
+import unittest
+
+from lionagi.core.collections._logger import DataLogger, DLog
+
+
+class TestDataLoggerSpill(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.logger = DataLogger(
+            persist_path=self._tmp.name, spill=True, flush_interval=None
+        )
+
+    def tearDown(self):
+        self.logger.close()
+        self._tmp.cleanup()
+
+    def _writers(self):
+        return [t for t in threading.enumerate() if t.name == "DataLogger-writer"]
+
+    def test_spill_keeps_entries_out_of_memory(self):
+        self.logger.append(input_data="a", output_data="b")
+        self.assertEqual(len(self.logger.log), 0)
+        self.assertFalse(self.logger.spill_file.exists())
+        self.assertEqual(self.logger.flush(), 1)
+        self.assertTrue(self.logger.spill_file.exists())
+
+    def test_memory_cap_wakes_writer(self):
+        self.logger.memory_cap = 1
+        self.logger.append(input_data="a", output_data="b")
+        deadline = time.monotonic() + 2
+        while not self.logger.spill_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(self.logger.spill_file.exists())
+        self.assertEqual(self.logger._buffer, [])
+
+    def test_read_spilled_round_trip(self):
+        for i in range(3):
+            self.logger.append(input_data={"i": i}, output_data=f"out {i}")
+        entries = list(self.logger.read_spilled())
+        self.assertEqual(len(entries), 3)
+        self.assertIsInstance(entries[0], DLog)
+        self.assertEqual([e.output_data for e in entries], ["out 0", "out 1", "out 2"])
+
+    def test_concurrent_appends_start_one_writer(self):
+        before = len(self._writers())
+        threads = [
+            threading.Thread(
+                target=self.logger.append, kwargs={"input_data": i, "output_data": i}
+            )
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self._writers()), before + 1)
+
+    def test_close_flushes_and_writes_through(self):
+        self.logger.append(input_data="a", output_data="b")
+        writer = self.logger._writer
+        self.logger.close()
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(len(list(self.logger.read_spilled())), 1)
+
+        self.logger.append(input_data="c", output_data="d")
+        self.assertEqual(self.logger._buffer, [])
+        self.assertEqual(len(list(self.logger.read_spilled())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
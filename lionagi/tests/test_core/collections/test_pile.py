@@ -1,6 +1,11 @@
 import unittest
 import asyncio
-from lionagi.core.collections.pile import Pile
+import os
+import tempfile
+from unittest.mock import patch
+from lionagi.core.collections import iModel
+from lionagi.core.collections.pile import Pile, PileView
+from lionagi.libs import APIUtil
 from lionagi import Node
 
 
@@ -50,12 +55,59 @@ class TestPile(unittest.TestCase):
         node = self.p1[0]
         self.assertEqual(node.content, "A")
 
+    def test_slice_returns_view(self):
+        """Test that slicing shares items instead of copying them."""
+        view = self.p1[1:]
+        self.assertIsInstance(view, PileView)
+        self.assertFalse(view.is_materialized)
+        self.assertEqual(len(view), 2)
+        self.assertEqual([n.content for n in view], ["B", "C"])
+        self.assertIs(view[0], self.nodes1[1])
+        self.assertIn(self.nodes1[2], view)
+        self.assertNotIn(self.nodes1[0], view)
+
+    def test_view_copy_on_write(self):
+        """Test that mutating a view leaves the parent untouched."""
+        view = self.p1[[self.nodes1[0], self.nodes1[2]]]
+        view.include(self.nodes2[0])
+        self.assertTrue(view.is_materialized)
+        self.assertEqual([n.content for n in view], ["A", "C", "D"])
+        self.assertEqual(len(self.p1), 3)
+        self.assertNotIn(self.nodes2[0], self.p1)
+        view.pop(self.nodes1[0])
+        self.assertIn(self.nodes1[0], self.p1)
+
+    def test_view_after_parent_pop(self):
+        """Test that a view skips items removed from the parent after slicing."""
+        self.p1.include(self.nodes2)
+        view = self.p1[1:4]
+        self.p1.pop(self.nodes1[2])
+        self.assertEqual(len(view), 2)
+        self.assertEqual([n.content for n in view], ["B", "D"])
+        self.assertEqual(view.keys(), [self.nodes1[1].ln_id, self.nodes2[0].ln_id])
+        self.assertIs(view[1], self.nodes2[0])
+
+    def test_view_deep_copy_only_copies_window(self):
+        """Test that copying a view copies only its window."""
+        combined = self.p1[:2] + self.nodes2[0]
+        self.assertEqual([n.content for n in combined], ["A", "B", "D"])
+        self.assertEqual(len(self.p1), 3)
+
     def test_set_item_by_index(self):
         """Test setting an item at a specific index."""
         new_node = Node(content="Updated Node")
         self.p1[0] = new_node
         self.assertEqual(self.p1[0].content, "Updated Node")
 
+    def test_set_item_by_id_replaces_in_place(self):
+        """Test replacing an item under its own ID."""
+        node = self.nodes1[1]
+        copy = node.model_copy(deep=True)
+        self.p1[node.ln_id] = copy
+        self.assertEqual(len(self.p1), 3)
+        self.assertEqual(list(self.p1.order)[1], node.ln_id)
+        self.assertIs(self.p1[1], copy)
+
     def test_insert_item(self):
         """Test inserting an item at a specific position."""
         new_node = Node(content="Inserted Node")
@@ -158,6 +210,97 @@ class TestPile(unittest.TestCase):
         with self.assertRaises(ValueError):
             tool = self.p1.as_query_tool(index_type="llama_index")
 
+    def test_field_index_maintained(self):
+        """Test hash indexes follow include, exclude and replacement."""
+        self.p1.create_field_index("content")
+        self.assertEqual(self.p1.find("content", "B")[0], self.nodes1[1])
+        self.p1.exclude(self.nodes1[1])
+        self.assertEqual(len(self.p1.find("content", "B")), 0)
+        self.p1.include(self.nodes2[0])
+        self.assertEqual(self.p1.find("content", "D")[0], self.nodes2[0])
+        self.p1[0] = self.nodes2[1]
+        self.assertEqual(len(self.p1.find("content", "A")), 0)
+        self.assertEqual(self.p1.find("content", "E")[0], self.nodes2[1])
+
+    def test_find_range_on_timestamp(self):
+        """Test range queries with and without a sorted index."""
+        lower, upper = self.nodes1[1].timestamp, self.nodes1[2].timestamp
+        scanned = self.p1.find_range("timestamp", lower, upper)
+        self.p1.create_field_index("timestamp", "sorted")
+        indexed = self.p1.find_range("timestamp", lower, upper)
+        self.assertListEqual(list(indexed.keys()), list(scanned.keys()))
+        self.assertListEqual(
+            list(indexed.keys()), [n.ln_id for n in self.nodes1[1:]]
+        )
+        self.assertEqual(len(self.p1.find_range("timestamp", upper=lower)), 2)
+
+    def test_reindex_after_mutation(self):
+        """Test reindexing items whose fields changed in place."""
+        self.p1.create_field_index("metadata.tag")
+        self.nodes1[0].metadata["tag"] = "x"
+        self.assertEqual(len(self.p1.find("metadata.tag", "x")), 0)
+        self.p1.reindex(self.nodes1[0])
+        self.assertEqual(self.p1.find("metadata.tag", "x")[0], self.nodes1[0])
+
+    def test_similarity_search(self):
+        """Test top-k search follows inserts and removals."""
+        for i, node in enumerate(self.nodes1 + self.nodes2):
+            node.embedding = [float(i == j) for j in range(6)] + [0.1]
+        self.p1.create_embedding_store()
+        result = self.p1.similarity_search(self.nodes1[1].embedding, k=2)
+        self.assertEqual(result[0][0], self.nodes1[1])
+        self.assertAlmostEqual(result[0][1], 1.0, places=5)
+        self.assertEqual(len(result), 2)
+
+        self.p1.exclude(self.nodes1[1])
+        self.p1.include(self.nodes2[0])
+        batch = self.p1.similarity_search(
+            [self.nodes1[1].embedding, self.nodes2[0].embedding], k=1, metric="dot"
+        )
+        self.assertNotEqual(batch[0][0][0], self.nodes1[1])
+        self.assertEqual(batch[1][0][0], self.nodes2[0])
+
+    def test_save_and_load_embeddings(self):
+        """Test the embedding matrix round-trips through an .npy file."""
+        for i, node in enumerate(self.nodes1):
+            node.embedding = [float(i), 1.0]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.p1.save_embeddings(os.path.join(tmp, "pile.csv"))
+            self.assertTrue(str(path).endswith(".npy"))
+            loaded = Pile(self.nodes1[:2])
+            store = loaded.load_embeddings(path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.matrix.dtype.name, "float32")
+        self.assertEqual(loaded.similarity_search([1.0, 1.0], k=1)[0][0], self.nodes1[1])
+
+    def test_embed_pile_batches_and_skips(self):
+        """Test embedding in batches, once per distinct content."""
+        imodel = iModel(endpoint="embeddings", api_key="test")
+        requests = []
+
+        async def _call_embedding(embed_input, required_tokens=None, **kwargs):
+            inputs = [embed_input] if isinstance(embed_input, str) else embed_input
+            requests.append(inputs)
+            data = [
+                {"index": i, "embedding": [float(len(text)), 1.0]}
+                for i, text in enumerate(inputs)
+            ]
+            return {"input": inputs, "model": "test"}, {"data": data}
+
+        imodel.call_embedding = _call_embedding
+        pile_ = Pile(self.nodes1 + self.nodes2 + [Node(content="A")])
+        with patch.object(
+            APIUtil, "count_tokens", lambda text, name=None: 1
+        ), patch.object(APIUtil, "calculate_num_token", lambda *args, **kwargs: 1):
+            asyncio.run(pile_.embed_pile(imodel, batch_size=4, verbose=False))
+            self.assertEqual([len(r) for r in requests], [4, 2])
+            self.assertTrue(all(n.embedding for n in pile_))
+
+            requests.clear()
+            self.nodes1[0].content = "AA"
+            asyncio.run(pile_.embed_pile(imodel, batch_size=4, verbose=False))
+            self.assertEqual(requests, [["AA"]])
+
     def test_str_representation(self):
         """Test the string representation of the pile."""
         self.assertIsInstance(str(self.p1), str)
@@ -124,6 +124,48 @@ class TestProgression(unittest.TestCase):
         new_prog = self.p + new_node
         self.assertNotEqual(self.p.order, new_prog)
 
+    def test_duplicates_are_removed_in_order(self):
+        first, second = self.nodes[0].ln_id, self.nodes[1].ln_id
+        self.p.append(first)
+        self.p.remove(first)
+        self.assertEqual(self.p.order[0], second)
+        self.assertEqual(self.p.order[-1], first)
+        self.assertIn(first, self.p)
+        self.p.remove(first)
+        self.assertNotIn(first, self.p)
+
+    def test_remove_multiple_is_all_or_nothing(self):
+        ids = [self.nodes[0].ln_id, Node().ln_id]
+        with self.assertRaises(ItemNotFoundError):
+            self.p.remove(ids)
+        self.assertEqual(len(self.p), 5)
+
+    def test_radd_and_pop(self):
+        new_node = Node()
+        new_prog = new_node + self.p
+        self.assertEqual(new_prog.order[0], new_node.ln_id)
+        self.assertEqual(new_prog.pop(), self.nodes[-1].ln_id)
+
+    def test_serialization_format(self):
+        dumped = self.p.model_dump()
+        self.assertIsInstance(dumped["order"], list)
+        self.assertEqual(Progression(**dumped).order, self.p.order)
+
+    def test_order_assignment_is_indexed(self):
+        self.p.order = [self.nodes[0].ln_id]
+        self.assertIn(self.nodes[0].ln_id, self.p)
+        self.assertNotIn(self.nodes[1].ln_id, self.p)
+
+    def test_copy_is_copy_on_write(self):
+        copy = self.p.copy()
+        self.assertIs(copy.order._slots, self.p.order._slots)
+        copy.append(self.nodes[0])
+        self.assertEqual(len(copy), 6)
+        self.assertEqual(len(self.p), 5)
+        smaller = self.p - self.nodes[1]
+        self.assertIn(self.nodes[1].ln_id, self.p)
+        self.assertNotIn(self.nodes[1].ln_id, smaller)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -34,6 +34,15 @@ class TestGraph(unittest.TestCase):
         self.g.add_edge(self.node3, self.node4)
         self.assertEqual(len(self.g.internal_edges), 3)
 
+    def test_add_edge_subclass(self):
+        """Test indexing edges of an Edge subclass."""
+
+        class CustomEdge(Edge):
+            pass
+
+        self.g.add_edge(self.node1, self.node2, edge_class=CustomEdge)
+        self.assertIsInstance(self.g.internal_edges[0], CustomEdge)
+
     def test_get_node(self):
         """Test retrieving a node by its identifier."""
         self.g.add_node(self.node2)
@@ -59,6 +68,26 @@ class TestGraph(unittest.TestCase):
         self.g.add_edge(self.node3, self.node4)
         self.assertTrue(self.g.is_acyclic())
 
+    def test_topological_sort(self):
+        """Test ordering nodes after their predecessors."""
+        self.g.add_edge(self.node1, self.node3)
+        self.g.add_edge(self.node2, self.node3)
+        self.g.add_edge(self.node3, self.node4)
+        order = self.g.topological_sort()
+        self.assertEqual(order[-2:], [self.node3.ln_id, self.node4.ln_id])
+        self.assertCountEqual(self.g.get_predecessors(self.node3), order[:2])
+
+    def test_is_acyclic_deep_chain_and_cycle(self):
+        """Test cycle detection on a chain deeper than the recursion limit."""
+        nodes = [Node() for _ in range(3000)]
+        for head, tail in zip(nodes, nodes[1:]):
+            self.g.add_edge(head, tail)
+        self.assertTrue(self.g.is_acyclic())
+        self.g.add_edge(nodes[-1], nodes[0])
+        self.assertFalse(self.g.is_acyclic())
+        with self.assertRaises(ValueError):
+            self.g.topological_sort()
+
     def test_remove_edge(self):
         """Test removing an edge from the graph."""
         self.g.add_edge(self.node1, self.node2)
@@ -74,6 +103,28 @@ class TestGraph(unittest.TestCase):
         with self.assertRaises(ItemNotFoundError):
             self.g.remove_edge(edge=Edge(head=self.node2, tail=self.node3))
 
+    def test_pop_node_keeps_edges_of_remaining_nodes(self):
+        """Test the edge index after removing nodes."""
+        self.g.add_edge(self.node1, self.node2)
+        self.g.add_edge(self.node2, self.node3)
+        self.g.pop_node(self.node3)
+        self.assertEqual(len(self.g.internal_edges), 2)
+        self.g.pop_node(self.node2)
+        self.assertEqual(len(self.g.internal_edges), 1)
+        self.assertIsNone(self.g.pop_node(self.node4, None))
+
+    def test_add_node_reindexes_edges(self):
+        """Test that nodes related outside the graph are indexed when added."""
+        self.g.add_node([self.node1, self.node2])
+        edge = self.node1.relate(self.node2)
+        self.g.add_node(self.node1)
+        self.assertIn(edge, self.g.internal_edges)
+        self.assertEqual([n.ln_id for n in self.g.get_heads()], [self.node1.ln_id])
+
+        self.node1.unrelate(self.node2)
+        self.g.add_node(self.node2)
+        self.assertEqual(len(self.g.internal_edges), 0)
+
     def test_clear(self):
         """Test clearing all nodes and edges from the graph."""
         self.g.add_node([self.node1, self.node2, self.node3, self.node4])
@@ -0,0 +1,61 @@
+import asyncio
+import time
+import unittest
+
+from lionagi.core.collections import Exchange
+from lionagi.core.mail import MailManager
+
+
+class TestMailManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.a = Exchange()
+        self.b = Exchange()
+        self.manager = MailManager([self.a, self.b])
+
+    def send(self, sender, recipient, package="hi"):
+        mail = MailManager.create_mail(sender.ln_id, recipient.ln_id, "message", package)
+        sender.include(mail, "out")
+        return mail
+
+    def test_mail_is_routed_when_sent(self):
+        mail = self.send(self.a, self.b)
+        self.assertEqual(len(self.a.pending_outs), 0)
+        self.assertNotIn(mail, self.a)
+        self.assertIn(mail, self.b.pending_ins[self.a.ln_id])
+
+    def test_unknown_recipient_stays_in_outbox(self):
+        other = Exchange()
+        mail = self.send(self.a, other)
+        self.assertIn(mail, self.a.pending_outs)
+        with self.assertRaises(ValueError):
+            self.manager.collect(self.a.ln_id)
+
+    def test_deleted_source_is_not_routed(self):
+        self.manager.delete_source(self.a.ln_id)
+        mail = self.send(self.a, self.b)
+        self.assertIn(mail, self.a.pending_outs)
+
+    async def test_recipient_wakes_on_arrival(self):
+        async def receive():
+            start = time.perf_counter()
+            arrived = await self.b.wait_for_incoming(timeout=1)
+            return arrived, time.perf_counter() - start
+
+        waiter = asyncio.create_task(receive())
+        await asyncio.sleep(0.01)
+        self.send(self.a, self.b)
+        arrived, elapsed = await waiter
+        self.assertTrue(arrived)
+        self.assertLess(elapsed, 0.5)
+        self.assertFalse(await self.a.wait_for_incoming(timeout=0.01))
+
+    async def test_stop_ends_execute(self):
+        task = asyncio.create_task(self.manager.execute(refresh_time=10))
+        await asyncio.sleep(0.01)
+        self.manager.stop()
+        await asyncio.wait_for(task, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock, patch
 import lionagi as li
@@ -48,6 +49,158 @@ class TestBranch(unittest.TestCase):
             "You are a helpful assistant, let's think step by step",
         )
 
+    def test_to_chat_messages_follows_changes(self):
+        self.branch.add_message(instruction="hi")
+        self.assertEqual(self.branch.to_chat_messages()[-1]["role"], "user")
+
+        instruction = self.branch.messages[-1]
+        instruction._add_context("more")
+        self.branch.add_message(assistant_response={"content": "ok"})
+        chat_msgs = self.branch.to_chat_messages()
+        self.assertIn("more", chat_msgs[-2]["content"])
+        self.assertEqual(chat_msgs[-1], {"role": "assistant", "content": "ok"})
+
+        chat_msgs[-1]["content"] = "mutated"
+        self.branch.progress.exclude(instruction)
+        chat_msgs = self.branch.to_chat_messages()
+        self.assertEqual(chat_msgs[-1]["content"], "ok")
+        self.assertNotIn(instruction.chat_msg, chat_msgs)
+
+    def test_edits_elsewhere_keep_fast_path(self):
+        other = li.Branch()
+        self.branch.add_message(instruction="hi")
+        other.add_message(instruction="there")
+        self.branch.to_chat_messages()
+        other.to_chat_messages()
+
+        other.messages[-1].sender = "someone"
+        self.assertEqual(self.branch._chat_state, self.branch._chat_token())
+        self.assertNotEqual(other._chat_state, other._chat_token())
+
+        self.branch.messages[-1]._add_context("more")
+        self.assertNotEqual(self.branch._chat_state, self.branch._chat_token())
+        self.assertIn("more", self.branch.to_chat_messages()[-1]["content"])
+
+    def test_to_chat_messages_after_replacement(self):
+        self.branch.add_message(instruction="hi")
+        self.branch.add_message(assistant_response={"content": "ok"})
+        self.assertEqual(self.branch.to_chat_messages()[-1]["content"], "ok")
+
+        response = self.branch.messages[-1]
+        replacement = AssistantResponse(
+            assistant_response={"content": "changed"}, ln_id=response.ln_id
+        )
+        replacement._chat_version = response._chat_version
+        self.branch.messages[response.ln_id] = replacement
+        self.assertEqual(self.branch.to_chat_messages()[-1]["content"], "changed")
+
+        self.branch.add_message(instruction="again")
+        self.branch.progress.order.insert(0, self.branch.progress.pop(-1))
+        chat_msgs = self.branch.to_chat_messages()
+        self.assertEqual(len(chat_msgs), 4)
+        self.assertIn("again", chat_msgs[0]["content"])
+
+    def test_stream_chat(self):
+        async def _stream():
+            for text in ["Hel", "lo"]:
+                yield {"choices": [{"index": 0, "delta": {"content": text}}]}
+
+        async def stream_chat_completion(messages, **kwargs):
+            self.assertEqual(messages[-1]["role"], "user")
+            return {"messages": messages}, _stream()
+
+        async def consume():
+            return [t async for t in self.branch.stream_chat("hi")]
+
+        self.branch.imodel.stream_chat_completion = stream_chat_completion
+        self.assertEqual(asyncio.run(consume()), ["Hel", "lo"])
+        self.assertEqual(self.branch.last_response.response, "Hello")
+
+    def test_stream_chat_without_chunks_raises(self):
+        async def _stream():
+            return
+            yield
+
+        async def stream_chat_completion(messages, **kwargs):
+            return {"messages": messages}, _stream()
+
+        async def consume():
+            return [t async for t in self.branch.stream_chat("hi")]
+
+        self.branch.imodel.stream_chat_completion = stream_chat_completion
+        with self.assertRaises(RuntimeError):
+            asyncio.run(consume())
+        self.assertIsInstance(self.branch.messages[-1], Instruction)
+
+    def test_split_branch_shares_messages(self):
+        session = li.Session()
+        branch = session.default_branch
+        branch.add_message(instruction="hi")
+        branch.add_message(assistant_response={"content": "ok"})
+        forked = session.split_branch(branch, readdress=False)
+
+        self.assertIs(forked.messages[-1], branch.messages[-1])
+        self.assertEqual(forked.to_chat_messages(), branch.to_chat_messages())
+        forked.add_message(instruction="more")
+        branch.progress.exclude(branch.messages[-1])
+        self.assertEqual(len(forked.progress), 4)
+        self.assertEqual(len(branch.progress), 2)
+
+    def test_split_branch_copies_message_on_write(self):
+        session = li.Session()
+        branch = session.default_branch
+        branch.add_message(instruction="one")
+        branch.add_message(instruction="hi")
+        forked = session.split_branch(branch, readdress=False)
+        first, shared = branch.messages[-2], branch.messages[-1]
+        forked.to_chat_messages()
+
+        # the owning branch stays writable, the fork keeps the old message
+        shared.sender = "someone"
+        shared._add_context("more")
+        self.assertIs(branch.messages[-1], shared)
+        kept = forked.messages[shared.ln_id]
+        self.assertIsNot(kept, shared)
+        self.assertNotEqual(kept.sender, "someone")
+        self.assertNotIn("more", str(forked.to_chat_messages()[-1]))
+        self.assertIn("more", str(branch.to_chat_messages()[-1]))
+
+        # the fork copies a message before changing it
+        forked.add_message(instruction=first, context="fork only")
+        self.assertIs(branch.messages[first.ln_id], first)
+        self.assertIsNot(forked.messages[first.ln_id], first)
+        self.assertIn("fork only", str(forked.to_chat_messages()[-2]))
+        self.assertNotIn("fork only", str(branch.to_chat_messages()))
+        self.assertEqual(len(forked.messages), len(branch.messages))
+
+    def test_split_branch_owner_writable_after_fork_cleared(self):
+        session = li.Session()
+        branch = session.default_branch
+        branch.add_message(instruction="hi")
+        forked = session.split_branch(branch, readdress=False)
+        forked.clear()
+
+        message = branch.messages[-1]
+        message.sender = "x"
+        self.assertIs(branch.messages[-1], message)
+        self.assertEqual(message.sender, "x")
+
+    def test_split_branch_readdress(self):
+        session = li.Session()
+        branch = session.default_branch
+        branch.add_message(instruction="hi")
+        rendered = branch.to_chat_messages()
+        forked = session.split_branch(branch)
+
+        for message in forked.messages:
+            self.assertEqual(message.sender, branch.ln_id)
+            self.assertEqual(message.recipient, forked.ln_id)
+        self.assertEqual(branch.messages[-1].recipient, branch.ln_id)
+        self.assertEqual(forked.to_chat_messages(), rendered)
+
+        branch.messages[-1].content = {"instruction": "changed"}
+        self.assertEqual(forked.to_chat_messages(), rendered)
+
     @patch("lionagi.Branch.chat")
     async def test_chat(self, mock_chat):
         mock_chat.return_value = (
@@ -0,0 +1,216 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from lionagi.core.agent.base_agent import BaseAgent
+from lionagi.core.engine.branch_engine import BranchExecutor
+from lionagi.core.executor.graph_executor import GraphExecutor
+from lionagi.core.executor.graph_scheduler import GraphScheduler
+from lionagi.core.generic import Graph
+from lionagi.core.generic.edge_condition import EdgeCondition
+from lionagi.core.generic.node import Node
+from lionagi.core.mail import MailManager
+from lionagi.core.message import Instruction
+
+
+class ExecutableCondition(EdgeCondition):
+    source: str = "executable"
+    result: bool = True
+
+    async def applies(self, executable):
+        await asyncio.sleep(0.05)
+        return self.result
+
+
+class ExecutorCondition(EdgeCondition):
+    source: str = "executable"
+    accept: str = ""
+
+    async def applies(self, executable):
+        accepted = executable.ln_id == self.accept
+        # the accepting executable replies last
+        await asyncio.sleep(0.05 if accepted else 0.01)
+        return accepted
+
+
+class TestConditionChecks(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.structure = GraphExecutor()
+        self.executable = BranchExecutor(verbose=False)
+        self.manager = MailManager([self.structure, self.executable])
+        self.head = Instruction(instruction="head")
+        self.tails = [Instruction(instruction=str(i)) for i in range(4)]
+        self.structure.add_node(self.head)
+        for i, tail in enumerate(self.tails):
+            self.structure.add_node(tail)
+            self.structure.add_edge(
+                self.head, tail, condition=ExecutableCondition(result=i % 2 == 0)
+            )
+
+    async def test_conditions_are_checked_concurrently(self):
+        executable = asyncio.create_task(self.executable.execute(0.01))
+        next_nodes = await asyncio.wait_for(
+            self.structure._next_node(
+                self.head, self.executable.ln_id, self.executable.ln_id
+            ),
+            0.15,
+        )
+        self.executable.execute_stop = True
+        await executable
+
+        self.assertEqual(
+            {n.ln_id for n in next_nodes},
+            {self.tails[0].ln_id, self.tails[2].ln_id},
+        )
+        self.assertFalse(self.structure.mailbox.has_incoming)
+        self.assertEqual(len(self.structure.mailbox.pile), 0)
+
+    async def test_replies_match_the_executable_asked(self):
+        other = BranchExecutor(verbose=False)
+        self.manager.add_sources(other)
+        edge = next(iter(self.head.relations["out"]))
+        edge.condition = ExecutorCondition(accept=self.executable.ln_id)
+        runs = [
+            asyncio.create_task(e.execute(0.005)) for e in (self.executable, other)
+        ]
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                self.structure.request_condition(
+                    edge, self.executable.ln_id, self.structure.ln_id
+                ),
+                self.structure.request_condition(
+                    edge, other.ln_id, self.structure.ln_id
+                ),
+            ),
+            0.5,
+        )
+        self.executable.execute_stop = other.execute_stop = True
+        await asyncio.gather(*runs)
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual(self.structure._condition_requests, {})
+
+    async def test_condition_timeout(self):
+        self.structure.condition_timeout = 0.01
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.structure._next_node(
+                self.head, self.executable.ln_id, self.executable.ln_id
+            )
+        self.assertEqual(self.structure._condition_requests, {})
+
+
+class TestBranchExecutorFanOut(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.structure = GraphExecutor()
+        self.executable = BranchExecutor(verbose=False)
+        self.head = Instruction(instruction="head")
+        self.middle = [Instruction(instruction=str(i)) for i in range(3)]
+        self.join = Instruction(instruction="join")
+        self.structure.add_node(self.head)
+        self.structure.add_node(self.join)
+        for node in self.middle:
+            self.structure.add_node(node)
+            self.structure.add_edge(self.head, node)
+            self.structure.add_edge(node, self.join)
+        self.order = []
+        self.running = 0
+        self.peak = 0
+
+    async def _process(self, instruction, verbose=True, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        self.order.append(instruction.ln_id)
+
+    async def test_ready_nodes_run_concurrently(self):
+        agent = BaseAgent(self.structure, self.executable)
+        with patch.object(BranchExecutor, "_instruction_process", self._process):
+            await asyncio.wait_for(agent.execute(context="start"), 2)
+
+        self.assertEqual(self.peak, 3)
+        self.assertEqual(self.order[0], self.head.ln_id)
+        self.assertEqual(self.order[-1], self.join.ln_id)
+        self.assertEqual(len(self.order), 5)
+        self.assertEqual(self.structure._runs, {})
+        self.assertEqual(self.executable._node_tasks, set())
+
+    async def test_failed_conditions_skip_paths(self):
+        edge = next(
+            e for e in self.head.relations["out"] if e.tail == self.middle[0].ln_id
+        )
+        edge.condition = ExecutableCondition(result=False)
+        agent = BaseAgent(self.structure, self.executable)
+        with patch.object(BranchExecutor, "_instruction_process", self._process):
+            await asyncio.wait_for(agent.execute(context="start"), 2)
+
+        self.assertNotIn(self.middle[0].ln_id, self.order)
+        self.assertEqual(len(self.order), 4)
+        self.assertEqual(self.order[-1], self.join.ln_id)
+
+
+class StructureCondition(EdgeCondition):
+    source: str = "structure"
+    result: bool = True
+
+    async def applies(self, structure):
+        return self.result
+
+
+class TestGraphScheduler(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.head = Node()
+        self.middle = [Node() for _ in range(4)]
+        self.tail = Node()
+        for node in self.middle:
+            self.graph.add_edge(self.head, node)
+            self.graph.add_edge(node, self.tail)
+        self.order = []
+        self.running = 0
+        self.peak = 0
+
+    async def _run(self, node):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.02)
+        self.running -= 1
+        self.order.append(node.ln_id)
+        return node.ln_id
+
+    async def test_ready_nodes_run_concurrently(self):
+        scheduler = GraphScheduler(self.graph, max_concurrency=2)
+        self.assertEqual(scheduler.ready(), [self.head.ln_id])
+        results = await scheduler.run(self._run)
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(self.order[0], self.head.ln_id)
+        self.assertEqual(self.order[-1], self.tail.ln_id)
+        timings = [scheduler.timings[n.ln_id] for n in self.middle]
+        self.assertGreater(max(t.queue_wait for t in timings), 0.01)
+        self.assertTrue(all(t.duration > 0.01 for t in timings))
+
+    async def test_failed_conditions_skip_nodes(self):
+        graph = Graph()
+        nodes = [Node() for _ in range(4)]
+        graph.add_edge(nodes[0], nodes[1], condition=StructureCondition(result=False))
+        graph.add_edge(nodes[0], nodes[2], condition=StructureCondition())
+        graph.add_edge(nodes[1], nodes[3])
+        scheduler = GraphScheduler(graph)
+        results = await scheduler.run(self._run)
+
+        self.assertEqual(set(results), {nodes[0].ln_id, nodes[2].ln_id})
+        self.assertEqual(scheduler.skipped, {nodes[1].ln_id, nodes[3].ln_id})
+
+    async def test_cycle_is_rejected(self):
+        self.graph.add_edge(self.tail, self.head)
+        with self.assertRaises(ValueError):
+            GraphScheduler(self.graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from lionagi.core.action import ActionScheduler, ToolExecutor, ToolManager
+from lionagi.core.action.function_calling import FunctionCalling
+from lionagi.core.message import ActionRequest
+
+
+def blocking_tool(seconds: float) -> str:
+    """
+    Sleep, then report the thread it ran in.
+
+    Args:
+        seconds: How long to sleep.
+    """
+    time.sleep(seconds)
+    return threading.current_thread().name
+
+
+class TestToolManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.manager = ToolManager()
+
+    def tearDown(self):
+        self.manager.executor.shutdown()
+
+    async def invoke(self, **kwargs):
+        return await self.manager.invoke(FunctionCalling(blocking_tool, kwargs))
+
+    async def test_inline_by_default(self):
+        self.manager.register_tools(blocking_tool)
+        result = await self.invoke(seconds=0)
+        self.assertEqual(result, threading.current_thread().name)
+
+    async def test_thread_execution_keeps_loop_free(self):
+        self.manager.register_tools(blocking_tool, execution="thread")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        result, _ = await asyncio.gather(self.invoke(seconds=0.1), ticker())
+        self.assertTrue(result.startswith("lionagi-tool"))
+        self.assertEqual(ticks, 5)
+
+    async def test_timeout_returns_none(self):
+        self.manager.register_tools(blocking_tool, execution="thread", timeout=0.01)
+        result = await self.invoke(seconds=0.1)
+        self.assertIsNone(result)
+
+    async def test_inline_timeout_runs_in_thread(self):
+        self.manager.register_tools(blocking_tool, timeout=0.01)
+        start = time.perf_counter()
+        result = await self.invoke(seconds=0.2)
+        self.assertIsNone(result)
+        self.assertLess(time.perf_counter() - start, 0.15)
+
+    async def test_max_concurrency(self):
+        self.manager.register_tools(
+            blocking_tool, execution="thread", max_concurrency=1
+        )
+        start = time.perf_counter()
+        await asyncio.gather(*[self.invoke(seconds=0.05) for _ in range(3)])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.15)
+
+    async def test_policy_stays_in_manager(self):
+        self.manager.register_tools(blocking_tool, execution="thread", timeout=0.01)
+        tool = self.manager.registry["blocking_tool"]
+        other = ToolManager(executor=self.manager.executor)
+        other.register_tools(tool)
+
+        self.assertEqual(tool.execution, "inline")
+        self.assertIsNone(tool.timeout)
+        self.assertEqual(other.get_policy("blocking_tool"), {})
+        self.assertIsNone(await self.invoke(seconds=0.1))
+        self.assertEqual(
+            await other.invoke(FunctionCalling(blocking_tool, {"seconds": 0})),
+            threading.current_thread().name,
+        )
+
+    def test_invalid_execution_mode(self):
+        with self.assertRaises(ValueError):
+            self.manager.register_tools(blocking_tool, execution="gpu")
+
+    async def test_invoke_all_yields_as_completed(self):
+        self.manager.register_tools(blocking_tool, execution="thread")
+        self.manager.scheduler = ActionScheduler(max_concurrency=2)
+        requests = [
+            ActionRequest(function="blocking_tool", arguments={"seconds": s})
+            for s in (0.1, 0.01, 0.05)
+        ]
+        order = [
+            request.arguments["seconds"]
+            async for request, _, error in self.manager.invoke_all(requests)
+            if error is None
+        ]
+        self.assertEqual(order, [0.01, 0.05, 0.1])
+
+    async def test_invoke_all_retries_and_cancels(self):
+        attempts = []
+
+        async def flaky(fail: bool = False) -> str:
+            """
+            Fail on the first call, or on every call if asked to.
+
+            Args:
+                fail: Whether to always fail.
+            """
+            attempts.append(fail)
+            if fail or len(attempts) < 2:
+                raise RuntimeError("boom")
+            await asyncio.sleep(1)
+            return "ok"
+
+        self.manager.register_tools(flaky)
+        self.manager.scheduler = ActionScheduler(retries=1, cancel_on_failure=True)
+        requests = [
+            ActionRequest(function="flaky", arguments={}),
+            ActionRequest(function="flaky", arguments={"fail": True}),
+        ]
+        start = time.perf_counter()
+        results = [item async for item in self.manager.invoke_all(requests)]
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0][0], requests[1])
+        self.assertIsInstance(results[0][2], RuntimeError)
+        self.assertIs(results[1][0], requests[0])
+        self.assertIsNone(results[1][1])
+        self.assertIsInstance(results[1][2], asyncio.CancelledError)
+        self.assertEqual(len(attempts), 4)
+
+    async def test_invoke_all_orders_dependent_requests(self):
+        from lionagi.core.collections.abc import ActionError
+
+        calls = []
+
+        async def step(name: str, fail: bool = False) -> str:
+            """
+            Record the call, then finish.
+
+            Args:
+                name: The name of the call.
+                fail: Whether to fail.
+            """
+            calls.append(f"{name} start")
+            await asyncio.sleep(0.02)
+            calls.append(f"{name} end")
+            if fail:
+                raise RuntimeError("boom")
+            return name
+
+        self.manager.register_tools(step)
+        first = ActionRequest(function="step", arguments={"name": "first"})
+        second = ActionRequest(
+            function="step", arguments={"name": "second"}, depends_on=[first.ln_id]
+        )
+        other = ActionRequest(function="step", arguments={"name": "other"})
+        results = {
+            request.arguments["name"]: result
+            async for request, result, _ in self.manager.invoke_all(
+                [first, second, other]
+            )
+        }
+        self.assertEqual(
+            results, {"first": "first", "second": "second", "other": "other"}
+        )
+        self.assertLess(calls.index("other start"), calls.index("first end"))
+        self.assertGreater(calls.index("second start"), calls.index("first end"))
+
+        calls.clear()
+        failing = ActionRequest(
+            function="step", arguments={"name": "a", "fail": True}
+        )
+        waiting = ActionRequest(
+            function="step", arguments={"name": "b"}, depends_on=[failing.ln_id]
+        )
+        results = [item async for item in self.manager.invoke_all([failing, waiting])]
+        self.assertIs(results[1][0], waiting)
+        self.assertIsInstance(results[1][2], ActionError)
+        self.assertNotIn("b start", calls)
+
+        with self.assertRaises(ValueError):
+            async for _ in self.manager.invoke_all([waiting, failing]):
+                pass
+
+    async def test_cancelled_requests_get_responses(self):
+        import lionagi as li
+        from lionagi.core.message import ActionResponse
+        from lionagi.core.unit import Unit
+
+        async def fail() -> str:
+            """Fail right away."""
+            raise RuntimeError("boom")
+
+        async def slow() -> str:
+            """Take a second."""
+            await asyncio.sleep(1)
+            return "ok"
+
+        branch = li.Branch(tools=[fail, slow])
+        branch.tool_manager.scheduler = ActionScheduler(cancel_on_failure=True)
+        requests = [
+            ActionRequest(function="slow", arguments={}),
+            ActionRequest(function="fail", arguments={}),
+        ]
+        unit = Unit(branch, imodel=object())
+        await unit._process_action_request(branch=branch, action_request=requests)
+
+        responses = [m for m in branch.messages if isinstance(m, ActionResponse)]
+        self.assertEqual(
+            {r.content["action_response"]["function"] for r in responses},
+            {"fail", "slow"},
+        )
+        self.assertIn("CancelledError", str(responses[-1].func_outputs))
+
+    def test_session_shares_executor(self):
+        from lionagi.core.session.session import Session
+
+        session = Session(imodel=object())
+        branch = session.new_branch()
+        self.assertIs(branch.tool_manager.executor, session.tool_executor)
+        self.assertIs(
+            session.default_branch.tool_manager.executor, session.tool_executor
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
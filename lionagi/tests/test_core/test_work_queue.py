@@ -0,0 +1,102 @@
+import asyncio
+import time
+import unittest
+
+from lionagi.core.work.work import Work, WorkStatus
+from lionagi.core.work.work_queue import WorkQueue
+from lionagi.core.work.worker import Worker, work
+from lionagi.core.work.worker_engine import WorkerEngine
+
+
+async def sleep_and_return(delay, value, order=None):
+    await asyncio.sleep(delay)
+    if order is not None:
+        order.append(value)
+    return value, delay
+
+
+class TestWorkQueue(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.queue = WorkQueue(capacity=2)
+
+    async def test_slots_refill_without_waiting_for_batch(self):
+        slow = Work(async_task=sleep_and_return(0.3, "slow"))
+        fast = [Work(async_task=sleep_and_return(0.05, i)) for i in range(4)]
+        for work in [slow, *fast]:
+            await self.queue.enqueue(work)
+
+        start = time.monotonic()
+        await self.queue.process()
+        self.assertLess(time.monotonic() - start, 0.38)
+        self.assertTrue(all(w.status == WorkStatus.COMPLETED for w in [slow, *fast]))
+        self.assertEqual(self.queue.metrics.completed, 5)
+        self.assertEqual(self.queue.depth, 0)
+        self.assertEqual(self.queue.available_capacity, 2)
+        self.assertGreater(self.queue.metrics.max_wait, 0.1)
+        await asyncio.wait_for(self.queue.join(), 1)
+
+    async def test_priority_order(self):
+        queue = WorkQueue(capacity=1)
+        order = []
+        for priority in [2, 0, 1]:
+            await queue.enqueue(
+                Work(async_task=sleep_and_return(0, priority, order)),
+                priority=priority,
+            )
+        await queue.process()
+        self.assertEqual(order, [0, 1, 2])
+
+    async def test_deadline(self):
+        late = Work(async_task=sleep_and_return(0.2, "late"))
+        expired = Work(async_task=sleep_and_return(0, "expired"), deadline=0)
+        await self.queue.enqueue(late, timeout=0.05)
+        await self.queue.enqueue(expired)
+        await self.queue.process()
+
+        for work in [late, expired]:
+            self.assertEqual(work.status, WorkStatus.FAILED)
+            self.assertIsInstance(work.error, asyncio.TimeoutError)
+        self.assertEqual(self.queue.metrics.failed, 2)
+
+    async def test_execute_runs_work_as_enqueued(self):
+        executing = asyncio.create_task(self.queue.execute())
+        work = Work(async_task=sleep_and_return(0.01, "done"))
+        await self.queue.enqueue(work)
+        await asyncio.wait_for(work.wait_for_completion(), 0.5)
+        self.assertEqual(work.result, "done")
+
+        await self.queue.stop()
+        await asyncio.wait_for(executing, 0.5)
+        self.assertFalse(self.queue.execution_mode)
+
+
+class Sleeper(Worker):
+
+    @work()
+    async def nap(self, delay):
+        await asyncio.sleep(delay)
+        return delay
+
+
+class TestWorkerEngine(unittest.IsolatedAsyncioTestCase):
+
+    async def test_task_added_while_executing_starts_promptly(self):
+        engine = WorkerEngine(Sleeper())
+        slow = await engine.add_task(0.5, task_function="nap")
+        executing = asyncio.create_task(engine.execute())
+        await asyncio.sleep(0.05)
+
+        fast = await engine.add_task(0.01, task_function="nap")
+        fast_work = fast.current_work
+        await asyncio.wait_for(fast_work.wait_for_completion(), 0.3)
+        self.assertEqual(fast_work.result, 0.01)
+        self.assertEqual(slow.status, WorkStatus.IN_PROGRESS)
+
+        await asyncio.wait_for(executing, 1)
+        self.assertEqual(slow.status, WorkStatus.COMPLETED)
+        self.assertEqual(fast.status, WorkStatus.COMPLETED)
+
+
+if __name__ == "__main__":
+    unittest.main()